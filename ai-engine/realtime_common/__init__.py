@@ -0,0 +1,12 @@
+from .audio_buffer import PcmRingBuffer
+from .link_quality import AudioFrameCoalescer, LinkQualityEstimator
+from .reconnect import ReconnectPolicy, RecoveryLog, build_replay_items
+
+__all__ = [
+    "AudioFrameCoalescer",
+    "LinkQualityEstimator",
+    "PcmRingBuffer",
+    "ReconnectPolicy",
+    "RecoveryLog",
+    "build_replay_items",
+]
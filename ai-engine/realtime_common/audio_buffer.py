@@ -0,0 +1,87 @@
+from collections import deque
+from typing import Any, Deque, List
+
+
+class PcmRingBuffer:
+    """
+    [Early Audio Ring Buffer]
+    OpenAI 연결이 준비되기 전(초기 연결, 유휴 재개, 재연결)에 들어온 클라이언트 PCM16 오디오를
+    순서대로 보관합니다. 용량(max_bytes)을 넘으면 가장 오래된 청크부터 버립니다.
+
+    오디오 사이에 들어온 커밋 등 비오디오 이벤트는 mark()로 같은 큐에 표식으로 넣어
+    drain() 시 도착 순서 그대로 돌려줍니다. 표식은 용량에 포함되지 않고, 앞선 오디오가
+    밀려날 때 함께 버려집니다.
+
+    보존/폐기된 바이트 수를 누적하여 세션 리포트에 기록할 수 있도록 합니다.
+    """
+    def __init__(self, max_bytes: int, bytes_per_ms: float = 48.0):
+        self.max_bytes = max_bytes
+        self.bytes_per_ms = bytes_per_ms  # 24kHz PCM16 mono = 48 bytes/ms
+        self._chunks: Deque[Any] = deque()
+        self._size = 0
+
+        # 누적 통계
+        self.preserved_bytes = 0
+        self.dropped_bytes = 0
+        self.dropped_marks = 0
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def append(self, chunk: bytes):
+        """청크 추가 (용량 초과 시 오래된 청크부터 폐기)"""
+        if not chunk:
+            return
+        if len(chunk) > self.max_bytes:
+            # 단일 청크가 용량보다 크면 최신 구간만 유지
+            self.dropped_bytes += len(chunk) - self.max_bytes
+            chunk = chunk[-self.max_bytes:]
+
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        evicted = False
+        while self._size > self.max_bytes:
+            dropped = self._chunks.popleft()
+            if isinstance(dropped, bytes):
+                self._size -= len(dropped)
+                self.dropped_bytes += len(dropped)
+                evicted = True
+            else:
+                self.dropped_marks += 1
+        # 밀려난 오디오 뒤의 표식(예: 그 오디오의 커밋)도 함께 폐기
+        while evicted and not isinstance(self._chunks[0], bytes):
+            self._chunks.popleft()
+            self.dropped_marks += 1
+
+    def mark(self, marker: Any):
+        """오디오 사이의 비오디오 이벤트(예: 커밋)를 도착 순서대로 보관"""
+        self._chunks.append(marker)
+
+    def drain(self) -> List[Any]:
+        """보관 중인 청크와 표식을 순서대로 반환하고 비움 (반환된 분량은 보존된 것으로 집계)"""
+        chunks = list(self._chunks)
+        self.preserved_bytes += self._size
+        self._chunks.clear()
+        self._size = 0
+        return chunks
+
+    def clear(self):
+        """보관 중인 청크를 폐기"""
+        self.dropped_bytes += self._size
+        self.dropped_marks += sum(1 for chunk in self._chunks if not isinstance(chunk, bytes))
+        self._chunks.clear()
+        self._size = 0
+
+    def stats(self) -> dict:
+        """보존/폐기 통계 (bytes, ms)"""
+        return {
+            "preserved_bytes": self.preserved_bytes,
+            "dropped_bytes": self.dropped_bytes,
+            "preserved_ms": round(self.preserved_bytes / self.bytes_per_ms),
+            "dropped_ms": round(self.dropped_bytes / self.bytes_per_ms),
+            "dropped_marks": self.dropped_marks,
+        }
@@ -0,0 +1,191 @@
+import asyncio
+import itertools
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# [Link Quality] EWMA 가중치 (새 샘플 반영 비율)
+EWMA_ALPHA = 0.2
+# 앱 레벨 ping 주기 (클라이언트가 {"type": "pong", "id": ...}로 응답)
+PING_INTERVAL_SEC = 5.0
+# 오디오 프레임 크기 범위 (저지연 링크 -> 작은 프레임, 고지연 링크 -> 큰 프레임)
+MIN_CHUNK_MS = 40
+MAX_CHUNK_MS = 400
+CHUNK_STEP_MS = 20
+# 측정값이 없을 때의 기본 프레임 크기 (기존 고정값)
+DEFAULT_CHUNK_MS = 100
+# 재생 시점보다 앞서 보내는 분량 범위 (send-ahead)
+MIN_SEND_AHEAD_MS = 100
+MAX_SEND_AHEAD_MS = 1000
+# 24kHz PCM16 mono 오디오의 base64 전송량 (bytes/sec) - 처리량이 이보다 충분히 크지 않으면 혼잡으로 판단
+AUDIO_WIRE_BYTES_PER_SEC = 24000 * 2 * 4 / 3
+CONGESTION_HEADROOM = 1.5
+# send 완료 시간이 이보다 짧으면 소켓 버퍼에 바로 들어간 것으로 보고 처리량 샘플에서 제외
+MIN_SEND_SAMPLE_SEC = 0.002
+
+ClientSender = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class LinkQualityEstimator:
+    """
+    [Link Quality Estimator]
+    연결별 RTT와 처리량(throughput)을 추정하여 오디오 프레임 크기와 send-ahead 깊이를 결정합니다.
+
+    - RTT: 앱 레벨 ping/pong 왕복 시간 (EWMA + 지터)
+    - 처리량: 클라이언트 소켓 send 완료까지 걸린 시간 (백프레셔가 걸릴 때만 의미 있는 샘플)
+    - 정책: RTT가 크거나 혼잡하면 큰 프레임을 적게, RTT가 작으면 작은 프레임을 자주 전송
+    """
+    def __init__(self, alpha: float = EWMA_ALPHA):
+        self.alpha = alpha
+        self.rtt_ms: Optional[float] = None
+        self.rtt_jitter_ms = 0.0
+        self.throughput_bps: Optional[float] = None
+
+        self._ping_ids = itertools.count(1)
+        self._pending_pings: Dict[int, float] = {}
+
+        # 통계
+        self.pings_sent = 0
+        self.pongs_received = 0
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.send_time_total_sec = 0.0
+
+    # ---- 측정 ----
+    def make_ping(self) -> Dict[str, Any]:
+        """클라이언트로 보낼 ping 메시지 생성 (보낸 시각 기록)"""
+        ping_id = next(self._ping_ids)
+        self._pending_pings[ping_id] = time.monotonic()
+        # 응답 없는 ping이 쌓이지 않도록 오래된 항목 정리
+        while len(self._pending_pings) > 8:
+            self._pending_pings.pop(next(iter(self._pending_pings)))
+        self.pings_sent += 1
+        return {"type": "ping", "id": ping_id}
+
+    def handle_pong(self, payload: Dict[str, Any]) -> bool:
+        """클라이언트 pong 처리 (일치하는 ping이 있으면 RTT 샘플 반영)"""
+        sent_at = self._pending_pings.pop(payload.get("id"), None)
+        if sent_at is None:
+            return False
+        self.pongs_received += 1
+        self.record_rtt((time.monotonic() - sent_at) * 1000)
+        return True
+
+    def record_rtt(self, sample_ms: float):
+        if self.rtt_ms is None:
+            self.rtt_ms = sample_ms
+            return
+        deviation = abs(sample_ms - self.rtt_ms)
+        self.rtt_jitter_ms += self.alpha * (deviation - self.rtt_jitter_ms)
+        self.rtt_ms += self.alpha * (sample_ms - self.rtt_ms)
+
+    def record_send(self, nbytes: int, elapsed_sec: float):
+        """클라이언트 send 완료 시간 기록"""
+        self.frames_sent += 1
+        self.bytes_sent += nbytes
+        self.send_time_total_sec += elapsed_sec
+        if elapsed_sec < MIN_SEND_SAMPLE_SEC:
+            return
+        sample = nbytes / elapsed_sec
+        if self.throughput_bps is None:
+            self.throughput_bps = sample
+        else:
+            self.throughput_bps += self.alpha * (sample - self.throughput_bps)
+
+    async def timed_send(self, send: Callable[[str], Awaitable[None]], text: str):
+        """send 호출 후 완료 시간과 전송량을 기록"""
+        started = time.perf_counter()
+        await send(text)
+        self.record_send(len(text), time.perf_counter() - started)
+
+    async def ping_loop(self, send_to_client: ClientSender, interval_sec: float = PING_INTERVAL_SEC):
+        """주기적으로 ping 전송 (연결이 끊기면 종료)"""
+        while True:
+            await asyncio.sleep(interval_sec)
+            try:
+                await send_to_client(self.make_ping())
+            except Exception as e:
+                logger.debug(f"[Link] ping 전송 실패 - 루프 종료: {e}")
+                return
+
+    # ---- 정책 ----
+    @property
+    def congested(self) -> bool:
+        return self.throughput_bps is not None and self.throughput_bps < AUDIO_WIRE_BYTES_PER_SEC * CONGESTION_HEADROOM
+
+    def chunk_ms(self) -> int:
+        """RTT/혼잡도 기반 오디오 프레임 길이 (ms)"""
+        if self.rtt_ms is None and not self.congested:
+            return DEFAULT_CHUNK_MS
+        target = self.rtt_ms if self.rtt_ms is not None else DEFAULT_CHUNK_MS
+        if self.congested:
+            # 프레임당 오버헤드를 줄이기 위해 크게 묶어서 전송
+            target = max(target * 2, 200)
+        stepped = round(target / CHUNK_STEP_MS) * CHUNK_STEP_MS
+        return int(min(max(stepped, MIN_CHUNK_MS), MAX_CHUNK_MS))
+
+    def chunk_bytes(self, sample_rate: int = 24000) -> int:
+        """현재 프레임 길이에 해당하는 PCM16 바이트 수 (샘플 경계 정렬)"""
+        return int(sample_rate * self.chunk_ms() / 1000) * 2
+
+    def send_ahead_frames(self, chunk_ms: Optional[int] = None) -> int:
+        """재생보다 앞서 보낼 프레임 수 (RTT 2배 + 지터만큼 여유)"""
+        chunk_ms = chunk_ms or self.chunk_ms()
+        if self.rtt_ms is None:
+            return 1
+        ahead_ms = 2 * self.rtt_ms + 2 * self.rtt_jitter_ms
+        ahead_ms = min(max(ahead_ms, MIN_SEND_AHEAD_MS), MAX_SEND_AHEAD_MS)
+        return max(1, math.ceil(ahead_ms / chunk_ms))
+
+    def stats(self) -> Dict[str, Any]:
+        """세션 리포트용 네트워크 품질 요약"""
+        return {
+            "rtt_ms": round(self.rtt_ms, 1) if self.rtt_ms is not None else None,
+            "rtt_jitter_ms": round(self.rtt_jitter_ms, 1),
+            "throughput_kbps": round(self.throughput_bps * 8 / 1000, 1) if self.throughput_bps is not None else None,
+            "congested": self.congested,
+            "pings_sent": self.pings_sent,
+            "pongs_received": self.pongs_received,
+            "frames_sent": self.frames_sent,
+            "bytes_sent": self.bytes_sent,
+            "avg_send_ms": round(self.send_time_total_sec * 1000 / self.frames_sent, 2) if self.frames_sent else 0.0,
+            "chunk_ms": self.chunk_ms(),
+            "send_ahead_frames": self.send_ahead_frames(),
+        }
+
+
+class AudioFrameCoalescer:
+    """
+    [Audio Frame Coalescer]
+    업스트림이 만든 임의 크기의 PCM16 델타를 LinkQualityEstimator가 정한 프레임 크기로 다시 자릅니다.
+    (작은 델타는 묶고, 큰 델타는 나눔)
+    """
+    def __init__(self, link: LinkQualityEstimator, sample_rate: int = 24000):
+        self.link = link
+        self.sample_rate = sample_rate
+        self._pending = bytearray()
+
+    def push(self, chunk: bytes) -> List[bytes]:
+        """델타 추가 후 완성된 프레임 목록 반환"""
+        self._pending.extend(chunk)
+        frame_bytes = self.link.chunk_bytes(self.sample_rate)
+        frames = []
+        while len(self._pending) >= frame_bytes:
+            frames.append(bytes(self._pending[:frame_bytes]))
+            del self._pending[:frame_bytes]
+        return frames
+
+    def flush(self) -> Optional[bytes]:
+        """남은 오디오 반환 (응답 종료 시)"""
+        if not self._pending:
+            return None
+        frame = bytes(self._pending)
+        self._pending.clear()
+        return frame
+
+    def clear(self):
+        """남은 오디오 폐기 (사용자 끼어들기 시)"""
+        self._pending.clear()
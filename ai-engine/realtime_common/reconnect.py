@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# [Reconnect] 업스트림(OpenAI) 재연결 백오프 설정
+RECONNECT_BASE_DELAY_SEC = 0.5
+RECONNECT_MAX_DELAY_SEC = 8.0
+RECONNECT_MAX_ATTEMPTS = 5
+# 복구 후 이 시간 안에 다시 끊기면 "불안정(flapping)"으로 간주
+RECONNECT_MIN_HEALTHY_SEC = 30.0
+# 불안정한 끊김이 연속 이 횟수에 도달하면 복구를 포기 (접속은 되지만 곧바로 끊기는 업스트림 무한 루프 방지)
+RECONNECT_MAX_FLAPS = 3
+# 재연결 후 재주입할 최근 대화 아이템 수
+REPLAY_ITEM_LIMIT = 20
+
+
+class RecoveryLog:
+    """
+    [Recovery Log]
+    업스트림 연결 끊김(incident)마다 시도 횟수와 복구 시간(time-to-recover)을 기록합니다.
+    """
+    def __init__(self):
+        self.incidents: List[Dict[str, Any]] = []
+
+    def begin(self, reason: str) -> Dict[str, Any]:
+        incident = {
+            "reason": reason,
+            "attempts": 0,
+            "recovered": False,
+            "time_to_recover_ms": None,
+            "_started": time.monotonic(),
+        }
+        self.incidents.append(incident)
+        return incident
+
+    @staticmethod
+    def finish(incident: Dict[str, Any], recovered: bool):
+        incident["recovered"] = recovered
+        elapsed_ms = (time.monotonic() - incident.pop("_started")) * 1000
+        if recovered:
+            incident["time_to_recover_ms"] = round(elapsed_ms, 1)
+        else:
+            incident["gave_up_after_ms"] = round(elapsed_ms, 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """세션 리포트용 요약"""
+        recovered = [item["time_to_recover_ms"] for item in self.incidents if item["recovered"]]
+        return {
+            "incidents": len(self.incidents),
+            "recovered": len(recovered),
+            "failed": sum(1 for item in self.incidents if "gave_up_after_ms" in item),
+            "avg_time_to_recover_ms": round(sum(recovered) / len(recovered), 1) if recovered else None,
+            "max_time_to_recover_ms": max(recovered) if recovered else None,
+            "history": [
+                {key: value for key, value in item.items() if not key.startswith("_")}
+                for item in self.incidents
+            ],
+        }
+
+
+class ReconnectPolicy:
+    """
+    [Reconnect Policy]
+    지터가 적용된 지수 백오프로 재연결을 시도합니다. (두 relay 스택 공용)
+
+    - 첫 시도는 즉시, 이후 base * 2^n (최대 max_delay)의 절반 + 무작위 절반만큼 대기
+    - 복구 후 min_healthy_sec 안에 다시 끊기는 일이 max_flaps번 연속되면 재시도 없이 포기
+    - 모든 시도 결과는 RecoveryLog에 incident로 기록
+    """
+    def __init__(
+        self,
+        base_delay_sec: float = RECONNECT_BASE_DELAY_SEC,
+        max_delay_sec: float = RECONNECT_MAX_DELAY_SEC,
+        max_attempts: int = RECONNECT_MAX_ATTEMPTS,
+        rng: Callable[[], float] = random.random,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        min_healthy_sec: float = RECONNECT_MIN_HEALTHY_SEC,
+        max_flaps: int = RECONNECT_MAX_FLAPS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.base_delay_sec = base_delay_sec
+        self.max_delay_sec = max_delay_sec
+        self.max_attempts = max_attempts
+        self._rng = rng
+        self._sleep = sleep
+        self.min_healthy_sec = min_healthy_sec
+        self.max_flaps = max_flaps
+        self._clock = clock
+        self._recovered_at: Optional[float] = None
+        self.flaps = 0  # 연속 불안정 끊김 수
+        self.log = RecoveryLog()
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간 (attempt=0 -> 즉시)"""
+        if attempt <= 0:
+            return 0.0
+        ceiling = min(self.max_delay_sec, self.base_delay_sec * (2 ** (attempt - 1)))
+        return ceiling / 2 + self._rng() * ceiling / 2
+
+    async def recover(self, reconnect: Callable[[], Awaitable[Any]], reason: str) -> bool:
+        """
+        reconnect()가 성공할 때까지 백오프하며 재시도합니다.
+
+        Args:
+            reconnect: 연결 + 세션 복원을 수행하는 코루틴 함수 (실패 시 예외 발생)
+            reason: 끊김 원인 (기록용)
+
+        Returns:
+            bool: 복구 성공 여부
+        """
+        incident = self.log.begin(reason)
+        if self._recovered_at is not None and self._clock() - self._recovered_at < self.min_healthy_sec:
+            self.flaps += 1
+        else:
+            self.flaps = 0
+        if self.flaps >= self.max_flaps:
+            incident["flapping"] = True
+            self.log.finish(incident, recovered=False)
+            logger.error(f"[Reconnect] 복구 직후 끊김이 {self.flaps}회 연속 - 업스트림 불안정으로 복구 포기")
+            return False
+
+        for attempt in range(self.max_attempts):
+            wait = self.delay(attempt)
+            if wait:
+                await self._sleep(wait)
+            incident["attempts"] = attempt + 1
+            try:
+                await reconnect()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[Reconnect] 재연결 실패 ({attempt + 1}/{self.max_attempts}): {e}")
+                continue
+            self.log.finish(incident, recovered=True)
+            self._recovered_at = self._clock()
+            logger.info(f"[Reconnect] 업스트림 복구 완료 ({incident['attempts']}회, {incident['time_to_recover_ms']}ms)")
+            return True
+        self.log.finish(incident, recovered=False)
+        logger.error(f"[Reconnect] 업스트림 복구 실패 ({self.max_attempts}회 시도)")
+        return False
+
+
+def build_replay_items(messages: Iterable[Dict[str, Any]], limit: Optional[int] = REPLAY_ITEM_LIMIT) -> List[Dict[str, Any]]:
+    """
+    대화 기록을 conversation.item.create 이벤트 목록으로 변환 (최근 limit개, None이면 전체 / user/assistant만)
+    이벤트를 미리 만들어 두고 재연결 직후 한 번에 연속 전송합니다.
+    """
+    items = [msg for msg in messages if msg.get("role") in ("user", "assistant") and msg.get("content")]
+    events = []
+    if limit is not None:
+        items = items[-limit:]
+    for msg in items:
+        events.append({
+            "type": "conversation.item.create",
+            "item": {
+                "type": "message",
+                "role": msg["role"],
+                "content": [
+                    {
+                        "type": "input_text" if msg["role"] == "user" else "text",
+                        "text": msg["content"],
+                    }
+                ],
+            },
+        })
+    return events
@@ -1,11 +1,19 @@
 import asyncio
+import base64
+import binascii
 import json
 import logging
+import time
 import websockets
 from fastapi import WebSocket, WebSocketDisconnect
+from realtime_common.link_quality import AudioFrameCoalescer, LinkQualityEstimator
+from realtime_common.reconnect import ReconnectPolicy
+from realtime_common.audio_buffer import PcmRingBuffer
 from .conversation_manager import ConversationManager
 from .conversation_tracker import ConversationTracker
-from .conversation_tracker import ConversationTracker
+from .endpointing import AdaptiveEndpointing
+from .greeting_cache import CachedGreeting, GreetingCache
+from .subscriptions import EventSubscription, estimate_payload_bytes
 # from conversation_feedback.feedback_service import generate_feedback (Moved to ChatService)
 
 # Configure logging
@@ -14,6 +22,18 @@ logger = logging.getLogger(__name__)
 
 OPENAI_REALTIME_API_URL = "wss://api.openai.com/v1/realtime?model=gpt-4o-realtime-preview"
 
+# [Idle Policy] 클라이언트 입력(오디오/텍스트)이 없을 때 OpenAI 연결을 일시 중단하는 기준
+IDLE_SUSPEND_TIMEOUT_SEC = 180
+IDLE_CHECK_INTERVAL_SEC = 5
+# 재개(Resume) 시 재주입할 최근 대화 개수 (Compacted History)
+IDLE_RESUME_HISTORY_LIMIT = 20
+
+# [Greeting Cache] 캐시된 첫 인사 최대 캡처 크기 (24kHz PCM16 기준 30초)
+GREETING_MAX_AUDIO_BYTES = 24000 * 2 * 30
+
+# [Early Audio] OpenAI 연결 준비 전 들어온 오디오를 보관할 링 버퍼 크기 (24kHz PCM16 기준 5초)
+EARLY_AUDIO_BUFFER_BYTES = 24000 * 2 * 5
+
 class ConnectionHandler:
     """
     [WebSocket 연결 핸들러]
@@ -34,8 +54,35 @@ class ConnectionHandler:
        - 발화 시작/종료 감지 (VAD 이벤트)
        - 사용자/AI 대화 내용(Transcript) 처리 및 로그 출력
        - 에러 핸들링 및 세션 초기화
+
+    4. 유휴(Idle) 정책:
+       - idle_timeout_sec 동안 클라이언트 입력이 없으면 OpenAI 연결만 닫고 (Client 연결/Tracker는 유지)
+       - 다음 input_audio_buffer.append 수신 시 압축된 히스토리로 투명하게 재연결
+
+    5. 첫 인사 캐시 (Greeting Cache):
+       - 카탈로그 시나리오(scenario_id)의 첫 AI 발화를 캡처하여 GreetingCache에 저장
+       - 캐시 적중 시 OpenAI 세션 준비와 동시에 즉시 재생하고, 해당 인사를 assistant 아이템으로 주입
+
+    6. 초기 오디오 버퍼링 (Early Audio):
+       - OpenAI 연결을 기다리지 않고 클라이언트 수신 루프를 즉시 시작
+       - 연결 준비 전 들어온 오디오는 링 버퍼(PcmRingBuffer)에 보관 후 준비되면 순서대로 전송
+
+    7. 적응형 턴 종료 (Adaptive Endpointing):
+       - 학습자의 발화 멈춤 패턴에 맞춰 server_vad silence_duration_ms를 안전 범위 내에서 조정
+
+    8. 링크 품질 기반 전송 (Link Quality):
+       - ping/pong RTT와 send 완료 시간으로 클라이언트 링크 품질을 추정
+       - OpenAI 오디오 델타를 링크에 맞는 프레임 크기로 다시 묶어서 전송
+
+    9. 이벤트 구독 (Subscription):
+       - 클라이언트가 원하는 이벤트 클래스(audio / captions / debug)만 생성/전송
+       - 오디오를 구독하지 않으면 OpenAI에 텍스트 응답만 요청
+
+    10. 업스트림 자동 복구 (Reconnect):
+       - OpenAI 연결이 예기치 않게 끊기면 지터 지수 백오프로 재연결 (ReconnectPolicy)
+       - session.update 재적용 + 최근 대화 일괄 재주입 후 중계 재개, 복구 시간은 리포트에 기록
     """
-    def __init__(self, client_ws: WebSocket, api_key: str, history: list = None, session_id: str = None, context: dict = None, voice: str = None):
+    def __init__(self, client_ws: WebSocket, api_key: str, history: list = None, session_id: str = None, context: dict = None, voice: str = None, idle_timeout_sec: float = IDLE_SUSPEND_TIMEOUT_SEC, scenario_id: str = None, events: str = None):
         self.client_ws = client_ws
         self.api_key = api_key
         self.conversation_manager = ConversationManager()
@@ -47,15 +94,54 @@ class ConnectionHandler:
         self.tracker = ConversationTracker(session_id=session_id) 
         self.openai_ws = None
         self.openai_task = None
+        self._prewarmed_ws = None # [Bootstrap] DB 조회와 병렬로 미리 연결한 소켓
+
+        # [Early Audio] 연결 준비 전 오디오 보관
+        self.connect_task = None
+        self.upstream_ready = False
+        self.early_audio = PcmRingBuffer(EARLY_AUDIO_BUFFER_BYTES)
+
+        # [Endpointing] 학습자별 침묵 구간 조정
+        self.endpointing = AdaptiveEndpointing(self.conversation_manager.default_config.get("turn_detection"))
+
+        # [Link Quality] 클라이언트 링크 RTT/처리량 추정 및 오디오 프레임 재구성
+        self.link = LinkQualityEstimator()
+        self.audio_coalescer = AudioFrameCoalescer(self.link)
+        self.ping_task = None
+
+        # [Subscription] 클라이언트가 선언한 이벤트 클래스 (없으면 show_text 기준, 기본은 audio + captions)
+        self.subscription = EventSubscription.parse(events) or EventSubscription()
+
+        # [Reconnect] 업스트림 끊김 복구
+        self.reconnect_policy = ReconnectPolicy()
+        self.recovery_task = None
+        self._closing = False
         self.history = history or [] # 대화 히스토리 저장
 
+        # [Idle Policy] 유휴 상태 추적
+        self.idle_timeout_sec = idle_timeout_sec
+        self.idle_task = None
+        self.is_suspended = False
+        self.idle_suspend_count = 0
+        self._last_client_activity = time.monotonic()
+
+        # [Greeting Cache] 카탈로그 시나리오 첫 인사 캐시
+        self.scenario_id = scenario_id
+        self.greeting_cache = GreetingCache()
+        self.greeting_task = None
+        self._greeting_capture = None
+
     async def start(self):
         """[메인 실행 루프]"""
         try:
-            # 1. 초기 연결
-            await self.connect_to_openai()
+            # 1. 초기 연결 (백그라운드) - 연결 중 들어온 오디오는 링 버퍼에 보관
+            self.connect_task = asyncio.create_task(self.bootstrap_upstream())
 
-            # 2. 클라이언트 수신 루프
+            # 2. 유휴 감시 / 링크 측정 태스크 시작
+            self.idle_task = asyncio.create_task(self.watch_idle())
+            self.ping_task = asyncio.create_task(self.link.ping_loop(self.send_to_client))
+
+            # 3. 클라이언트 수신 루프 (연결 완료를 기다리지 않고 즉시 시작)
             await self.receive_from_client()
             
         except WebSocketDisconnect:
@@ -67,10 +153,47 @@ class ConnectionHandler:
             # 반환값 전달 (Session Report)
             return await self.cleanup()  
 
+    async def bootstrap_upstream(self):
+        """초기 OpenAI 연결 (캐시된 첫 인사가 있으면 즉시 재생하면서 연결)"""
+        greeting = self.lookup_cached_greeting()
+        if greeting:
+            # 인사를 먼저 Tracker에 기록 -> 연결 시 히스토리 주입 단계에서 assistant 아이템으로 시딩됨
+            self.tracker.add_transcript("assistant", greeting.text)
+            self.greeting_task = asyncio.create_task(self.play_cached_greeting(greeting))
+            await self.connect_to_openai(trigger_first_turn=False)
+        else:
+            self.start_greeting_capture()
+            await self.connect_to_openai()
+
+    async def send_to_client(self, payload: dict):
+        """클라이언트로 메시지 전송 (구독하지 않은 이벤트는 억제, send 완료 시간은 링크 품질 추정에 반영)"""
+        message_type = payload.get("type")
+        if not self.subscription.allows(message_type):
+            self.subscription.record_suppressed(message_type, estimate_payload_bytes(payload))
+            return
+        await self.link.timed_send(self.client_ws.send_text, json.dumps(payload))
+
+    async def send_audio_to_client(self, chunk: bytes):
+        """오디오 델타를 링크에 맞는 프레임 크기로 묶어서 전송"""
+        for frame in self.audio_coalescer.push(chunk):
+            await self.send_to_client({
+                "type": "audio.delta",
+                "delta": base64.b64encode(frame).decode("ascii")
+            })
+
+    async def flush_audio_to_client(self):
+        """남은 오디오 프레임 전송 (응답 오디오 종료 시)"""
+        frame = self.audio_coalescer.flush()
+        if frame:
+            await self.send_to_client({
+                "type": "audio.delta",
+                "delta": base64.b64encode(frame).decode("ascii")
+            })
+
     async def send_error_to_client(self, code: str, message: str):
         """클라이언트에게 에러 메시지 전송"""
         try:
-            await self.client_ws.send_json({
+            await self.send_to_client({
                 "type": "error",
                 "code": code,
                 "message": message
@@ -88,25 +211,39 @@ class ConnectionHandler:
         )
 
 
-    async def connect_to_openai(self):
-        """OpenAI 연결 및 수신 태스크 시작"""
+    async def connect_to_openai(self, trigger_first_turn: bool = True, history: list = None, raise_errors: bool = False):
+        """
+        OpenAI 연결 및 수신 태스크 시작
+
+        Args:
+            trigger_first_turn (bool): "Let's start" 가짜 메시지로 AI 첫 발화를 유도할지 여부
+            history (list): 주입할 히스토리 (None이면 초기 히스토리 + 현재 세션 메시지 전체)
+            raise_errors (bool): 연결 실패 시 예외를 다시 발생시킬지 여부 (재연결 정책에서 사용)
+        """
+        # 연결이 준비될 때까지 클라이언트 오디오는 링 버퍼에 보관
+        self.upstream_ready = False
         try:
             if self.openai_ws:
-                await self.openai_ws.close()
+                # 교체 전에 분리 -> 기존 수신 루프가 의도된 종료임을 알 수 있도록
+                stale_ws, self.openai_ws = self.openai_ws, None
+                await stale_ws.close()
             
-            self.openai_ws = await websockets.connect(
-                OPENAI_REALTIME_API_URL,
-                additional_headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "OpenAI-Beta": "realtime=v1"
-                }
-            )
-            logger.info("OpenAI Realtime API에 연결되었습니다.")
+            if self._prewarmed_ws is not None:
+                # [Bootstrap] 미리 열어둔 소켓 사용 (핸드셰이크 생략)
+                self.openai_ws, self._prewarmed_ws = self._prewarmed_ws, None
+            else:
+                self.openai_ws = await self.open_openai_socket()
             
             # 세션 초기화 (컨텍스트 전달 & 보이스 오버라이드)
             override_config = {}
             if self.voice:
                 override_config["voice"] = self.voice
+            if not self.subscription.wants("audio"):
+                # 오디오를 받지 않는 클라이언트 -> 음성 생성 자체를 생략
+                override_config["modalities"] = ["text"]
+            if self.endpointing.enabled:
+                # 재연결 시에도 학습된 침묵 구간 유지
+                override_config["turn_detection"] = self.endpointing.turn_detection()
                 
             await self.conversation_manager.initialize_session(
                 self.openai_ws, 
@@ -115,57 +252,329 @@ class ConnectionHandler:
             )
             
             # 히스토리 주입
-            full_history = self.history + self.tracker.messages
+            full_history = history if history is not None else self.history + self.tracker.messages
             if full_history:
                 await self.conversation_manager.inject_history(full_history)
 
             # [Stable Start] 설정 적용될 시간 확보 (Minimized to 0.1s)
             await asyncio.sleep(0.1)
 
-            # [Trigger] 강제 발화 유도: "Let's start" 가짜 사용자 메시지 주입
-            logger.info("Triggering AI First Turn with 'Let's start'")
-            await self.openai_ws.send(json.dumps({
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "message",
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "input_text",
-                            "text": "Let's start" 
-                        }
-                    ]
-                }
-            }))
-            await self.openai_ws.send(json.dumps({
-                "type": "response.create",
-                "response": {
-                    "modalities": ["audio", "text"]
-                }
-            }))
+            if trigger_first_turn:
+                await self.trigger_first_turn()
 
             # 수신 태스크 재시작
             if self.openai_task and not self.openai_task.done():
                 self.openai_task.cancel()
             
             self.openai_task = asyncio.create_task(self.receive_from_openai())
+            self.is_suspended = False
+
+            # 연결 준비 중 쌓인 오디오를 순서대로 전송
+            await self.flush_early_audio()
 
         except Exception as e:
             logger.error(f"OpenAI 연결 실패: {e}")
+            if raise_errors:
+                raise
 
-    async def reconnect_to_openai(self):
-        """세션 재연결 (설정 변경 시 사용)"""
-        logger.info("OpenAI 세션을 재연결합니다 (Voice 변경 적용)...")
-        # 기존 태스크 정리
+    async def recover_upstream(self, reason: str):
+        """
+        [Reconnect] 예기치 않은 업스트림 끊김 복구
+        백오프 재연결 -> session.update 재적용 -> 최근 대화 일괄 재주입 -> 중계 재개
+        (복구 중 들어온 클라이언트 오디오는 링 버퍼에 보관 후 순서대로 전송)
+        """
+        logger.warning(f"[Reconnect] OpenAI 연결 끊김 - 복구 시도: {reason}")
+        try:
+            await self.send_to_client({"type": "session.reconnecting"})
+        except Exception as e:
+            logger.warning(f"복구 알림 전송 실패 (연결 끊김): {e}")
+
+        async def reconnect():
+            await self.connect_to_openai(trigger_first_turn=False, history=self.compact_history(), raise_errors=True)
+
+        recovered = await self.reconnect_policy.recover(reconnect, reason)
+        if not recovered:
+            await self.handle_openai_disconnect(reason)
+            return
+
+        # 사용자가 말한 직후 끊겼다면 응답을 이어서 생성
+        if self.tracker.messages and self.tracker.messages[-1]["role"] == "user":
+            await self.openai_ws.send(json.dumps({"type": "response.create"}))
+        try:
+            await self.send_to_client({"type": "session.recovered"})
+        except Exception as e:
+            logger.warning(f"복구 완료 알림 전송 실패 (연결 끊김): {e}")
+
+    async def flush_early_audio(self):
+        """
+        [Early Audio] 링 버퍼에 쌓인 오디오와 커밋을 도착 순서대로 OpenAI로 전송 후 직접 전송 모드로 전환
+        전송 중에도 새 오디오가 버퍼에 쌓일 수 있으므로 버퍼가 빌 때까지 반복합니다.
+        (마지막 확인과 upstream_ready 전환 사이에 await가 없으므로 순서가 보장됨)
+        """
+        while len(self.early_audio):
+            entries = self.early_audio.drain()
+            chunks = 0
+            for entry in entries:
+                if isinstance(entry, bytes):
+                    chunks += 1
+                    await self.openai_ws.send(json.dumps({
+                        "type": "input_audio_buffer.append",
+                        "audio": base64.b64encode(entry).decode("ascii")
+                    }))
+                else:
+                    # 준비 중 받은 커밋은 받은 위치 그대로 전송 (그 뒤의 오디오는 다음 턴에 남음)
+                    await self.openai_ws.send(json.dumps(entry))
+            if chunks:
+                logger.info(f"[Early Audio] 연결 준비 중 수신한 오디오 {chunks}개 청크 전송")
+        self.upstream_ready = True
+
+    def buffer_early_audio(self, audio_b64: str):
+        """연결 준비 전 오디오를 링 버퍼에 보관"""
+        try:
+            self.early_audio.append(base64.b64decode(audio_b64 or ""))
+        except (ValueError, binascii.Error):
+            logger.warning("[Early Audio] 잘못된 오디오 청크 무시")
+
+    def ensure_upstream(self):
+        """[Idle Policy] 일시 중단 상태라면 백그라운드로 재연결 시작 (중복 재연결 방지)"""
+        if not self.is_suspended:
+            return
+        if self.connect_task and not self.connect_task.done():
+            return
+        self.connect_task = asyncio.create_task(self.resume_upstream())
+
+    async def open_openai_socket(self):
+        """OpenAI Realtime WebSocket 핸드셰이크만 수행 (세션 설정/히스토리 주입 전)"""
+        openai_ws = await websockets.connect(
+            OPENAI_REALTIME_API_URL,
+            additional_headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "OpenAI-Beta": "realtime=v1"
+            }
+        )
+        logger.info("OpenAI Realtime API에 연결되었습니다.")
+        return openai_ws
+
+    async def prewarm_openai(self):
+        """
+        [Bootstrap] DB 조회와 병렬로 OpenAI 소켓을 미리 연결합니다.
+        세션 설정과 히스토리 주입은 데이터가 준비된 뒤 start()에서 수행됩니다.
+        실패 시 start()에서 일반 연결로 다시 시도합니다.
+        """
+        try:
+            self._prewarmed_ws = await self.open_openai_socket()
+        except Exception as e:
+            logger.warning(f"OpenAI 사전 연결 실패 (start 시 재시도): {e}")
+
+    async def discard_prewarmed(self):
+        """부트스트랩 중단 시 미리 연결한 소켓 정리"""
+        if self._prewarmed_ws is not None:
+            try:
+                await self._prewarmed_ws.close()
+            except Exception:
+                pass
+            self._prewarmed_ws = None
+
+    def apply_session_data(self, history: list = None, context: dict = None, voice: str = None, scenario_id: str = None, show_text: bool = None):
+        """[Bootstrap] DB에서 조회한 세션 데이터를 연결 시작 전에 반영"""
+        self.history = history or []
+        self.context = context
+        self.voice = voice
+        self.scenario_id = scenario_id
+        if not self.subscription.explicit:
+            # 클라이언트가 이벤트를 직접 선언하지 않았다면 세션 자막 설정을 따름
+            self.subscription = EventSubscription.from_show_text(show_text)
+
+    def response_modalities(self) -> list:
+        """[Subscription] 오디오를 구독하지 않으면 음성 생성 없이 텍스트만 요청"""
+        return ["audio", "text"] if self.subscription.wants("audio") else ["text"]
+
+    async def update_subscription(self, classes: list):
+        """[Subscription] 연결 중 구독 변경 (오디오 구독 여부가 바뀌면 응답 모달리티도 변경)"""
+        had_audio = self.subscription.wants("audio")
+        self.subscription.update(classes)
+        if had_audio != self.subscription.wants("audio"):
+            await self.conversation_manager.update_session_settings({"modalities": self.response_modalities()})
+
+    async def trigger_first_turn(self):
+        """[Trigger] 강제 발화 유도: "Let's start" 가짜 사용자 메시지 주입"""
+        logger.info("Triggering AI First Turn with 'Let's start'")
+        await self.openai_ws.send(json.dumps({
+            "type": "conversation.item.create",
+            "item": {
+                "type": "message",
+                "role": "user",
+                "content": [
+                    {
+                        "type": "input_text",
+                        "text": "Let's start" 
+                    }
+                ]
+            }
+        }))
+        await self.openai_ws.send(json.dumps({
+            "type": "response.create",
+            "response": {
+                "modalities": self.response_modalities()
+            }
+        }))
+
+    async def stop_openai_task(self):
+        """OpenAI 수신 태스크 정리 (취소 후 종료 대기)"""
         if self.openai_task:
             self.openai_task.cancel()
             try:
                 await self.openai_task
             except asyncio.CancelledError:
                 pass
+
+    async def reconnect_to_openai(self):
+        """세션 재연결 (설정 변경 시 사용)"""
+        logger.info("OpenAI 세션을 재연결합니다 (Voice 변경 적용)...")
+        # 기존 태스크 정리
+        await self.stop_openai_task()
         
         await self.connect_to_openai()
 
+    async def watch_idle(self):
+        """
+        [Idle Policy] 유휴 감시 루프
+        idle_timeout_sec 동안 클라이언트 입력이 없으면 OpenAI 연결을 일시 중단합니다.
+        (OpenAI 동시 세션 한도를 점유하지 않도록)
+        """
+        if not self.idle_timeout_sec or self.idle_timeout_sec <= 0:
+            return
+
+        interval = min(IDLE_CHECK_INTERVAL_SEC, self.idle_timeout_sec)
+        while True:
+            await asyncio.sleep(interval)
+            if self.is_suspended or not self.openai_ws:
+                continue
+
+            idle_for = time.monotonic() - self._last_client_activity
+            if idle_for >= self.idle_timeout_sec:
+                await self.suspend_upstream(idle_for)
+
+    async def suspend_upstream(self, idle_for: float = 0.0):
+        """OpenAI 연결만 닫고 클라이언트 연결과 Tracker는 유지"""
+        logger.info(f"[Idle] {idle_for:.0f}초 동안 입력이 없어 OpenAI 연결을 일시 중단합니다.")
+        self.is_suspended = True
+        self.upstream_ready = False
+        self.idle_suspend_count += 1
+
+        await self.stop_openai_task()
+        if self.openai_ws:
+            try:
+                await self.openai_ws.close()
+            except Exception:
+                pass
+            self.openai_ws = None
+
+        try:
+            await self.send_to_client({"type": "session.suspended", "reason": "idle"})
+        except Exception as e:
+            logger.warning(f"일시 중단 알림 전송 실패 (연결 끊김): {e}")
+
+    async def resume_upstream(self):
+        """[Lazy Resume] 압축된 히스토리로 OpenAI 재연결 (첫 발화 유도 없음)"""
+        logger.info("[Idle] 클라이언트 입력 감지 - OpenAI 연결을 재개합니다.")
+        await self.connect_to_openai(trigger_first_turn=False, history=self.compact_history())
+
+        if self.is_suspended:
+            logger.warning("[Idle] OpenAI 재연결 실패 - 다음 입력 시 다시 시도합니다.")
+            return
+
+        try:
+            await self.send_to_client({"type": "session.resumed"})
+        except Exception as e:
+            logger.warning(f"재개 알림 전송 실패 (연결 끊김): {e}")
+
+    def compact_history(self, limit: int = IDLE_RESUME_HISTORY_LIMIT) -> list:
+        """재연결 시 주입할 압축 히스토리 (최근 N개, role/content만 유지)"""
+        full_history = self.history + self.tracker.messages
+        compacted = [
+            {"role": msg["role"], "content": msg["content"]}
+            for msg in full_history
+            if msg.get("role") in ("user", "assistant") and msg.get("content")
+        ]
+        return compacted[-limit:]
+
+    def greeting_cache_key(self):
+        """첫 인사 캐시 키 (scenario_id, voice, prompt_version, 컨텍스트 해시). 캐시 대상이 아니면 None"""
+        if not self.scenario_id:
+            return None
+        # 이어서 하는 대화는 첫 인사가 달라지므로 캐시하지 않음
+        if self.history or self.tracker.messages:
+            return None
+        voice = self.voice or self.conversation_manager.default_config.get("voice", "alloy")
+        return GreetingCache.make_key(self.scenario_id, voice, self.conversation_manager.prompt_version, self.context)
+
+    def lookup_cached_greeting(self):
+        key = self.greeting_cache_key()
+        if key is None:
+            return None
+        greeting = self.greeting_cache.get(key)
+        if greeting:
+            logger.info(f"[GreetingCache] 캐시 적중: {key}")
+        return greeting
+
+    def start_greeting_capture(self):
+        """첫 AI 응답(텍스트 + 오디오)을 캡처하여 캐시에 저장할 준비"""
+        key = self.greeting_cache_key()
+        if key is None:
+            return
+        self._greeting_capture = {"key": key, "audio": bytearray(), "text": None}
+
+    def capture_greeting_event(self, event: dict):
+        """첫 응답이 끝까지 정상 완료된 경우에만 캐시에 저장 (사용자 끼어들기/취소 시 폐기)"""
+        capture = self._greeting_capture
+        if capture is None:
+            return
+        event_type = event.get("type")
+
+        if event_type == "response.audio.delta":
+            try:
+                capture["audio"].extend(base64.b64decode(event.get("delta", "")))
+            except (ValueError, binascii.Error):
+                self._greeting_capture = None
+                return
+            if len(capture["audio"]) > GREETING_MAX_AUDIO_BYTES:
+                self._greeting_capture = None
+        elif event_type == "response.audio_transcript.done":
+            capture["text"] = event.get("transcript")
+        elif event_type == "input_audio_buffer.speech_started":
+            self._greeting_capture = None
+        elif event_type == "response.done":
+            self._greeting_capture = None
+            status = event.get("response", {}).get("status", "completed")
+            if status == "completed" and capture["text"] and capture["audio"]:
+                self.greeting_cache.put(
+                    capture["key"],
+                    CachedGreeting(text=capture["text"], audio=bytes(capture["audio"])),
+                )
+
+    async def play_cached_greeting(self, greeting: CachedGreeting):
+        """캐시된 첫 인사를 실시간 응답과 동일한 이벤트 형식으로 클라이언트에 전송"""
+        try:
+            chunk_bytes = self.link.chunk_bytes(greeting.sample_rate)
+            for offset in range(0, len(greeting.audio), chunk_bytes):
+                chunk = greeting.audio[offset:offset + chunk_bytes]
+                await self.send_to_client({
+                    "type": "audio.delta",
+                    "delta": base64.b64encode(chunk).decode("ascii")
+                })
+            await self.send_to_client({"type": "audio.done"})
+            await self.send_to_client({
+                "type": "transcript.done",
+                "transcript": greeting.text
+            })
+        except Exception as e:
+            logger.warning(f"캐시된 첫 인사 전송 실패 (연결 끊김): {e}")
+
+    def mark_client_activity(self):
+        """클라이언트 입력 시각 갱신"""
+        self._last_client_activity = time.monotonic()
+
     async def receive_from_client(self):
         """[Client -> Server 메시지 루프]"""
         try:
@@ -174,17 +583,27 @@ class ConnectionHandler:
                 data = json.loads(message)
                 
                 if data.get("type") == "input_audio_buffer.append":
-                    if self.openai_ws:
+                    self.mark_client_activity()
+                    # [Idle Policy] 일시 중단 상태라면 첫 오디오에서 재연결 (백그라운드)
+                    self.ensure_upstream()
+
+                    if self.upstream_ready and self.openai_ws:
                         await self.openai_ws.send(json.dumps({
                             "type": "input_audio_buffer.append",
                             "audio": data.get("audio")
                         }))
+                    else:
+                        # [Early Audio] 연결 준비 중 -> 링 버퍼에 보관 후 준비되면 순서대로 전송
+                        self.buffer_early_audio(data.get("audio"))
                 
                 elif data.get("type") == "input_audio_buffer.commit":
-                     if self.openai_ws:
+                     self.mark_client_activity()
+                     if self.upstream_ready and self.openai_ws:
                         await self.openai_ws.send(json.dumps({
                             "type": "input_audio_buffer.commit"
                         }))
+                     else:
+                        self.early_audio.mark({"type": "input_audio_buffer.commit"})
                      
                 elif data.get("type") == "response.create":
                     # [Changed] 사용자의 요청으로 response.create 이벤트를 OpenAI로 전달하지 않음
@@ -197,9 +616,15 @@ class ConnectionHandler:
                     #     }))
 
                 elif data.get("type") == "session.update":
+                    # [Subscription] 이벤트 구독 변경 (OpenAI로 전달하지 않음)
+                    if isinstance(data.get("events"), list):
+                        await self.update_subscription(data["events"])
                     new_config = data.get("config", {})
                     if new_config:
                         logger.info(f"클라이언트 설정 변경 요청 수신: {new_config}")
+                        if "turn_detection" in new_config:
+                            # 클라이언트가 직접 지정한 VAD 설정은 자동 조정하지 않음
+                            self.endpointing.enabled = False
                         should_reconnect = await self.conversation_manager.update_session_settings(new_config)
                         
                         if should_reconnect:
@@ -208,7 +633,12 @@ class ConnectionHandler:
                                 self.voice = new_config["voice"]
                                 logger.info(f"Voice setting updated to: {self.voice}")
 
-                            await self.reconnect_to_openai()
+                            # 재연결 중 들어온 오디오는 링 버퍼에 보관 (수신 루프를 막지 않음)
+                            self.connect_task = asyncio.create_task(self.reconnect_to_openai())
+
+                elif data.get("type") == "pong":
+                    # [Link Quality] RTT 샘플
+                    self.link.handle_pong(data)
 
                 elif data.get("type") == "disconnect":
                     logger.info("클라이언트로부터 연결 종료 요청 수신")
@@ -221,8 +651,10 @@ class ConnectionHandler:
 
     async def receive_from_openai(self):
         """[OpenAI -> Client 중계 루프]"""
+        # 재연결 시 self.openai_ws가 교체되므로 이 루프가 담당하는 소켓을 고정
+        openai_ws = self.openai_ws
         try:
-            async for message in self.openai_ws:
+            async for message in openai_ws:
                 event = json.loads(message)
                 event_type = event.get("type")
                 
@@ -232,6 +664,9 @@ class ConnectionHandler:
                 
                 # 모든 이벤트 로그 출력 (너무 많으면 나중에 다시 필터링)
                 print(f"[OpenAI Event] {event_type}") 
+                self.capture_greeting_event(event)
+                if self.subscription.wants("debug"):
+                    await self.send_to_client({"type": "debug.event", "event": event_type})
                 pass # print는 주석처리하고 필요한 중요 로그만 아래에서 처리하도록 내버려두거나,
                      # 아니면 디버깅을 위해 다 찍어볼 수도 있음. 
                      # 여기서는 사용자가 원인 파악을 원하므로 'Warning' 이상이나 'Error'는 무조건 찍히게 되어있지만,
@@ -250,34 +685,52 @@ class ConnectionHandler:
                     logger.info(f"OpenAI 세션 설정 업데이트 완료: {event.get('session', {}).get('voice')}")
                 
                 elif event_type == "response.audio.delta":
-                    await self.client_ws.send_json({
-                        "type": "audio.delta",
-                        "delta": event["delta"]
-                    })
+                    if not self.subscription.wants("audio"):
+                        # 디코딩/재분할 없이 억제 (base64 델타 크기로 집계)
+                        self.subscription.record_suppressed("audio.delta", len(event["delta"]))
+                        continue
+                    # [Link Quality] 델타 크기와 무관하게 링크에 맞는 프레임 크기로 전송
+                    await self.send_audio_to_client(base64.b64decode(event["delta"]))
                 elif event_type == "response.audio.done":
-                     await self.client_ws.send_json({"type": "audio.done"})
+                     await self.flush_audio_to_client()
+                     await self.send_to_client({"type": "audio.done"})
                 elif event_type == "response.audio_transcript.done":
                     # 텍스트 자막
-                    await self.client_ws.send_json({
+                    await self.send_to_client({
                         "type": "transcript.done",
                         "transcript": event["transcript"]
                     })
                     # [Tracker] AI 응답 자막 기록
                     self.tracker.add_transcript("assistant", event["transcript"])
+                elif event_type == "response.text.done":
+                    # [Subscription] 텍스트 전용 응답 (오디오 미구독) -> 자막 형식으로 전달
+                    await self.send_to_client({
+                        "type": "transcript.done",
+                        "transcript": event["text"]
+                    })
+                    self.tracker.add_transcript("assistant", event["text"])
                 elif event_type == "input_audio_buffer.speech_started":
                     logger.info("VAD가 발화 시작을 감지함")
-                    await self.client_ws.send_json({"type": "speech.started"})
+                    # 끼어들기: 아직 보내지 않은 AI 오디오는 폐기
+                    self.audio_coalescer.clear()
+                    await self.send_to_client({"type": "speech.started"})
                     # [Tracker] 사용자 발화 시작
-                    self.tracker.start_user_speech()
+                    gap = self.tracker.start_user_speech()
+                    # [Endpointing] 직전 턴 종료 판정 후 필요 시 침묵 구간 갱신
+                    if self.endpointing.on_speech_started(gap):
+                        await self.conversation_manager.update_session_settings({
+                            "turn_detection": self.endpointing.turn_detection()
+                        })
 
                 elif event_type == "input_audio_buffer.speech_stopped":
                     # [Tracker] 사용자 발화 종료 (VAD)
                     self.tracker.stop_user_speech()
-                    await self.client_ws.send_json({"type": "speech.stopped"})
+                    self.endpointing.on_speech_stopped()
+                    await self.send_to_client({"type": "speech.stopped"})
                 elif event_type == "conversation.item.input_audio_transcription.completed":
                     transcript = event.get("transcript", "")
                     logger.info(f"사용자 자막: {transcript}")
-                    await self.client_ws.send_json({
+                    await self.send_to_client({
                         "type": "user.transcript",
                         "transcript": transcript
                     })
@@ -291,31 +744,58 @@ class ConnectionHandler:
 
         except Exception as e:
             logger.error(f"OpenAI 수신 루프 중지됨: {e}")
-            await self.handle_openai_disconnect(str(e))
-        finally:
+            drop_reason = str(e)
+        else:
             # 정상적으로 루프가 끝난 경우에도 연결이 끊긴 것으로 간주
-            if self.openai_ws:
+            drop_reason = "upstream closed"
+        finally:
+            if openai_ws:
                 try:
-                    await self.openai_ws.close()
+                    await openai_ws.close()
                 except Exception:
                     pass
 
+        # [Reconnect] 의도된 종료(재연결/일시 중단/정리)가 아니라면 자동 복구 시작
+        if self.openai_ws is openai_ws and not self._closing:
+            self.openai_ws = None
+            self.upstream_ready = False
+            self.recovery_task = asyncio.create_task(self.recover_upstream(drop_reason))
+
 
     async def cleanup(self):
         """자원 정리"""
+        self._closing = True
+        if self.recovery_task:
+            self.recovery_task.cancel()
+        if self.idle_task:
+            self.idle_task.cancel()
+        if self.greeting_task:
+            self.greeting_task.cancel()
+        if self.connect_task:
+            self.connect_task.cancel()
+        if self.ping_task:
+            self.ping_task.cancel()
         if self.openai_task:
             self.openai_task.cancel()
         if self.openai_ws:
             await self.openai_ws.close()
+        await self.discard_prewarmed()
             
         # [Tracker] 세션 종료 및 리포트 생성 (전송 & 반환)
         if hasattr(self, 'tracker'):
+            # 연결 준비 중 수신 오디오 보존/폐기 통계 (전송되지 못한 잔여분은 폐기로 집계)
+            self.early_audio.clear()
+            self.tracker.record_metric("early_audio", self.early_audio.stats())
+            self.tracker.record_metric("endpointing", self.endpointing.stats())
+            self.tracker.record_metric("network", self.link.stats())
+            self.tracker.record_metric("subscription", self.subscription.stats())
+            self.tracker.record_metric("reconnect", self.reconnect_policy.log.stats())
             report = self.tracker.finalize()
             
             try:
                 # 연결이 살아있을 때만 "disconnected" 정류 종료 알림과 함께 리포트 전송
                 # (이미 "error"를 보냈거나 소켓이 닫혔으면 실패할 것임)
-                await self.client_ws.send_json({
+                await self.send_to_client({
                     "type": "disconnected",
                     "reason": "Session ended",
                     "report": report
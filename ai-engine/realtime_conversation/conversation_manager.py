@@ -1,8 +1,11 @@
 import asyncio
+import hashlib
 import json
 import logging
 import os
 
+from realtime_common.reconnect import build_replay_items
+
 logger = logging.getLogger(__name__)
 
 class ConversationManager:
@@ -37,6 +40,9 @@ class ConversationManager:
             )
             print(f"Warning: Prompt file not found at {prompt_path}")
 
+        # 프롬프트 버전 (템플릿 내용 기반 해시) - 첫 인사 캐시 키 등에 사용
+        self.prompt_version = hashlib.sha1(self.raw_system_prompt.encode("utf-8")).hexdigest()[:12]
+
         # [Refactor] 3-Layer Prompt Variables (3단 프롬프트 관리 구조)
         # 1. Base: 템플릿 치환 후의 기본 페르소나 (초기엔 원본과 동일)
         self.instruction_base = self.raw_system_prompt
@@ -164,25 +170,9 @@ class ConversationManager:
 
         logger.info(f"대화 히스토리 주입 시작 ({len(messages)}건)")
         
-        for msg in messages:
-            # role 매핑 ('user' -> 'user', 'assistant' -> 'assistant')
-            # system 메시지는 보통 제외하거나 session instructions에 녹임
-            if msg['role'] not in ['user', 'assistant']:
-                continue
-                
-            item_event = {
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "message",
-                    "role": msg['role'],
-                    "content": [
-                        {
-                            "type": "input_text" if msg['role'] == "user" else "text",
-                            "text": msg['content']
-                        } 
-                    ]
-                }
-            }
+        # system 메시지는 보통 제외하거나 session instructions에 녹임 (user/assistant만 변환)
+        # 이벤트를 미리 모두 만든 뒤 연속 전송 (재연결 시 일괄 재주입과 동일한 경로)
+        for item_event in build_replay_items(messages, limit=None):
             await self.openai_ws.send(json.dumps(item_event))
             
         logger.info("-> 대화 히스토리 주입 완료")
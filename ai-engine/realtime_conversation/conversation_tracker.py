@@ -1,7 +1,7 @@
 import logging
 import time
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -21,6 +21,7 @@ class ConversationTracker:
         # 메트릭
         self.user_speech_total_seconds = 0.0
         self._speech_start_time = None
+        self._speech_stop_time = None # 직전 발화 종료 시각 (턴 종료 판정용)
         
         # 대화 로그 (Messages)
         # item structure: { "role": str, "content": str, "timestamp": str (iso), "duration_sec": float }
@@ -33,10 +34,22 @@ class ConversationTracker:
         # WPM 추적
         self.wpm_history: List[float] = [] # 최근 WPM 값들
 
-    def start_user_speech(self):
-        """VAD: 사용자가 말을 시작했을 때 호출"""
+        # 운영 메트릭 (부트스트랩 시간 등) - 리포트의 "metrics" 필드로 전달
+        self.metrics: Dict[str, Any] = {}
+
+    def start_user_speech(self) -> Optional[float]:
+        """
+        VAD: 사용자가 말을 시작했을 때 호출
+
+        Returns:
+            float | None: 직전 발화 종료(speech_stopped) 이후 경과 시간(초). 첫 발화면 None
+        """
         self._speech_start_time = time.time()
+        gap = None
+        if self._speech_stop_time:
+            gap = self._speech_start_time - self._speech_stop_time
         logger.debug("[Tracker] 사용자 발화 시작 감지")
+        return gap
 
     def stop_user_speech(self):
         """VAD: 사용자가 말을 멈췄을 때 호출"""
@@ -45,6 +58,7 @@ class ConversationTracker:
             self.user_speech_total_seconds += duration
             self._last_speech_duration = duration # 자막 매핑을 위해 임시 저장
             self._speech_start_time = None
+            self._speech_stop_time = time.time()
             logger.debug(f"[Tracker] 사용자 발화 종료. 추가 시간: {duration:.2f}초, 누적: {self.user_speech_total_seconds:.2f}초, 마지막: {self._last_speech_duration:.2f}초")
 
     def add_transcript(self, role: str, content: str) -> str:
@@ -97,6 +111,10 @@ class ConversationTracker:
         
         return self._determine_wpm_status()
 
+    def record_metric(self, name: str, value: Any):
+        """운영 메트릭 기록 (세션 리포트에 포함)"""
+        self.metrics[name] = value
+
     def _determine_wpm_status(self) -> str:
         """최근 WPM 평균을 기반으로 상태 결정"""
         if not self.wpm_history:
@@ -132,7 +150,8 @@ class ConversationTracker:
             "ended_at": ended_at,
             "total_duration_sec": round(total_duration_sec, 2),
             "user_speech_duration_sec": round(self.user_speech_total_seconds, 2),
-            "messages": self.messages
+            "messages": self.messages,
+            "metrics": self.metrics
         }
         
         logger.info(f"[Tracker] 세션 리포트 생성 완료. 총 시간: {report['total_duration_sec']}초, 유저 발화: {report['user_speech_duration_sec']}초")
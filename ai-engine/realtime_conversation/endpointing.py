@@ -0,0 +1,132 @@
+from collections import deque
+from typing import Deque, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# [Endpointing] 적응형 침묵 구간(silence_duration_ms) 안전 범위
+MIN_SILENCE_MS = 500
+MAX_SILENCE_MS = 2000
+# 깨끗한(오탐 없는) 턴마다 줄이는 폭
+SILENCE_STEP_MS = 100
+# 관측된 문장 중간 멈춤(pause) 위에 더하는 여유
+PAUSE_MARGIN_MS = 200
+# speech_stopped 이후 이 시간 안에 다시 speech_started가 오면 "말이 안 끝났는데 끊은 것(오탐)"으로 간주
+FALSE_ENDPOINT_WINDOW_SEC = 1.0
+# 학습에 사용할 최근 멈춤 샘플 수
+PAUSE_HISTORY_SIZE = 20
+
+
+class AdaptiveEndpointing:
+    """
+    [Adaptive Endpointing Controller]
+    server_vad의 silence_duration_ms를 학습자별로 조정하여 턴 종료 대기 시간을 줄입니다.
+
+    - ConversationTracker가 기록한 speech_started/speech_stopped 간격으로 턴 종료가 맞았는지 판단
+      - 멈춤 후 FALSE_ENDPOINT_WINDOW_SEC 안에 다시 말하기 시작 -> 오탐 (실제 멈춤 = 적용 중인 침묵 + 간격)
+      - 그 외 -> 정상 턴 종료
+    - 정상 턴이 이어지면 SILENCE_STEP_MS씩 줄이고, 오탐 시 관측된 멈춤(상위 90%) + 여유만큼 늘림
+    - 항상 [MIN_SILENCE_MS, MAX_SILENCE_MS] 범위를 유지
+    """
+    def __init__(
+        self,
+        base_turn_detection: Dict,
+        min_ms: int = MIN_SILENCE_MS,
+        max_ms: int = MAX_SILENCE_MS,
+        step_ms: int = SILENCE_STEP_MS,
+        margin_ms: int = PAUSE_MARGIN_MS,
+        false_endpoint_window_sec: float = FALSE_ENDPOINT_WINDOW_SEC,
+    ):
+        self.base_turn_detection = dict(base_turn_detection or {})
+        self.baseline_ms = int(self.base_turn_detection.get("silence_duration_ms", max_ms))
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.step_ms = step_ms
+        self.margin_ms = margin_ms
+        self.false_endpoint_window_sec = false_endpoint_window_sec
+        self.enabled = self.base_turn_detection.get("type") == "server_vad"
+
+        self.silence_ms = self.baseline_ms
+        self.pauses_ms: Deque[float] = deque(maxlen=PAUSE_HISTORY_SIZE)
+        self._pending_endpoint_ms: Optional[int] = None  # 판정 대기 중인 턴 종료에 적용된 침묵 값
+
+        # 통계
+        self.turns = 0
+        self.false_endpoints = 0
+        self.adjustments = 0
+        self.saved_ms = 0
+
+    def turn_detection(self) -> Dict:
+        """현재 적용할 turn_detection 설정 (기본 설정 + 조정된 침묵 구간)"""
+        settings = dict(self.base_turn_detection)
+        settings["silence_duration_ms"] = self.silence_ms
+        return settings
+
+    def on_speech_stopped(self):
+        """VAD가 턴 종료를 선언한 시점 (적용된 침묵 값 기록 후 다음 발화에서 판정)"""
+        self._settle_pending()
+        self._pending_endpoint_ms = self.silence_ms
+
+    def on_speech_started(self, gap_sec: Optional[float]) -> bool:
+        """
+        사용자 발화 시작 시 직전 턴 종료를 판정하고 침묵 구간을 조정합니다.
+
+        Args:
+            gap_sec: 직전 speech_stopped 이후 경과 시간 (ConversationTracker 기준, 없으면 None)
+
+        Returns:
+            bool: 침묵 구간이 변경되어 session.update 전송이 필요한지 여부
+        """
+        if not self.enabled or self._pending_endpoint_ms is None:
+            return False
+
+        applied_ms = self._pending_endpoint_ms
+        self._pending_endpoint_ms = None
+        previous = self.silence_ms
+
+        if gap_sec is not None and gap_sec < self.false_endpoint_window_sec:
+            # 오탐: 학습자는 (적용된 침묵 + 간격)만큼 멈췄다가 이어서 말함
+            self.false_endpoints += 1
+            self.pauses_ms.append(applied_ms + gap_sec * 1000)
+            self.silence_ms = max(self.silence_ms, self._pause_floor())
+        else:
+            self._credit_turn(applied_ms)
+            self.silence_ms = max(self.silence_ms - self.step_ms, self._pause_floor())
+
+        self.silence_ms = int(min(max(self.silence_ms, self.min_ms), self.max_ms))
+        if self.silence_ms != previous:
+            self.adjustments += 1
+            logger.info(f"[Endpointing] silence_duration_ms {previous} -> {self.silence_ms} (오탐 {self.false_endpoints}/{self.turns + self.false_endpoints})")
+            return True
+        return False
+
+    def stats(self) -> Dict:
+        """세션 리포트용 통계 (기본값 대비 턴 종료 대기 시간 절감량)"""
+        self._settle_pending()
+        return {
+            "baseline_silence_ms": self.baseline_ms,
+            "final_silence_ms": self.silence_ms,
+            "turns": self.turns,
+            "false_endpoints": self.false_endpoints,
+            "adjustments": self.adjustments,
+            "saved_ms_total": self.saved_ms,
+            "saved_ms_per_turn": round(self.saved_ms / self.turns) if self.turns else 0,
+        }
+
+    def _settle_pending(self):
+        """판정되지 않은 마지막 턴 종료는 정상 턴으로 집계"""
+        if self._pending_endpoint_ms is not None:
+            self._credit_turn(self._pending_endpoint_ms)
+            self._pending_endpoint_ms = None
+
+    def _credit_turn(self, applied_ms: int):
+        self.turns += 1
+        self.saved_ms += self.baseline_ms - applied_ms
+
+    def _pause_floor(self) -> float:
+        """관측된 문장 중간 멈춤의 상위 90% + 여유 (관측 없으면 최소값)"""
+        if not self.pauses_ms:
+            return self.min_ms
+        ordered = sorted(self.pauses_ms)
+        p90 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))]
+        return p90 + self.margin_ms
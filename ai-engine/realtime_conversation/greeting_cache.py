@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+GreetingKey = Tuple[str, str, str, str]
+
+
+@dataclass(frozen=True)
+class CachedGreeting:
+    """캐시된 첫 인사 (자막 텍스트 + PCM16 오디오)"""
+    text: str
+    audio: bytes
+    sample_rate: int = 24000
+
+
+class GreetingCache:
+    """
+    [First-Turn Greeting Cache]
+    카탈로그 시나리오(ScenarioDefinition)의 첫 인사는 매번 거의 동일하므로,
+    (scenario_id, voice, prompt_version, context_version) 기준으로 텍스트와 PCM16 오디오를 캐싱합니다.
+    context_version은 정의에서 채워지는 세션 컨텍스트(제목/장소/상대/목표)의 해시이므로,
+    카탈로그 정의가 수정되면 자동으로 다른 키가 되어 이전 인사는 재사용되지 않습니다.
+    SessionManager와 동일하게 싱글톤으로 동작하며, 최대 개수를 넘으면 오래된 항목부터 제거합니다(LRU).
+    """
+    _instance = None
+    max_entries = 128
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(GreetingCache, cls).__new__(cls)
+            cls._instance._entries: "OrderedDict[GreetingKey, CachedGreeting]" = OrderedDict()
+            cls._instance.hits = 0
+            cls._instance.misses = 0
+        return cls._instance
+
+    @staticmethod
+    def make_key(scenario_id: str, voice: str, prompt_version: str, context: Optional[dict] = None) -> GreetingKey:
+        return (scenario_id, voice, prompt_version, GreetingCache.context_version(context))
+
+    @staticmethod
+    def context_version(context: Optional[dict]) -> str:
+        """세션 컨텍스트 해시 (키 순서와 무관)"""
+        encoded = json.dumps(context or {}, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:12]
+
+    def get(self, key: GreetingKey) -> Optional[CachedGreeting]:
+        """캐시 조회 (조회 시 최신 항목으로 갱신)"""
+        greeting = self._entries.get(key)
+        if greeting is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return greeting
+
+    def put(self, key: GreetingKey, greeting: CachedGreeting):
+        """캐시 저장"""
+        self._entries[key] = greeting
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        logger.info(f"[GreetingCache] 첫 인사 캐시 저장: {key} ({len(greeting.audio)} bytes)")
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
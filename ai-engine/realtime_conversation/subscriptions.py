@@ -0,0 +1,107 @@
+import logging
+from typing import Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# [Subscription] 클라이언트가 선택할 수 있는 이벤트 클래스
+# - audio: AI 응답 오디오
+# - captions: AI/사용자 자막
+# - debug: 업스트림(OpenAI) 이벤트 타입 알림
+# 여기에 없는 이벤트(speech.started, error, disconnected, session.*, ping 등)는 제어 이벤트로 항상 전달
+EVENT_CLASSES: Dict[str, Set[str]] = {
+    "audio": {"audio.delta", "audio.done"},
+    "captions": {"transcript.done", "user.transcript"},
+    "debug": {"debug.event"},
+}
+DEFAULT_CLASSES = frozenset({"audio", "captions"})
+
+
+def estimate_payload_bytes(payload: dict) -> int:
+    """직렬화하지 않고 JSON 크기를 근사 (억제된 메시지의 절감량 집계용)"""
+    size = 2
+    for key, value in payload.items():
+        size += len(key) + 6
+        size += len(value) if isinstance(value, str) else 8
+    return size
+
+
+class EventSubscription:
+    """
+    [Event Subscription]
+    클라이언트가 원하는 이벤트 클래스(audio / captions / debug)만 전달하고,
+    나머지는 생성/전송하지 않은 채 억제된 메시지 수와 바이트를 집계합니다.
+
+    - 연결 시: events 쿼리 파라미터 (없으면 세션의 show_text로 결정)
+    - 연결 중: session.update 메시지의 events 필드
+    """
+    def __init__(self, classes: Iterable[str] = DEFAULT_CLASSES, explicit: bool = False):
+        self.classes = self._normalize(classes)
+        self.explicit = explicit  # 클라이언트가 직접 선언했는지 (show_text보다 우선)
+
+        # 통계
+        self.suppressed_messages = 0
+        self.suppressed_bytes = 0
+        self.suppressed_by_type: Dict[str, int] = {}
+
+    @classmethod
+    def parse(cls, events: Optional[str]) -> Optional["EventSubscription"]:
+        """쿼리 파라미터 "audio,captions" 형식 파싱 (없거나 유효한 클래스가 하나도 없으면 None -> 기본 구독)"""
+        if not events:
+            return None
+        classes = [item.strip() for item in events.split(",") if item.strip()]
+        subscription = cls(classes, explicit=True)
+        if not subscription.classes:
+            logger.warning(f"[Subscription] 유효한 이벤트 클래스 없음 - 기본 구독 사용: {events}")
+            return None
+        return subscription
+
+    @classmethod
+    def from_show_text(cls, show_text: Optional[bool]) -> "EventSubscription":
+        """세션 자막 설정 기반 기본 구독 (show_text=False -> 오디오만)"""
+        if show_text is False:
+            return cls({"audio"})
+        return cls(DEFAULT_CLASSES)
+
+    def update(self, classes: Iterable[str]):
+        """session.update로 구독 변경 (통계는 유지, 유효한 클래스가 없으면 기존 구독 유지)"""
+        normalized = self._normalize(classes)
+        if not normalized:
+            logger.warning(f"[Subscription] 유효한 이벤트 클래스 없음 - 구독 변경 무시: {list(classes)}")
+            return
+        self.classes = normalized
+        self.explicit = True
+        logger.info(f"[Subscription] 이벤트 구독 변경: {sorted(self.classes)}")
+
+    def wants(self, event_class: str) -> bool:
+        return event_class in self.classes
+
+    def allows(self, message_type: Optional[str]) -> bool:
+        """클라이언트로 보낼 메시지 타입이 구독 대상인지 여부"""
+        for event_class, message_types in EVENT_CLASSES.items():
+            if message_type in message_types:
+                return event_class in self.classes
+        return True
+
+    def record_suppressed(self, message_type: str, nbytes: int):
+        self.suppressed_messages += 1
+        self.suppressed_bytes += nbytes
+        self.suppressed_by_type[message_type] = self.suppressed_by_type.get(message_type, 0) + 1
+
+    def stats(self) -> Dict:
+        """세션 리포트용 통계"""
+        return {
+            "classes": sorted(self.classes),
+            "suppressed_messages": self.suppressed_messages,
+            "suppressed_bytes": self.suppressed_bytes,
+            "suppressed_by_type": dict(self.suppressed_by_type),
+        }
+
+    @staticmethod
+    def _normalize(classes: Iterable[str]) -> Set[str]:
+        normalized = set()
+        for event_class in classes:
+            if event_class in EVENT_CLASSES:
+                normalized.add(event_class)
+            else:
+                logger.warning(f"[Subscription] 알 수 없는 이벤트 클래스 무시: {event_class}")
+        return normalized
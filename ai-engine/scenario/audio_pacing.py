@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import mmap
+import time
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Optional, Union
+
+from realtime_common.link_quality import LinkQualityEstimator
+
+PACING_REALTIME = "realtime"
+PACING_BURST = "burst"
+PACING_MODES = (PACING_REALTIME, PACING_BURST)
+DEFAULT_AUDIO_LEAD_MS = 500
+DEFAULT_CHUNK_MS = 100
+BUFFER_READ_BYTES = 48000
+
+
+class AudioPacer:
+    """Schedules outbound audio frames against a monotonic clock.
+
+    realtime: the first ``lead_ms`` of audio goes out immediately so the client
+    has a jitter buffer, then every frame is released ``lead_ms`` ahead of its
+    playback position. Due times are absolute, so oversleeping on one frame is
+    corrected on the next one instead of accumulating drift. If the source falls
+    behind playback (slow TTS stream) the schedule is re-anchored so the client
+    gets a fresh lead rather than a burst.
+
+    burst: frames are sent as fast as the socket takes them, for clients that
+    schedule playback themselves.
+    """
+
+    def __init__(
+        self,
+        mode: str = PACING_REALTIME,
+        lead_ms: float = DEFAULT_AUDIO_LEAD_MS,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if mode not in PACING_MODES:
+            raise ValueError(f"unknown pacing mode: {mode}")
+        self.mode = mode
+        self.lead_ms = lead_ms
+        # this utterance's lead; a link-derived value must not raise the configured floor for good
+        self._lead_ms = lead_ms
+        self._clock = clock
+        self._sleep = sleep
+        self._anchor: Optional[float] = None
+        self._position_ms = 0.0
+        self._utterance_started: Optional[float] = None
+
+        self.utterances = 0
+        self.frames = 0
+        self.audio_ms = 0.0
+        self.slept_ms = 0.0
+        self.busy_ms = 0.0
+        self.max_late_ms = 0.0
+        self.underruns = 0
+
+    def begin(self, lead_ms: Optional[float] = None) -> None:
+        self._lead_ms = self.lead_ms if lead_ms is None else lead_ms
+        self._anchor = None
+        self._position_ms = 0.0
+        self._utterance_started = self._clock()
+        self.utterances += 1
+
+    def end(self) -> None:
+        if self._utterance_started is not None:
+            self.busy_ms += (self._clock() - self._utterance_started) * 1000
+            self._utterance_started = None
+
+    async def after_frame(self, duration_ms: float) -> None:
+        now = self._clock()
+        if self._anchor is None:
+            self._anchor = now
+        self.frames += 1
+        self.audio_ms += duration_ms
+        if self.mode == PACING_BURST:
+            self._position_ms += duration_ms
+            return
+
+        played_ms = (now - self._anchor) * 1000
+        if self._position_ms and played_ms > self._position_ms:
+            # the client has played everything we sent; restart with a fresh lead
+            self.underruns += 1
+            self._anchor = now - self._position_ms / 1000
+        elif self._position_ms >= self._lead_ms:
+            late_ms = played_ms - (self._position_ms - self._lead_ms)
+            self.max_late_ms = max(self.max_late_ms, late_ms)
+        self._position_ms += duration_ms
+
+        delay = self._anchor + (self._position_ms - self._lead_ms) / 1000 - self._clock()
+        if delay > 0:
+            self.slept_ms += delay * 1000
+            await self._sleep(delay)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "lead_ms": self.lead_ms,
+            "last_lead_ms": self._lead_ms,
+            "utterances": self.utterances,
+            "frames": self.frames,
+            "audio_ms": round(self.audio_ms, 1),
+            # how long the sender coroutine stayed occupied vs the audio it delivered
+            "busy_ms": round(self.busy_ms, 1),
+            "slept_ms": round(self.slept_ms, 1),
+            "max_late_ms": round(self.max_late_ms, 1),
+            "underruns": self.underruns,
+        }
+
+
+async def _iter_pcm16(audio: Union[bytes, mmap.mmap, AsyncIterable[bytes]]) -> AsyncIterator[bytes]:
+    if isinstance(audio, (bytes, bytearray, mmap.mmap)):
+        # cached buffers may be file mappings; copy them out piecewise instead of all at once
+        for offset in range(0, len(audio), BUFFER_READ_BYTES):
+            yield bytes(audio[offset : offset + BUFFER_READ_BYTES])
+        return
+    async for chunk in audio:
+        yield chunk
+
+
+async def send_pcm16_audio(
+    send_to_client,
+    audio: Union[bytes, mmap.mmap, AsyncIterable[bytes]],
+    sample_rate: int,
+    link: Optional[LinkQualityEstimator] = None,
+    pacer: Optional[AudioPacer] = None,
+) -> None:
+    # audio may be a complete buffer or a TTS stream; frames are cut as bytes arrive
+    chunk_ms = link.chunk_ms() if link is not None else DEFAULT_CHUNK_MS
+    chunk_size = int(sample_rate * (chunk_ms / 1000.0)) * 2
+    pacer = pacer or AudioPacer()
+    lead_ms = pacer.lead_ms
+    if link is not None:
+        # never lead by less than the link needs to absorb its RTT and jitter
+        lead_ms = max(lead_ms, link.send_ahead_frames(chunk_ms) * chunk_ms)
+    pending = bytearray()
+    started = False
+
+    async def send_frame(frame: bytes) -> None:
+        nonlocal started
+        if not started:
+            started = True
+            pacer.begin(lead_ms)
+        await send_to_client(
+            {
+                "type": "response.audio.delta",
+                "delta": base64.b64encode(frame).decode("ascii"),
+                "sample_rate": sample_rate,
+            }
+        )
+        await pacer.after_frame(len(frame) / 2 / sample_rate * 1000)
+
+    async for chunk in _iter_pcm16(audio):
+        pending.extend(chunk)
+        while len(pending) >= chunk_size:
+            frame = bytes(pending[:chunk_size])
+            del pending[:chunk_size]
+            await send_frame(frame)
+    # keep sample alignment for the tail
+    tail = bytes(pending[: len(pending) - len(pending) % 2])
+    if tail:
+        await send_frame(tail)
+    if not started:
+        return
+    pacer.end()
+    await send_to_client({"type": "response.audio.done"})
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Optional
+
+from .logging_utils import get_logger
+
+MAX_BACKGROUND_TASKS = 64
+
+
+class BackgroundTaskRunner:
+    """Fire-and-forget work that must not hold up a learner-facing reply.
+
+    Tasks keep a strong reference until they finish, failures are logged instead
+    of lost, and at most ``max_concurrency`` run at once. ``drain`` waits for
+    pending work on shutdown and cancels what is left after the timeout.
+    """
+
+    def __init__(self, max_concurrency: int = MAX_BACKGROUND_TASKS) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._logger = get_logger("background")
+        self.started = 0
+        self.completed = 0
+        self.failed = 0
+
+    def spawn(self, work: Awaitable[Any], name: Optional[str] = None) -> asyncio.Task[Any]:
+        task = asyncio.create_task(self._run(work, name or "background"), name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        self.started += 1
+        return task
+
+    async def _run(self, work: Awaitable[Any], name: str) -> Any:
+        try:
+            async with self._semaphore:
+                result = await work
+        except asyncio.CancelledError:
+            # cancelled while queued: the coroutine was never started
+            close = getattr(work, "close", None)
+            if close is not None:
+                close()
+            raise
+        except Exception as exc:
+            self.failed += 1
+            self._logger.error("Background task %s failed: %s", name, exc)
+            return None
+        self.completed += 1
+        return result
+
+    async def drain(self, timeout: float = 5.0) -> None:
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "started": self.started,
+            "completed": self.completed,
+            "failed": self.failed,
+            "running": len(self._tasks),
+        }
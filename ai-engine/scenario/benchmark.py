@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import math
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from .audio_relay import RealtimeAudioRelay
+from .extraction_cache import ExtractionCache
+from .factory import build_scenario_builder
+from .llm_client import OpenAIScenarioLLM
+from .loop_monitor import LoopStallMonitor
+from .realtime_handlers import HandlerSpec, fanout_event_handler
+from .realtime_pipeline import RealtimeScenarioPipeline
+from .speculation import SpeculationMetrics
+
+MODES = ("baseline", "combined", "speculative", "cached")
+TRANSCRIPT_EVENT = "conversation.item.input_audio_transcription.completed"
+# 100ms of 24kHz PCM16 per simulated upstream audio delta
+AUDIO_DELTA = base64.b64encode(b"\x00\x00" * 2400).decode("ascii")
+AUDIO_INTERVAL_SEC = 0.05
+# a turn that gets no reply within this window counts the session as not completed
+TURN_TIMEOUT_SEC = 30.0
+
+Fields = dict[str, Optional[str]]
+
+QUESTIONS = {
+    "place": "Where does this conversation happen?",
+    "partner": "Who are you talking to?",
+    "goal": "What would you like to do there?",
+}
+
+# scripted learners: (utterance, fields it states explicitly)
+SCRIPTS: list[list[tuple[str, Fields]]] = [
+    [
+        ("I'm at the airport check-in counter talking to staff to check in my bag",
+         {"place": "airport check-in counter", "partner": "staff", "goal": "check in my bag"}),
+    ],
+    [
+        ("I'm at a cafe", {"place": "cafe", "partner": None, "goal": None}),
+        ("I'm talking to the barista", {"place": None, "partner": "barista", "goal": None}),
+        ("I want to order a latte", {"place": None, "partner": None, "goal": "order a latte"}),
+    ],
+    [
+        ("hotel front desk", {"place": "hotel front desk", "partner": None, "goal": None}),
+        ("the receptionist, I want to check in", {"place": None, "partner": "receptionist", "goal": "check in"}),
+    ],
+    [
+        ("um I don't know", {"place": None, "partner": None, "goal": None}),
+        ("maybe somewhere", {"place": None, "partner": None, "goal": None}),
+        ("a restaurant", {"place": "restaurant", "partner": None, "goal": None}),
+        ("the waiter", {"place": None, "partner": "waiter", "goal": None}),
+    ],
+]
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """LLM round-trip latency: ``fixed:MS``, ``uniform:LOW:HIGH`` or ``lognormal:MEDIAN:SIGMA``."""
+
+    kind: str = "lognormal"
+    a: float = 400.0
+    b: float = 0.35
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        kind, *params = spec.split(":")
+        values = [float(value) for value in params]
+        if kind == "fixed" and len(values) == 1:
+            return cls(kind, values[0], 0.0)
+        if kind in ("uniform", "lognormal") and len(values) == 2:
+            return cls(kind, values[0], values[1])
+        raise ValueError(f"invalid latency spec: {spec!r}")
+
+    def sample_sec(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            ms = self.a
+        elif self.kind == "uniform":
+            ms = rng.uniform(self.a, self.b)
+        else:
+            ms = self.a * math.exp(rng.gauss(0.0, self.b))
+        return max(0.0, ms) / 1000
+
+
+class FakeResponses:
+    """Offline stand-in for ``AsyncOpenAI().responses`` that answers from the scripts."""
+
+    def __init__(self, latency: LatencyModel, rng: random.Random) -> None:
+        self._latency = latency
+        self._rng = rng
+        self._facts = {text: fields for script in SCRIPTS for text, fields in script}
+        self.calls = 0
+
+    async def create(self, *, model: str, input: str, **_kwargs: Any) -> SimpleNamespace:
+        self.calls += 1
+        await asyncio.sleep(self._latency.sample_sec(self._rng))
+        return SimpleNamespace(output_text=self._answer(input))
+
+    def _answer(self, prompt: str) -> str:
+        said = re.search(r'User said: "(.*)"', prompt)
+        fields = self._facts.get(said.group(1), {}) if said else {}
+        if "next_question" in prompt:
+            known = {name: _known(prompt, name) or fields.get(name) for name in ("place", "partner", "goal")}
+            order = re.search(r"the first of \[(.*)\]", prompt)
+            target = next((name for name in order.group(1).split(", ") if not known.get(name)), None)
+            return json.dumps(
+                {
+                    **{name: fields.get(name) for name in ("place", "partner", "goal")},
+                    "question_field": target,
+                    "next_question": QUESTIONS.get(target),
+                    "final_message": None if target else "Great, let's start!",
+                }
+            )
+        if said:
+            return json.dumps({name: fields.get(name) for name in ("place", "partner", "goal")})
+        if "Infer plausible values" in prompt:
+            return json.dumps({"place": "restaurant", "partner": "waiter", "goal": "order food"})
+        if "Ask one short question" in prompt:
+            return QUESTIONS["partner"]
+        return "Great, let's start!"
+
+
+def _known(prompt: str, name: str) -> Optional[str]:
+    match = re.search(rf"{name}=([^,\n]+)", prompt)
+    value = match.group(1).strip() if match else "None"
+    return None if value == "None" else value
+
+
+@dataclass
+class SessionResult:
+    completed: bool = False
+    turns: int = 0
+    turn_latency_ms: list[float] = field(default_factory=list)
+    max_audio_delay_ms: float = 0.0
+
+
+async def run_session(
+    script: list[tuple[str, Fields]],
+    llm: OpenAIScenarioLLM,
+    *,
+    mode: str,
+    extraction_cache: Optional[ExtractionCache],
+    speculation: SpeculationMetrics,
+    think_time_sec: float = 0.0,
+) -> SessionResult:
+    """One learner: scripted transcripts plus a concurrent stream of upstream audio deltas.
+
+    Both go through the same per-handler fan-out the bridge uses, so the audio
+    delay shows whether pipeline turns hold up the relay.
+    """
+    result = SessionResult()
+    loop = asyncio.get_running_loop()
+    builder = build_scenario_builder(
+        api_key="bench",
+        model="bench",
+        llm=llm,
+        combined_turns=mode == "combined",
+        extraction_cache=extraction_cache if mode == "cached" else None,
+        speculation=speculation if mode == "speculative" else None,
+    )
+    replied = asyncio.Event()
+    completed = asyncio.Event()
+
+    async def send_response(_text: str) -> None:
+        replied.set()
+
+    def on_complete(_builder: Any) -> None:
+        result.completed = True
+        completed.set()
+
+    async def on_audio(chunk: str) -> None:
+        return None
+
+    audio_sent_at: dict[int, float] = {}
+
+    async def audio_relay(event: dict[str, Any]) -> None:
+        await relay.handle_event(event)
+        sent_at = audio_sent_at.pop(event.get("seq", -1), None)
+        if sent_at is not None:
+            result.max_audio_delay_ms = max(result.max_audio_delay_ms, (loop.time() - sent_at) * 1000)
+
+    relay = RealtimeAudioRelay(on_audio_chunk_base64=on_audio)
+    pipeline = RealtimeScenarioPipeline(builder, send_response, on_complete=on_complete)
+    fanout = fanout_event_handler(
+        [
+            HandlerSpec(audio_relay, name="audio_relay"),
+            HandlerSpec(pipeline.handle_event, name="pipeline", accepts=lambda e: e["type"] == TRANSCRIPT_EVENT),
+        ]
+    )
+
+    async def stream_audio() -> None:
+        seq = 0
+        while not completed.is_set():
+            audio_sent_at[seq] = loop.time()
+            await fanout({"type": "response.audio.delta", "delta": AUDIO_DELTA, "seq": seq})
+            seq += 1
+            await asyncio.sleep(AUDIO_INTERVAL_SEC)
+
+    audio_task = asyncio.create_task(stream_audio())
+    try:
+        turns = list(script)
+        while not completed.is_set():
+            # learners that run out of script repeat their last line until the builder gives up
+            text, _ = turns.pop(0) if len(turns) > 1 else turns[0]
+            replied.clear()
+            started = loop.time()
+            await fanout({"type": TRANSCRIPT_EVENT, "transcript": text})
+            try:
+                await asyncio.wait_for(replied.wait(), timeout=TURN_TIMEOUT_SEC)
+            except asyncio.TimeoutError:
+                break
+            result.turns += 1
+            result.turn_latency_ms.append((loop.time() - started) * 1000)
+            if think_time_sec:
+                await asyncio.sleep(think_time_sec)
+    finally:
+        completed.set()
+        audio_task.cancel()
+        await asyncio.gather(audio_task, return_exceptions=True)
+        await fanout.aclose()
+    return result
+
+
+async def run_benchmark(
+    sessions: int,
+    *,
+    mode: str = "baseline",
+    latency: LatencyModel = LatencyModel(),
+    seed: int = 7,
+) -> dict[str, Any]:
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    rng = random.Random(seed)
+    responses = FakeResponses(latency, rng)
+    llm = OpenAIScenarioLLM(
+        api_key="bench",
+        model="bench",
+        client=SimpleNamespace(),
+        async_client=SimpleNamespace(responses=responses),
+    )
+    extraction_cache = ExtractionCache()
+    speculation = SpeculationMetrics()
+
+    started = time.perf_counter()
+    async with LoopStallMonitor() as monitor:
+        results = await asyncio.gather(
+            *(
+                run_session(
+                    SCRIPTS[index % len(SCRIPTS)],
+                    llm,
+                    mode=mode,
+                    extraction_cache=extraction_cache,
+                    speculation=speculation,
+                )
+                for index in range(sessions)
+            )
+        )
+    latencies = sorted(ms for result in results for ms in result.turn_latency_ms)
+    turns = [result.turns for result in results]
+    report: dict[str, Any] = {
+        "mode": mode,
+        "sessions": sessions,
+        "completed": sum(result.completed for result in results),
+        "turns_avg": round(sum(turns) / len(turns), 2),
+        "turns_max": max(turns),
+        "turn_ms_p50": round(_percentile(latencies, 0.5), 1),
+        "turn_ms_p95": round(_percentile(latencies, 0.95), 1),
+        "turn_ms_max": round(latencies[-1], 1) if latencies else 0.0,
+        "llm_calls": responses.calls,
+        "audio_delay_ms_max": round(max(result.max_audio_delay_ms for result in results), 1),
+        "wall_ms": round((time.perf_counter() - started) * 1000, 1),
+        "loop": monitor.stats(),
+    }
+    if mode == "cached":
+        report["extraction_cache"] = extraction_cache.stats()
+    if mode == "speculative":
+        report["speculation"] = speculation.stats()
+    return report
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, math.ceil(fraction * len(values)) - 1))
+    return values[index]
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import difflib
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
+
+from .scenario_state import ScenarioState
+
+FIELDS = ("place", "partner", "goal")
+# minimum confidence for answering without the LLM
+FAST_PATH_THRESHOLD = 0.85
+FUZZY_CUTOFF = 0.8
+FUZZY_MIN_LENGTH = 4
+
+# generic vocabulary learners use for catalog scenarios; phrase -> value returned
+BUILTIN_PHRASES: dict[str, dict[str, str]] = {
+    "place": {
+        "airport": "airport",
+        "check in counter": "check-in counter",
+        "airport check in counter": "airport check-in counter",
+        "cafe": "cafe",
+        "coffee shop": "coffee shop",
+        "starbucks": "Starbucks",
+        "hotel": "hotel",
+        "hotel front desk": "hotel front desk",
+        "front desk": "front desk",
+        "restaurant": "restaurant",
+        "bank": "bank",
+        "pharmacy": "pharmacy",
+        "hospital": "hospital",
+        "store": "store",
+        "supermarket": "supermarket",
+    },
+    "partner": {
+        "staff": "staff",
+        "staff member": "staff member",
+        "airport staff": "airport staff",
+        "barista": "barista",
+        "waiter": "waiter",
+        "waitress": "waitress",
+        "server": "server",
+        "receptionist": "receptionist",
+        "clerk": "clerk",
+        "cashier": "cashier",
+        "check in agent": "check-in agent",
+        "pharmacist": "pharmacist",
+        "doctor": "doctor",
+        "bank teller": "bank teller",
+    },
+    "goal": {
+        "order coffee": "order coffee",
+        "ordering coffee": "order coffee",
+        "order food": "order food",
+        "ordering food": "order food",
+        "check in": "check in",
+        "checking in": "check in",
+        "check out": "check out",
+        "checking out": "check out",
+        "check baggage": "check baggage",
+        "checking baggage": "check baggage",
+        "get a window seat": "get a window seat",
+        "book a room": "book a room",
+        "open an account": "open an account",
+    },
+}
+
+# words that carry no field information; an utterance is fully explained when
+# every other token belongs to a matched phrase
+FILLER_WORDS = frozenset(
+    """
+    i i'm im am is are was be m a an the at in on to with for of and my me we our
+    it this that there here now just so um uh well like
+    talking talk speaking speak chatting chat want wanna would like to going gonna
+    trying try need please some
+    """.split()
+)
+
+Extraction = dict[str, Optional[str]]
+LlmExtractor = Callable[[str], Union[Extraction, Awaitable[Extraction]]]
+LlmPlanner = Callable[[ScenarioState, str], Union[dict[str, Any], Awaitable[dict[str, Any]]]]
+
+
+def normalize_text(text: str) -> list[str]:
+    lowered = text.lower().replace("’", "'")
+    return re.findall(r"[a-z0-9']+", lowered.replace("-", " "))
+
+
+@dataclass
+class _TrieNode:
+    children: dict[str, "_TrieNode"] = field(default_factory=dict)
+    value: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CatalogMatch:
+    fields: Extraction
+    confidence: float
+    covered: bool
+
+    @property
+    def confident(self) -> bool:
+        return self.covered and self.confidence >= FAST_PATH_THRESHOLD and any(self.fields.values())
+
+
+class CatalogIndex:
+    """Token tries of catalog place/partner/goal values and synonyms.
+
+    Matching walks each utterance position and takes the longest phrase found in
+    any field trie. Tokens that miss exactly may still match a trie edge by
+    spelling similarity (ASR typos), which lowers the confidence.
+    """
+
+    def __init__(self, phrases: Optional[dict[str, dict[str, str]]] = None) -> None:
+        self._roots = {name: _TrieNode() for name in FIELDS}
+        for name, table in (phrases or BUILTIN_PHRASES).items():
+            for phrase, value in table.items():
+                self.add(name, phrase, value)
+
+    @classmethod
+    def from_definitions(cls, definitions: Iterable[Any]) -> "CatalogIndex":
+        """Built-in vocabulary plus ``place``/``partner``/``goal`` of catalog definitions (rows or dicts)."""
+        index = cls()
+        for definition in definitions:
+            for name in FIELDS:
+                value = definition.get(name) if isinstance(definition, dict) else getattr(definition, name, None)
+                if isinstance(value, str) and value.strip():
+                    index.add(name, value, value.strip())
+        return index
+
+    def add(self, name: str, phrase: str, value: str) -> None:
+        node = self._roots[name]
+        for token in normalize_text(phrase):
+            node = node.children.setdefault(token, _TrieNode())
+        if node is not self._roots[name]:
+            node.value = value
+
+    def match(self, text: str) -> CatalogMatch:
+        tokens = normalize_text(text)
+        fields: Extraction = {name: None for name in FIELDS}
+        confidence = 1.0
+        covered = True
+        position = 0
+        while position < len(tokens):
+            best: Optional[tuple[int, str, str, float]] = None
+            for name in FIELDS:
+                found = self._longest(self._roots[name], tokens, position)
+                if found and (best is None or found[0] > best[0] or (found[0] == best[0] and found[2] > best[3])):
+                    best = (found[0], name, found[1], found[2])
+            if best is None:
+                if tokens[position] not in FILLER_WORDS:
+                    covered = False
+                position += 1
+                continue
+            length, name, value, score = best
+            if fields[name] is None:
+                fields[name] = value
+            confidence = min(confidence, score)
+            position += length
+        return CatalogMatch(fields=fields, confidence=confidence, covered=covered)
+
+    @staticmethod
+    def _longest(root: _TrieNode, tokens: list[str], start: int) -> Optional[tuple[int, str, float]]:
+        node = root
+        score = 1.0
+        best: Optional[tuple[int, str, float]] = None
+        for offset, token in enumerate(tokens[start:], start=1):
+            child = node.children.get(token)
+            if child is None and len(token) >= FUZZY_MIN_LENGTH:
+                close = difflib.get_close_matches(token, list(node.children), n=1, cutoff=FUZZY_CUTOFF)
+                if close:
+                    child = node.children[close[0]]
+                    score = min(score, difflib.SequenceMatcher(None, token, close[0]).ratio())
+            if child is None:
+                break
+            node = child
+            if node.value is not None:
+                best = (offset, node.value, score)
+        return best
+
+
+class CatalogFastPath:
+    """Answers extraction locally when the catalog explains the whole utterance.
+
+    Counts hits and misses process-wide and estimates the latency saved from the
+    running average of the LLM calls made on misses.
+    """
+
+    def __init__(self, index: Optional[CatalogIndex] = None) -> None:
+        self.index = index or CatalogIndex()
+        self.hits = 0
+        self.misses = 0
+        self.local_ms = 0.0
+        self._llm_calls = 0
+        self._llm_ms = 0.0
+
+    def lookup(self, text: str) -> Optional[Extraction]:
+        started = time.perf_counter()
+        result = self.index.match(text)
+        self.local_ms += (time.perf_counter() - started) * 1000
+        if result.confident:
+            self.hits += 1
+            return dict(result.fields)
+        self.misses += 1
+        return None
+
+    def record_llm_ms(self, elapsed_ms: float) -> None:
+        self._llm_calls += 1
+        self._llm_ms += elapsed_ms
+
+    def extractor(self, llm_extractor: LlmExtractor) -> Callable[[str], Awaitable[Extraction]]:
+        async def extract(text: str) -> Extraction:
+            local = self.lookup(text)
+            if local is not None:
+                return local
+            return await self._timed(llm_extractor(text))
+
+        return extract
+
+    def planner(self, llm_planner: LlmPlanner) -> Callable[[ScenarioState, str], Awaitable[dict[str, Any]]]:
+        async def plan(state: ScenarioState, text: str) -> dict[str, Any]:
+            local = self.lookup(text)
+            if local is not None:
+                # the builder asks its default question for whatever is still missing
+                return {**local, "question_field": None, "next_question": None, "final_message": None}
+            return await self._timed(llm_planner(state, text))
+
+        return plan
+
+    async def _timed(self, result: Any) -> Any:
+        started = time.perf_counter()
+        if hasattr(result, "__await__"):
+            result = await result
+        self.record_llm_ms((time.perf_counter() - started) * 1000)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        avg_llm_ms = self._llm_ms / self._llm_calls if self._llm_calls else 0.0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "avg_llm_ms": round(avg_llm_ms, 1),
+            "saved_ms": round(self.hits * avg_llm_ms - self.local_ms, 1),
+        }
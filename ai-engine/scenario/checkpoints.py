@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import secrets
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from .scenario_state import ScenarioState
+
+CHECKPOINT_MAX_ENTRIES = 10000
+# a learner who drops mid-flow usually reconnects within seconds; half an hour covers app restarts
+CHECKPOINT_TTL_SEC = 30 * 60
+MAX_CHECKPOINT_TRANSCRIPTS = 20
+
+
+@dataclass
+class ScenarioCheckpoint:
+    token: str
+    user_id: Optional[int]
+    state: dict[str, Any]
+    transcripts: list[str] = field(default_factory=list)
+    saved_at: float = 0.0
+
+    def restore_state(self) -> ScenarioState:
+        return ScenarioState.from_dict(self.state)
+
+
+class ScenarioCheckpointStore:
+    """Process-wide scenario-building checkpoints keyed by an unguessable resume token.
+
+    A checkpoint is bound to the user who created it (``None`` for guests) and
+    expires after ``ttl_sec``; the least recently saved ones are evicted past
+    ``max_entries``. Checkpoints live in this process only.
+
+    Writers that load, advance and save a token hold ``lock(token)`` so a text
+    turn and a voice turn on the same token cannot overwrite each other.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = CHECKPOINT_MAX_ENTRIES,
+        ttl_sec: float = CHECKPOINT_TTL_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._entries: "OrderedDict[str, ScenarioCheckpoint]" = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl_sec = ttl_sec
+        self._clock = clock
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+        self.saved = 0
+        self.resumed = 0
+        self.rejected = 0
+        self.expired = 0
+        self.evicted = 0
+
+    @staticmethod
+    def new_token() -> str:
+        return secrets.token_urlsafe(24)
+
+    def save(
+        self,
+        token: str,
+        state: ScenarioState,
+        transcripts: list[str],
+        user_id: Optional[int] = None,
+    ) -> ScenarioCheckpoint:
+        checkpoint = ScenarioCheckpoint(
+            token=token,
+            user_id=user_id,
+            state=state.to_dict(),
+            transcripts=list(transcripts[-MAX_CHECKPOINT_TRANSCRIPTS:]),
+            saved_at=self._clock(),
+        )
+        self._entries[token] = checkpoint
+        self._entries.move_to_end(token)
+        self.saved += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+        return checkpoint
+
+    def load(self, token: Optional[str], user_id: Optional[int] = None) -> Optional[ScenarioCheckpoint]:
+        if not token:
+            return None
+        checkpoint = self._entries.get(token)
+        if checkpoint is None:
+            self.rejected += 1
+            return None
+        if self._clock() - checkpoint.saved_at > self._ttl_sec:
+            del self._entries[token]
+            self.expired += 1
+            return None
+        if checkpoint.user_id != user_id:
+            # a leaked token must not hand one learner's scenario to another
+            self.rejected += 1
+            return None
+        self.resumed += 1
+        return checkpoint
+
+    def lock(self, token: str) -> asyncio.Lock:
+        lock = self._locks.get(token)
+        if lock is None:
+            lock = self._locks[token] = asyncio.Lock()
+        return lock
+
+    def changed_since(
+        self, token: Optional[str], seen: Optional[ScenarioCheckpoint]
+    ) -> Optional[ScenarioCheckpoint]:
+        """The stored checkpoint if another writer saved it after ``seen``."""
+        current = self._entries.get(token) if token else None
+        return current if current is not None and current is not seen else None
+
+    def discard(self, token: Optional[str]) -> None:
+        if token:
+            self._entries.pop(token, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "saved": self.saved,
+            "resumed": self.resumed,
+            "rejected": self.rejected,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
@@ -13,6 +13,17 @@ class AppConfig:
     llm_model: str = "gpt-4o-mini"
     max_attempts: int = 3
     max_retries: int = 1
+    # TTS audio pacing: "realtime" (lead then clock-paced) or "burst" (client schedules playback)
+    audio_pacing: str = "realtime"
+    audio_lead_ms: int = 500
+    # one structured LLM call per learner turn (extract + next question) instead of two
+    combined_turns: bool = False
+    # answer utterances fully explained by catalog vocabulary without an LLM call
+    catalog_fast_path: bool = True
+    # generate candidate follow-up questions while extraction runs (extra LLM calls)
+    speculative_followups: bool = False
+    # Realtime sessions kept pre-minted even without traffic (each one is billed)
+    session_pool_min_size: int = 0
 
     @staticmethod
     def from_env() -> "AppConfig":
@@ -28,8 +39,22 @@ class AppConfig:
             raise RuntimeError("OPENAI_API_KEY is required")
         realtime_model = os.getenv("OPENAI_REALTIME_MODEL", "").strip()
         llm_model = os.getenv("OPENAI_LLM_MODEL", "").strip()
+        audio_pacing = os.getenv("SCENARIO_AUDIO_PACING", "").strip().lower()
+        audio_lead_ms = os.getenv("SCENARIO_AUDIO_LEAD_MS", "").strip()
+        combined_turns = os.getenv("SCENARIO_COMBINED_TURNS", "").strip().lower()
+        catalog_fast_path = os.getenv("SCENARIO_CATALOG_FAST_PATH", "").strip().lower()
+        speculative_followups = os.getenv("SCENARIO_SPECULATIVE_FOLLOWUPS", "").strip().lower()
+        session_pool_min_size = os.getenv("SCENARIO_SESSION_POOL_MIN_SIZE", "").strip()
         return AppConfig(
             api_key=api_key,
             realtime_model=realtime_model or AppConfig.realtime_model,
             llm_model=llm_model or AppConfig.llm_model,
+            audio_pacing=audio_pacing or AppConfig.audio_pacing,
+            audio_lead_ms=int(audio_lead_ms) if audio_lead_ms.isdigit() else AppConfig.audio_lead_ms,
+            combined_turns=combined_turns in {"1", "true", "yes", "on"},
+            catalog_fast_path=catalog_fast_path not in {"0", "false", "no", "off"},
+            speculative_followups=speculative_followups in {"1", "true", "yes", "on"},
+            session_pool_min_size=(
+                int(session_pool_min_size) if session_pool_min_size.isdigit() else AppConfig.session_pool_min_size
+            ),
         )
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from .catalog_extractor import normalize_text
+from .prompts import build_extraction_prompt
+
+Extraction = dict[str, Optional[str]]
+Extractor = Callable[[str], Union[Extraction, Awaitable[Extraction]]]
+
+EXTRACTION_CACHE_SIZE = 4096
+EXTRACTION_CACHE_TTL_SEC = 6 * 60 * 60
+# changes whenever the extraction prompt template does, so stale answers are never reused
+EXTRACTION_PROMPT_VERSION = hashlib.sha1(build_extraction_prompt("{user_text}").encode("utf-8")).hexdigest()[:12]
+
+CacheKey = tuple[str, str]
+
+
+class ExtractionCache:
+    """Process-wide memo of sanitized ``extract_fields`` results.
+
+    Keys are ``(prompt_version, normalized text)``; entries expire after
+    ``ttl_sec`` and the least recently used ones are evicted past
+    ``max_entries``. Concurrent misses for the same text share one LLM call.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = EXTRACTION_CACHE_SIZE,
+        ttl_sec: float = EXTRACTION_CACHE_TTL_SEC,
+        prompt_version: str = EXTRACTION_PROMPT_VERSION,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._entries: "OrderedDict[CacheKey, tuple[float, Extraction]]" = OrderedDict()
+        self._inflight: dict[CacheKey, asyncio.Future[Extraction]] = {}
+        self._max_entries = max_entries
+        self._ttl_sec = ttl_sec
+        self._prompt_version = prompt_version
+        self._clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def key(self, text: str) -> CacheKey:
+        return (self._prompt_version, " ".join(normalize_text(text)))
+
+    def get(self, text: str) -> Optional[Extraction]:
+        key = self.key(text)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, extraction = entry
+        if self._clock() - stored_at > self._ttl_sec:
+            del self._entries[key]
+            self.expired += 1
+            return None
+        self._entries.move_to_end(key)
+        return dict(extraction)
+
+    def put(self, text: str, extraction: Extraction) -> None:
+        # an all-null answer may be a parse failure; never pin it for the TTL
+        if not any(extraction.values()):
+            return
+        key = self.key(text)
+        self._entries[key] = (self._clock(), dict(extraction))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+
+    def extractor(self, extract: Extractor) -> Callable[[str], Awaitable[Extraction]]:
+        async def cached_extract(text: str) -> Extraction:
+            cached = self.get(text)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            key = self.key(text)
+            pending = self._inflight.get(key)
+            if pending is not None:
+                try:
+                    shared = await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    if not pending.cancelled():
+                        raise
+                    # the owner was cancelled; make our own call
+                else:
+                    self.hits += 1
+                    return dict(shared)
+            self.misses += 1
+            future: asyncio.Future[Extraction] = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            try:
+                result = extract(text)
+                if hasattr(result, "__await__"):
+                    result = await result
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as exc:
+                future.set_exception(exc)
+                # waiters see the error; nobody else needs to retrieve it
+                future.exception()
+                raise
+            else:
+                future.set_result(result)
+                self.put(text, result)
+                return result
+            finally:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+        return cached_extract
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "prompt_version": self._prompt_version,
+        }
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from typing import Optional
 
+from .catalog_extractor import CatalogFastPath
+from .extraction_cache import ExtractionCache
 from .llm_client import OpenAIScenarioLLM
 from .prompts import KOREAN_FALLBACK_MESSAGE
 from .scenario_builder import ScenarioBuilder
 from .scenario_state import ScenarioState
+from .speculation import SpeculationMetrics
 
 
 def build_scenario_builder(
@@ -13,14 +16,31 @@ def build_scenario_builder(
     model: str,
     max_attempts: int = 3,
     logger: Optional[object] = None,
+    llm: Optional[OpenAIScenarioLLM] = None,
+    combined_turns: bool = False,
+    fast_path: Optional[CatalogFastPath] = None,
+    extraction_cache: Optional[ExtractionCache] = None,
+    speculation: Optional[SpeculationMetrics] = None,
+    state: Optional[ScenarioState] = None,
 ) -> ScenarioBuilder:
-    llm = OpenAIScenarioLLM(api_key=api_key, model=model, logger=logger)
+    llm = llm or OpenAIScenarioLLM(api_key=api_key, model=model, logger=logger)
+    extractor = llm.extract_fields_async
+    turn_planner = llm.plan_turn_async if combined_turns else None
+    if extraction_cache is not None:
+        extractor = extraction_cache.extractor(extractor)
+    if fast_path is not None:
+        # catalog phrases are answered locally; everything else still goes to the LLM
+        extractor = fast_path.extractor(extractor)
+        turn_planner = fast_path.planner(turn_planner) if turn_planner else None
     return ScenarioBuilder(
-        state=ScenarioState(),
-        extractor=llm.extract_fields,
-        question_generator=lambda state, missing: llm.generate_followup(state, missing),
-        final_generator=llm.generate_final,
-        fallback_generator=llm.generate_fallback,
+        state=state or ScenarioState(),
+        # async generators: extraction runs on AsyncOpenAI and never blocks the event loop
+        extractor=extractor,
+        question_generator=llm.generate_followup_async,
+        final_generator=llm.generate_final_async,
+        fallback_generator=llm.generate_fallback_async,
+        turn_planner=turn_planner,
+        speculation=speculation,
         max_attempts=max_attempts,
         fallback_korean_prompt=KOREAN_FALLBACK_MESSAGE,
         logger=logger,
@@ -3,15 +3,30 @@ from __future__ import annotations
 import json
 from typing import Any, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
-from .prompts import build_extraction_prompt, build_fallback_prompt, build_final_prompt, build_followup_prompt
+from .prompts import (
+    build_extraction_prompt,
+    build_fallback_prompt,
+    build_final_prompt,
+    build_followup_prompt,
+    build_turn_prompt,
+)
 from .scenario_state import ScenarioState
 
 
 class OpenAIScenarioLLM:
-    def __init__(self, api_key: str, model: str, logger: Optional[Any] = None) -> None:
-        self._client = OpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        logger: Optional[Any] = None,
+        *,
+        client: Optional[Any] = None,
+        async_client: Optional[Any] = None,
+    ) -> None:
+        self._client = client or OpenAI(api_key=api_key)
+        self._async_client = async_client or AsyncOpenAI(api_key=api_key)
         self._model = model
         self._logger = logger
 
@@ -25,15 +40,39 @@ class OpenAIScenarioLLM:
         return self._create_text_response(prompt)
 
     def generate_final(self, state: ScenarioState) -> str:
-        if not (state.place and state.partner and state.goal):
-            raise ValueError("ScenarioState is incomplete for final response generation")
-        prompt = build_final_prompt(state.place, state.partner, state.goal)
-        return self._create_text_response(prompt)
+        return self._create_text_response(_final_prompt(state))
 
     def generate_fallback(self, state: ScenarioState) -> str:
         prompt = build_fallback_prompt(state.place, state.partner, state.goal)
         return self._create_text_response(prompt)
 
+    def plan_turn(self, state: ScenarioState, user_text: str) -> dict[str, Any]:
+        text = self._create_text_response(_turn_prompt(state, user_text), response_format={"type": "json_object"})
+        return _safe_turn_loads(text)
+
+    async def plan_turn_async(self, state: ScenarioState, user_text: str) -> dict[str, Any]:
+        text = await self._create_text_response_async(
+            _turn_prompt(state, user_text),
+            response_format={"type": "json_object"},
+        )
+        return _safe_turn_loads(text)
+
+    async def extract_fields_async(self, user_text: str) -> dict[str, str | None]:
+        prompt = build_extraction_prompt(user_text)
+        text = await self._create_text_response_async(prompt, response_format={"type": "json_object"})
+        return _safe_json_loads(text)
+
+    async def generate_followup_async(self, state: ScenarioState, missing_fields: list[str]) -> str:
+        prompt = build_followup_prompt(state.place, state.partner, state.goal, missing_fields)
+        return await self._create_text_response_async(prompt)
+
+    async def generate_final_async(self, state: ScenarioState) -> str:
+        return await self._create_text_response_async(_final_prompt(state))
+
+    async def generate_fallback_async(self, state: ScenarioState) -> str:
+        prompt = build_fallback_prompt(state.place, state.partner, state.goal)
+        return await self._create_text_response_async(prompt)
+
     def _create_text_response(
         self,
         prompt: str,
@@ -52,10 +91,7 @@ class OpenAIScenarioLLM:
                     model=self._model,
                     input=prompt,
                 )
-            text = getattr(response, "output_text", None)
-            if isinstance(text, str) and text.strip():
-                return text.strip()
-            return _extract_text_from_response(response)
+            return _response_output_text(response)
 
         if hasattr(self._client, "chat"):
             response = self._client.chat.completions.create(
@@ -66,6 +102,54 @@ class OpenAIScenarioLLM:
 
         raise RuntimeError("OpenAI client does not support responses or chat completions")
 
+    async def _create_text_response_async(
+        self,
+        prompt: str,
+        *,
+        response_format: Optional[dict[str, Any]] = None,
+    ) -> str:
+        if hasattr(self._async_client, "responses"):
+            try:
+                response = await self._async_client.responses.create(
+                    model=self._model,
+                    input=prompt,
+                    response_format=response_format,
+                )
+            except TypeError:
+                response = await self._async_client.responses.create(
+                    model=self._model,
+                    input=prompt,
+                )
+            return _response_output_text(response)
+
+        if hasattr(self._async_client, "chat"):
+            response = await self._async_client.chat.completions.create(
+                model=self._model,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            return response.choices[0].message.content.strip()
+
+        raise RuntimeError("OpenAI client does not support responses or chat completions")
+
+
+def _final_prompt(state: ScenarioState) -> str:
+    if not (state.place and state.partner and state.goal):
+        raise ValueError("ScenarioState is incomplete for final response generation")
+    return build_final_prompt(state.place, state.partner, state.goal)
+
+
+def _turn_prompt(state: ScenarioState, user_text: str) -> str:
+    return build_turn_prompt(
+        user_text, state.place, state.partner, state.goal, state.asked_fields, state.question_order()
+    )
+
+
+def _response_output_text(response: Any) -> str:
+    text = getattr(response, "output_text", None)
+    if isinstance(text, str) and text.strip():
+        return text.strip()
+    return _extract_text_from_response(response)
+
 
 def _safe_json_loads(text: str) -> dict[str, str | None]:
     try:
@@ -81,6 +165,34 @@ def _safe_json_loads(text: str) -> dict[str, str | None]:
     }
 
 
+def _safe_turn_loads(text: str) -> dict[str, Any]:
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        data = _extract_json_from_text(text)
+    if not isinstance(data, dict):
+        data = {}
+    return {
+        "place": _sanitize_field(data.get("place")),
+        "partner": _sanitize_field(data.get("partner")),
+        "goal": _sanitize_goal(data.get("goal")),
+        "question_field": _sanitize_question_field(data.get("question_field")),
+        "next_question": _sanitize_text(data.get("next_question")),
+        "final_message": _sanitize_text(data.get("final_message")),
+    }
+
+
+def _sanitize_question_field(value: Any) -> str | None:
+    return value if value in ("place", "partner", "goal") else None
+
+
+def _sanitize_text(value: Any) -> str | None:
+    if not isinstance(value, str):
+        return None
+    cleaned = value.strip()
+    return cleaned or None
+
+
 def _extract_json_from_text(text: str) -> dict[str, Any] | None:
     start = text.find("{")
     if start == -1:
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+
+
+class LoopStallMonitor:
+    """Heartbeat task that measures how late the event loop wakes it up."""
+
+    def __init__(self, interval_sec: float = 0.01) -> None:
+        self._interval_sec = interval_sec
+        self._task: Optional[asyncio.Task] = None
+        self._lags_ms: list[float] = []
+
+    async def __aenter__(self) -> "LoopStallMonitor":
+        self._task = asyncio.create_task(self._run())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self._interval_sec)
+            self._lags_ms.append(max(0.0, (loop.time() - started - self._interval_sec) * 1000))
+
+    def stats(self) -> dict[str, Any]:
+        lags = sorted(self._lags_ms)
+        if not lags:
+            return {"samples": 0, "max_stall_ms": 0.0, "p99_stall_ms": 0.0, "total_stall_ms": 0.0}
+        return {
+            "samples": len(lags),
+            "max_stall_ms": round(lags[-1], 1),
+            "p99_stall_ms": round(lags[min(len(lags) - 1, int(len(lags) * 0.99))], 1),
+            "total_stall_ms": round(sum(lags), 1),
+        }
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+# scenario sessions are stored through the backend's repository (same DB as chat sessions)
+BACKEND_ROOT = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.append(str(BACKEND_ROOT))
+
+from app.db.database import AsyncSessionLocal
+from app.repositories.chat_repository import ChatRepository
+from app.schemas.chat import SessionCreate
+
+
+async def persist_scenario_state(
+    *,
+    session_id: str,
+    scenario_state: dict[str, Any],
+    title: str,
+    user_id: Optional[int] = None,
+) -> None:
+    now = datetime.now(timezone.utc).isoformat()
+    session_data = SessionCreate(
+        session_id=session_id,
+        title=title,
+        started_at=now,
+        ended_at=now,
+        total_duration_sec=0.0,
+        user_speech_duration_sec=0.0,
+        messages=[],
+        scenario_place=scenario_state.get("place"),
+        scenario_partner=scenario_state.get("partner"),
+        scenario_goal=scenario_state.get("goal"),
+        scenario_state_json=scenario_state,
+        scenario_completed_at=now,
+    )
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        await repo.create_session_log(session_data, user_id=user_id)
+
+
+async def persist_session_title(session_id: str, title: str) -> None:
+    async with AsyncSessionLocal() as db:
+        await ChatRepository(db).update_session_title(session_id, title)
+
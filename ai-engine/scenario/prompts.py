@@ -33,6 +33,34 @@ def build_followup_prompt(
     )
 
 
+def build_turn_prompt(
+    user_text: str,
+    place: str | None,
+    partner: str | None,
+    goal: str | None,
+    asked_fields: Iterable[str],
+    question_order: Iterable[str],
+) -> str:
+    asked = ", ".join(sorted(asked_fields)) or "none"
+    order = ", ".join(question_order)
+    return (
+        "You are a scenario-building agent for English conversation practice.\n"
+        "The field 'partner' means the conversation partner you will speak with (e.g., staff), "
+        "not a travel companion. 'goal' means the conversation purpose (e.g., check-in, order).\n"
+        f"Known: place={place}, partner={partner}, goal={goal}\n"
+        f"Already asked about: {asked}\n"
+        f'User said: "{user_text}"\n'
+        f"Field to ask about next: the first of [{order}] that is still unknown after this utterance\n"
+        "Return JSON only with keys: place, partner, goal, question_field, next_question, final_message.\n"
+        "- place/partner/goal: only what the user explicitly said in this utterance, otherwise null. "
+        "Do not infer or guess.\n"
+        "- question_field: the field to ask about next as described above, or null if all three are known.\n"
+        "- next_question: one short question (max 15 words) about question_field only; null if it is null.\n"
+        "- final_message: if place, partner and goal are all known after this utterance, 1-2 friendly "
+        "English tutor sentences that start the conversation naturally; otherwise null."
+    )
+
+
 def build_final_prompt(place: str, partner: str, goal: str) -> str:
     return (
         "You are a friendly English tutor.\n"
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+from openai import AsyncOpenAI, OpenAI
+
+from .background import BackgroundTaskRunner
+from .catalog_extractor import CatalogFastPath, CatalogIndex
+from .checkpoints import ScenarioCheckpointStore
+from .config import AppConfig
+from .extraction_cache import ExtractionCache
+from .factory import build_scenario_builder
+from .llm_client import OpenAIScenarioLLM
+from .logging_utils import get_logger
+from .realtime_session import RealtimeConfig, RealtimeSessionManager
+from .scenario_builder import ScenarioBuilder
+from .scenario_state import ScenarioState
+from .session_pool import RealtimeSessionPool
+from .speculation import SpeculationMetrics
+from .tts_cache import TtsCache, get_tts_cache, prewarm_tts_cache
+
+
+@dataclass
+class ScenarioRuntime:
+    """Process-wide config and OpenAI clients shared by every scenario connection.
+
+    The SDK clients keep their own HTTP connection pools, so reusing them across
+    connections skips the env/settings read and the TCP/TLS setup per learner.
+    """
+
+    config: AppConfig
+    client: Any
+    async_client: Any
+    tts_cache: TtsCache = field(default_factory=get_tts_cache)
+    session_pool: Optional[RealtimeSessionPool] = None
+    fast_path: CatalogFastPath = field(default_factory=CatalogFastPath)
+    extraction_cache: ExtractionCache = field(default_factory=ExtractionCache)
+    speculation: SpeculationMetrics = field(default_factory=SpeculationMetrics)
+    background: BackgroundTaskRunner = field(default_factory=BackgroundTaskRunner)
+    checkpoints: ScenarioCheckpointStore = field(default_factory=ScenarioCheckpointStore)
+
+    def __post_init__(self) -> None:
+        if self.session_pool is None:
+            self.session_pool = RealtimeSessionPool(
+                self.session_manager(), min_size=self.config.session_pool_min_size
+            )
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> "ScenarioRuntime":
+        return cls(
+            config=config,
+            client=OpenAI(api_key=config.api_key),
+            async_client=AsyncOpenAI(api_key=config.api_key),
+        )
+
+    def realtime_config(self) -> RealtimeConfig:
+        return RealtimeConfig(
+            api_key=self.config.api_key,
+            model=self.config.realtime_model,
+            max_retries=self.config.max_retries,
+        )
+
+    def session_manager(self) -> RealtimeSessionManager:
+        return RealtimeSessionManager(self.realtime_config(), client=self.client, async_client=self.async_client)
+
+    def llm(self, logger: Optional[Any] = None) -> OpenAIScenarioLLM:
+        return OpenAIScenarioLLM(
+            api_key=self.config.api_key,
+            model=self.config.llm_model,
+            logger=logger,
+            client=self.client,
+            async_client=self.async_client,
+        )
+
+    def scenario_builder(self, logger: Optional[Any] = None, state: Optional[ScenarioState] = None) -> ScenarioBuilder:
+        """Builder wired with the shared LLM clients, caches and the configured turn strategy."""
+        config = self.config
+        return build_scenario_builder(
+            api_key=config.api_key,
+            model=config.llm_model,
+            max_attempts=config.max_attempts,
+            logger=logger,
+            llm=self.llm(logger),
+            combined_turns=config.combined_turns,
+            fast_path=self.fast_path if config.catalog_fast_path else None,
+            extraction_cache=self.extraction_cache,
+            speculation=self.speculation if config.speculative_followups else None,
+            state=state,
+        )
+
+    def load_catalog(self, definitions: Iterable[Any]) -> None:
+        self.fast_path.index = CatalogIndex.from_definitions(definitions)
+
+    async def prewarm(self) -> int:
+        fetched = await prewarm_tts_cache(self.tts_cache, self.async_client)
+        get_logger("providers").info("TTS cache prewarmed (%s fetched): %s", fetched, self.tts_cache.stats())
+        return fetched
+
+    async def aclose(self) -> None:
+        await self.session_pool.stop()
+        # let in-flight title updates finish before the clients go away
+        await self.background.drain()
+        close = getattr(self.async_client, "close", None)
+        if close is not None:
+            await close()
+        close = getattr(self.client, "close", None)
+        if close is not None:
+            close()
+
+
+_runtime: Optional[ScenarioRuntime] = None
+
+
+def get_scenario_runtime() -> ScenarioRuntime:
+    """Shared runtime, built from the environment on first use."""
+    global _runtime
+    if _runtime is None:
+        _runtime = ScenarioRuntime.from_config(AppConfig.from_env())
+    return _runtime
+
+
+def set_scenario_runtime(runtime: Optional[ScenarioRuntime]) -> None:
+    global _runtime
+    _runtime = runtime
+
+
+async def start_scenario_runtime(
+    prewarm: bool = True,
+    catalog: Optional[Iterable[Any]] = None,
+) -> Optional[ScenarioRuntime]:
+    """Startup hook. Returns None (and logs) when no API key is configured."""
+    try:
+        runtime = get_scenario_runtime()
+    except RuntimeError as exc:
+        get_logger("providers").warning("Scenario runtime not started: %s", exc)
+        return None
+    if catalog is not None:
+        runtime.load_catalog(catalog)
+    runtime.session_pool.start()
+    if prewarm:
+        await runtime.prewarm()
+    return runtime
+
+
+async def close_scenario_runtime() -> None:
+    global _runtime
+    runtime, _runtime = _runtime, None
+    if runtime is not None:
+        await runtime.aclose()
@@ -4,61 +4,68 @@ import asyncio
 import base64
 import binascii
 import json
-from io import BytesIO
-import wave
 import uuid
 from typing import Any, Awaitable, Callable, Optional
-from datetime import datetime, timezone
-import sys
-from pathlib import Path
 
 import websockets
-from openai import OpenAI
+from realtime_common.link_quality import LinkQualityEstimator
 
-from .config import AppConfig
-from .realtime_handlers import fanout_event_handler
+from .realtime_handlers import HandlerSpec, fanout_event_handler
 from .realtime_pipeline import RealtimeScenarioPipeline
-from .realtime_session import RealtimeConfig, RealtimeSessionManager, RealtimeWebSocketClient
+from .realtime_session import RealtimeWebSocketClient, SessionHandshake
+from .replay import HeldInput, build_scenario_replay
+from .audio_pacing import PACING_MODES, PACING_REALTIME, AudioPacer, send_pcm16_audio
+from .tts import TTS_SAMPLE_RATE, TtsMetrics
+from .titles import build_session_title, refine_session_title
+from .tts_cache import cached_tts_pcm16
+from .providers import ScenarioRuntime, close_scenario_runtime, get_scenario_runtime, start_scenario_runtime
 from .audio_relay import RealtimeAudioRelay
 from .fallbacks import build_realtime_error_handler
-from .factory import build_scenario_builder
 from .logging_utils import get_logger
+from .persistence import persist_scenario_state, persist_session_title
 from .scenario_builder import ScenarioBuilder
 
 ClientSender = Callable[[dict[str, Any]], Awaitable[None]]
 
-BACKEND_ROOT = Path(__file__).resolve().parents[2] / "backend"
-if str(BACKEND_ROOT) not in sys.path:
-    sys.path.append(str(BACKEND_ROOT))
-
-from app.db.database import AsyncSessionLocal
-from app.repositories.chat_repository import ChatRepository
-from app.schemas.chat import SessionCreate
-
 
 async def relay_server(host: str, port: int, stop_event: Optional[asyncio.Event] = None) -> None:
     async def handler(client_ws):
         await handle_client(client_ws)
 
-    async with websockets.serve(handler, host, port):
-        logger = get_logger("realtime_bridge")
-        logger.info("Realtime relay listening on ws://%s:%s", host, port)
-        if stop_event is None:
-            await asyncio.Future()
-        else:
-            await stop_event.wait()
+    prewarm_task = asyncio.create_task(start_scenario_runtime())
+    try:
+        async with websockets.serve(handler, host, port):
+            logger = get_logger("realtime_bridge")
+            logger.info("Realtime relay listening on ws://%s:%s", host, port)
+            if stop_event is None:
+                await asyncio.Future()
+            else:
+                await stop_event.wait()
+    finally:
+        prewarm_task.cancel()
+        await close_scenario_runtime()
 
 
-async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
+async def handle_client(
+    client_ws,
+    user_id: Optional[int] = None,
+    pacing: Optional[str] = None,
+    resume_token: Optional[str] = None,
+) -> None:
     logger = get_logger("realtime_bridge")
     client_peer = getattr(client_ws, "remote_address", None)
     client_id = _new_client_id()
     logger.info("Client connected [%s]: %s", client_id, client_peer)
 
-    config = AppConfig.from_env()
-    session_info = RealtimeSessionManager(
-        RealtimeConfig(api_key=config.api_key, model=config.realtime_model, max_retries=config.max_retries)
-    ).create_session()
+    runtime = get_scenario_runtime()
+    config = runtime.config
+    # reconnect with a resume token: restore the builder instead of starting over
+    checkpoint = runtime.checkpoints.load(resume_token, user_id=user_id)
+    if resume_token and checkpoint is None:
+        logger.info("Resume token not usable [%s]; starting a new scenario", client_id)
+    resume_token = checkpoint.token if checkpoint else runtime.checkpoints.new_token()
+    # pre-minted ephemeral session; minted on demand (without blocking the loop) when the pool is empty
+    session_info = await runtime.session_pool.acquire()
 
     use_server_vad = True
     session_config = {
@@ -85,8 +92,10 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         max_retries=config.max_retries,
     )
 
+    link = LinkQualityEstimator()
+
     async def send_to_client(payload: dict[str, Any]) -> None:
-        await client_ws.send(json.dumps(payload))
+        await link.timed_send(client_ws.send, json.dumps(payload))
 
     state = {
         "has_audio": False,
@@ -94,9 +103,24 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         "sample_rate": 24000,
         "speaking": False,
         "completed_sent": False,
-        "user_transcripts": [],
+        "user_transcripts": list(checkpoint.transcripts) if checkpoint else [],
+        # the checkpoint version this connection last loaded or saved
+        "checkpoint": checkpoint,
+        "held_input": HeldInput(),
     }
 
+    def replay_scenario_state() -> list[dict[str, Any]]:
+        # audio.done never arrives for a response cut off by the drop
+        state["speaking"] = False
+        return build_scenario_replay(builder.state, state["user_transcripts"]) + state["held_input"].drain()
+
+    async def notify_reconnect(status: str) -> None:
+        # reconnecting: client input is held until recovered
+        await send_to_client({"type": f"session.{status}"})
+
+    openai_client.set_replay_provider(replay_scenario_state)
+    openai_client.set_reconnect_handler(notify_reconnect)
+
     async def on_transcript(text: str, is_final: bool) -> None:
         payload = {
             "type": "response.audio_transcript.done" if is_final else "response.audio_transcript.delta",
@@ -110,18 +134,18 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         on_transcript=on_transcript,
     )
 
-    builder = build_scenario_builder(
-        api_key=config.api_key,
-        model=config.llm_model,
-        max_attempts=config.max_attempts,
-        logger=logger,
-    )
+    builder = runtime.scenario_builder(logger, state=checkpoint.restore_state() if checkpoint else None)
 
-    tts_client = OpenAI(api_key=config.api_key)
+    tts_metrics = TtsMetrics()
+    tts_cache = runtime.tts_cache
+    # client query overrides the server default; unknown values fall back to realtime
+    pacing_mode = next((mode for mode in (pacing, config.audio_pacing) if mode in PACING_MODES), PACING_REALTIME)
+    pacer = AudioPacer(pacing_mode, lead_ms=config.audio_lead_ms)
 
     async def send_response(text: str) -> None:
-        audio_bytes, sample_rate = await asyncio.to_thread(_tts_pcm16_from_text, tts_client, text)
-        await _send_pcm16_audio(send_to_client, audio_bytes, sample_rate=sample_rate)
+        # fixed phrases come from the cache; anything else streams while it is synthesized
+        audio = await cached_tts_pcm16(tts_cache, runtime.async_client, text, metrics=tts_metrics)
+        await send_pcm16_audio(send_to_client, audio, sample_rate=TTS_SAMPLE_RATE, link=link, pacer=pacer)
         if not state.get("completed_sent"):
             await send_to_client(
                 {
@@ -130,33 +154,30 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
                 }
             )
 
+    def save_checkpoint(scenario_builder: ScenarioBuilder) -> None:
+        state["checkpoint"] = runtime.checkpoints.save(
+            resume_token, scenario_builder.state, state["user_transcripts"], user_id=user_id
+        )
+
     async def on_complete(scenario_builder: ScenarioBuilder) -> None:
+        runtime.checkpoints.discard(resume_token)
         session_id = state.get("session_id")
         if not session_id:
             session_id = str(uuid.uuid4())
             state["session_id"] = session_id
         scenario_builder.ensure_defaults()
         state_snapshot = scenario_builder.state
-        scenario_state_payload = {
-            "place": state_snapshot.place,
-            "partner": state_snapshot.partner,
-            "goal": state_snapshot.goal,
-            "attempts": state_snapshot.attempts,
-            "asked_fields": sorted(list(state_snapshot.asked_fields)),
-            "completed": state_snapshot.completed,
-        }
+        scenario_state_payload = state_snapshot.to_dict()
+        saved = False
         try:
-            title = await _generate_session_title(
-                config,
-                scenario_state=scenario_state_payload,
-                transcripts=state.get("user_transcripts", []),
-            )
-            await _persist_scenario_state(
+            # placeholder title; the LLM title is generated after completion is sent
+            await persist_scenario_state(
                 session_id=session_id,
                 scenario_state=scenario_state_payload,
-                title=title,
+                title=build_session_title(scenario_state_payload),
                 user_id=user_id,
             )
+            saved = True
         except Exception as exc:
             logger.error("Scenario save failed [%s]: %s", client_id, exc)
             await send_to_client(
@@ -179,39 +200,60 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
             }
         )
         state["completed_sent"] = True
+        if saved:
+            runtime.background.spawn(
+                refine_session_title(
+                    runtime.async_client,
+                    config.llm_model,
+                    scenario_state=scenario_state_payload,
+                    transcripts=list(state.get("user_transcripts", [])),
+                    persist=lambda title: persist_session_title(session_id, title),
+                    notify=lambda title: notify_title_updated(session_id, title),
+                ),
+                name=f"session-title-{client_id}",
+            )
         await openai_client.close()
 
+    async def notify_title_updated(session_id: str, title: str) -> None:
+        if state.get("client_closed"):
+            return
+        try:
+            await send_to_client({"type": "session.title_updated", "sessionId": session_id, "title": title})
+        except Exception as exc:
+            logger.info("Title update not delivered [%s]: %s", client_id, exc)
+
     pipeline = RealtimeScenarioPipeline(
         builder,
         send_response,
         on_complete=on_complete,
         send_final_response=False,
+        on_turn=save_checkpoint,
     )
     async def forward_user_transcript(event: dict[str, Any]) -> None:
-        event_type = event.get("type", "")
-        if event_type in (
-            "input_audio_buffer.transcription.completed",
-            "conversation.item.input_audio_transcription.completed",
-        ):
-            transcript = event.get("transcript")
-            if isinstance(transcript, str) and transcript.strip():
-                if builder.state.completed:
-                    return
-                await send_to_client({"type": "input_audio.transcript", "transcript": transcript})
+        transcript = _user_transcript(event)
+        if transcript and not builder.state.completed:
+            await send_to_client({"type": "input_audio.transcript", "transcript": transcript})
+
+    async def run_pipeline(event: dict[str, Any]) -> None:
+        transcript = _user_transcript(event)
+        # the text mode takes the same lock: a typed turn on this token is picked up, not overwritten
+        async with runtime.checkpoints.lock(resume_token):
+            newer = runtime.checkpoints.changed_since(resume_token, state["checkpoint"])
+            if newer is not None:
+                builder.restore(newer.restore_state())
+                state["user_transcripts"] = list(newer.transcripts)
+                state["checkpoint"] = newer
+            # recorded in the pipeline's own lane so on_turn checkpoints and on_complete always include it
+            if transcript and not builder.state.completed:
                 state["user_transcripts"].append(transcript)
+            await pipeline.handle_event(event)
 
-    ready_event = asyncio.Event()
-    session_ready = {"updated": False, "cleared": False}
+    handshake = SessionHandshake(openai_client.send_event)
+    ready_event = handshake.ready
 
     async def log_event_type(event: dict[str, Any]) -> None:
         event_type = event.get("type", "unknown")
-        if event_type == "session.updated":
-            session_ready["updated"] = True
-            await openai_client.send_event({"type": "input_audio_buffer.clear"})
-        if event_type == "input_audio_buffer.cleared":
-            session_ready["cleared"] = True
-        if session_ready["updated"] and session_ready["cleared"]:
-            ready_event.set()
+        await handshake.handle_event(event)
         if event_type == "error":
             logger.error("OpenAI error [%s]: %s", client_id, event)
         if event_type == "response.audio.delta":
@@ -219,12 +261,18 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         if event_type == "response.audio.done":
             state["speaking"] = False
 
-    openai_client.set_event_handler(
-        fanout_event_handler(
-            [log_event_type, audio_relay.handle_event, forward_user_transcript, pipeline.handle_event]
-        )
+    # one queue and task per handler: audio deltas never wait behind the pipeline's LLM calls
+    fanout = fanout_event_handler(
+        [
+            HandlerSpec(log_event_type, name="log_event_type", max_queue=1024),
+            HandlerSpec(audio_relay.handle_event, name="audio_relay", max_queue=1024),
+            HandlerSpec(forward_user_transcript, name="forward_user_transcript", accepts=_is_user_input_event),
+            HandlerSpec(run_pipeline, name="pipeline", accepts=_is_user_input_event),
+        ],
+        logger=logger,
     )
-    openai_client.set_error_handler(build_realtime_error_handler(send_to_client))
+    openai_client.set_event_handler(fanout)
+    openai_client.set_error_handler(build_realtime_error_handler(send_response))
 
     openai_task = asyncio.create_task(openai_client.connect_and_run())
     connected = await openai_client.wait_until_connected(timeout=10.0)
@@ -232,41 +280,69 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         await client_ws.send(json.dumps({"type": "error", "message": "Realtime connection timeout"}))
         await openai_client.close()
         openai_task.cancel()
+        await fanout.aclose()
         return
     ready = await _wait_ready(ready_event, timeout=10.0)
     if not ready:
         await client_ws.send(json.dumps({"type": "error", "message": "Realtime session not ready"}))
         await openai_client.close()
         openai_task.cancel()
+        await fanout.aclose()
         return
     await client_ws.send(json.dumps({"type": "ready"}))
-
-    # [Trigger] 강제 발화 유도: "Let's start" 가짜 사용자 메시지 주입
-    logger.info("Triggering AI First Turn with 'Let's start'")
-    await openai_client.send_event({
-        "type": "conversation.item.create",
-        "item": {
-            "type": "message",
-            "role": "user",
-            "content": [
-                {
-                    "type": "input_text",
-                    "text": "Let's start" 
-                }
-            ]
-        }
-    })
-    await openai_client.send_event({
-        "type": "response.create",
-        "response": {
-            "modalities": ["audio", "text"]
-        }
-    })
+    await send_to_client({"type": "session.resumable", "resumeToken": resume_token, "resumed": checkpoint is not None})
+    ping_task = asyncio.create_task(link.ping_loop(send_to_client))
+
+    resume_question = builder.resume_question() if checkpoint else None
+    if resume_question is not None:
+        # [Resume] 재접속: 첫 인사 대신 이미 정해진 내용을 업스트림에 전달하고 다음 빈 필드를 바로 질문
+        logger.info("Resuming scenario [%s]: %s", client_id, builder.state.to_dict())
+        for event in build_scenario_replay(builder.state, state["user_transcripts"]):
+            await openai_client.send_event(event)
+        await send_response(resume_question)
+    else:
+        # [Trigger] 강제 발화 유도: "Let's start" 가짜 사용자 메시지 주입
+        logger.info("Triggering AI First Turn with 'Let's start'")
+        await openai_client.send_event({
+            "type": "conversation.item.create",
+            "item": {
+                "type": "message",
+                "role": "user",
+                "content": [
+                    {
+                        "type": "input_text",
+                        "text": "Let's start" 
+                    }
+                ]
+            }
+        })
+        await openai_client.send_event({
+            "type": "response.create",
+            "response": {
+                "modalities": ["audio", "text"]
+            }
+        })
     try:
         async for message in client_ws:
             # logger.info("Client event: %s", _safe_event_type(message))
-            await handle_client_message(message, openai_client, state, use_server_vad)
+            await handle_client_message(message, openai_client, state, use_server_vad, link=link)
     finally:
+        state["client_closed"] = True
+        ping_task.cancel()
+        logger.info("Network quality [%s]: %s", client_id, link.stats())
+        logger.info("Upstream reconnects [%s]: %s", client_id, openai_client.recovery_log.stats())
+        logger.info("Held input [%s]: %s", client_id, state["held_input"].stats())
+        logger.info("TTS streaming [%s]: %s", client_id, tts_metrics.stats())
+        logger.info("TTS cache [%s]: %s", client_id, tts_cache.stats())
+        logger.info("Realtime session pool [%s]: %s", client_id, runtime.session_pool.stats())
+        logger.info("Catalog fast path [%s]: %s", client_id, runtime.fast_path.stats())
+        logger.info("Extraction cache [%s]: %s", client_id, runtime.extraction_cache.stats())
+        logger.info("Scenario checkpoints [%s]: %s", client_id, runtime.checkpoints.stats())
+        if config.speculative_followups:
+            logger.info("Speculative follow-ups [%s]: %s", client_id, runtime.speculation.stats())
+        logger.info("Audio pacing [%s]: %s", client_id, pacer.stats())
+        await fanout.aclose()
+        logger.info("Event handlers [%s]: %s", client_id, fanout.stats())
         await openai_client.close()
         openai_task.cancel()
 
@@ -276,6 +352,7 @@ async def handle_client_message(
     openai_client: RealtimeWebSocketClient,
     state: dict[str, bool],
     use_server_vad: bool,
+    link: Optional[LinkQualityEstimator] = None,
 ) -> None:
     try:
         payload = json.loads(message)
@@ -283,6 +360,10 @@ async def handle_client_message(
         return
 
     msg_type = payload.get("type")
+    if msg_type == "pong":
+        if link is not None:
+            link.handle_pong(payload)
+        return
     if msg_type == "input_audio_chunk":
         if state.get("speaking"):
             return
@@ -297,7 +378,7 @@ async def handle_client_message(
                 return
             if not audio_bytes:
                 return
-            await openai_client.send_event({"type": "input_audio_buffer.append", "audio": audio})
+            await _send_or_hold(openai_client, state, {"type": "input_audio_buffer.append", "audio": audio})
             state["has_audio"] = True
             state["total_bytes"] += len(audio_bytes)
         return
@@ -310,20 +391,20 @@ async def handle_client_message(
             sample_rate = state.get("sample_rate", 24000)
             min_bytes = int(sample_rate * 0.1 * 2)
             if state.get("total_bytes", 0) >= min_bytes:
-                await openai_client.send_event({"type": "input_audio_buffer.commit"})
+                await _send_or_hold(openai_client, state, {"type": "input_audio_buffer.commit"})
             state["has_audio"] = False
             state["total_bytes"] = 0
         return
     if msg_type == "input_audio_clear":
         if not state.get("has_audio") and state.get("total_bytes", 0) == 0:
-            await openai_client.send_event({"type": "input_audio_buffer.clear"})
+            await _send_or_hold(openai_client, state, {"type": "input_audio_buffer.clear"})
         else:
             return
     if msg_type == "text":
         text = payload.get("text")
         if isinstance(text, str) and text.strip():
             state.setdefault("user_transcripts", []).append(text.strip())
-            await openai_client.send_event(
+            await _send_or_hold(openai_client, state, 
                 {
                     "type": "conversation.item.create",
                     "item": {
@@ -339,39 +420,21 @@ async def handle_client_message(
     return
 
 
-def _tts_pcm16_from_text(client: OpenAI, text: str) -> tuple[bytes, int]:
-    response = client.audio.speech.create(
-        model="gpt-4o-mini-tts",
-        voice="alloy",
-        input=text,
-        response_format="wav",
-    )
-    wav_bytes = response.read()
-    if not wav_bytes:
-        return b"", 24000
-    with wave.open(BytesIO(wav_bytes), "rb") as wav:
-        if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
-            return b"", wav.getframerate()
-        return wav.readframes(wav.getnframes()), wav.getframerate()
-
-
-async def _send_pcm16_audio(send_to_client, audio_bytes: bytes, sample_rate: int) -> None:
-    if not audio_bytes:
+async def _send_or_hold(
+    openai_client: RealtimeWebSocketClient, state: dict[str, Any], event: dict[str, Any]
+) -> None:
+    held_input = state.get("held_input")
+    if held_input is None:
+        await openai_client.send_event(event)
         return
-    chunk_ms = 100
-    chunk_size = int(sample_rate * (chunk_ms / 1000.0) * 2)
-    for offset in range(0, len(audio_bytes), chunk_size):
-        chunk = audio_bytes[offset : offset + chunk_size]
-        payload = {
-            "type": "response.audio.delta",
-            "delta": base64.b64encode(chunk).decode("ascii"),
-            "sample_rate": sample_rate,
-        }
-        await send_to_client(payload)
-        await asyncio.sleep(chunk_ms / 1000.0)
-    await send_to_client({"type": "response.audio.done"})
-
-
+    if openai_client.is_connected:
+        try:
+            await openai_client.send_event(event)
+            return
+        except Exception:
+            # the drop has not been noticed by the reader yet; replay after recovery
+            pass
+    held_input.hold(event)
 
 
 async def _wait_ready(event: asyncio.Event, timeout: float) -> bool:
@@ -382,128 +445,21 @@ async def _wait_ready(event: asyncio.Event, timeout: float) -> bool:
         return False
 
 
-def _new_client_id() -> str:
-    return uuid.uuid4().hex[:8]
+def _is_user_input_event(event: dict[str, Any]) -> bool:
+    # transcription and conversation.item events; deltas and response.* never reach the pipeline queue
+    event_type = event.get("type", "")
+    return event_type.startswith(("conversation.item", "input_audio_buffer.transcription"))
 
 
-async def _persist_scenario_state(
-    *,
-    session_id: str,
-    scenario_state: dict[str, Any],
-    title: str,
-    user_id: Optional[int] = None,
-) -> None:
-    now = datetime.now(timezone.utc).isoformat()
-    session_data = SessionCreate(
-        session_id=session_id,
-        title=title,
-        started_at=now,
-        ended_at=now,
-        total_duration_sec=0.0,
-        user_speech_duration_sec=0.0,
-        messages=[],
-        scenario_place=scenario_state.get("place"),
-        scenario_partner=scenario_state.get("partner"),
-        scenario_goal=scenario_state.get("goal"),
-        scenario_state_json=scenario_state,
-        scenario_completed_at=now,
-    )
-    async with AsyncSessionLocal() as db:
-        repo = ChatRepository(db)
-        await repo.create_session_log(session_data, user_id=user_id)
-
-async def _generate_session_title(
-    config: AppConfig,
-    *,
-    scenario_state: dict[str, Any],
-    transcripts: list[str],
-) -> str:
-    prompt = _build_title_prompt(scenario_state, transcripts)
-    try:
-        title = await asyncio.to_thread(
-            _request_title,
-            config.api_key,
-            config.llm_model,
-            prompt,
-        )
-    except Exception:
-        return _build_session_title(scenario_state)
-    return _normalize_title(title, fallback=_build_session_title(scenario_state))
-
-
-def _build_title_prompt(scenario_state: dict[str, Any], transcripts: list[str]) -> str:
-    place = scenario_state.get("place") or "unknown"
-    partner = scenario_state.get("partner") or "unknown"
-    goal = scenario_state.get("goal") or "unknown"
-    transcript_text = " ".join(transcripts[-6:]) if transcripts else ""
-    return (
-        "Create a concise English conversation title (max 50 characters). "
-        "Base it on the user's conversation and the scenario context. "
-        "Return only the title, no quotes.\n\n"
-        f"Scenario: place={place}, partner={partner}, goal={goal}\n"
-        f"User conversation: {transcript_text}"
-    )
+def _user_transcript(event: dict[str, Any]) -> Optional[str]:
+    if event.get("type") not in (
+        "input_audio_buffer.transcription.completed",
+        "conversation.item.input_audio_transcription.completed",
+    ):
+        return None
+    transcript = event.get("transcript")
+    return transcript if isinstance(transcript, str) and transcript.strip() else None
 
 
-def _request_title(api_key: str, model: str, prompt: str) -> str:
-    client = OpenAI(api_key=api_key)
-    if hasattr(client, "responses"):
-        try:
-            response = client.responses.create(
-                model=model,
-                input=prompt,
-                temperature=0.7,
-            )
-        except TypeError:
-            response = client.responses.create(
-                model=model,
-                input=prompt,
-            )
-        text = getattr(response, "output_text", None)
-        if isinstance(text, str) and text.strip():
-            return text.strip()
-        return _extract_text_from_response(response)
-    if hasattr(client, "chat"):
-        response = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-        )
-        return response.choices[0].message.content.strip()
-    raise RuntimeError("OpenAI client does not support responses or chat completions")
-
-
-def _extract_text_from_response(response: Any) -> str:
-    output = getattr(response, "output", None)
-    if not output:
-        return ""
-    for item in output:
-        content = getattr(item, "content", None)
-        if not content:
-            continue
-        for part in content:
-            text = getattr(part, "text", None)
-            if isinstance(text, str) and text.strip():
-                return text.strip()
-    return ""
-
-
-def _normalize_title(title: str, *, fallback: str) -> str:
-    cleaned = title.replace("\n", " ").strip().strip("\"'")
-    if not cleaned:
-        return fallback
-    if len(cleaned) > 50:
-        cleaned = cleaned[:50].rstrip()
-    return cleaned
-
-
-def _build_session_title(scenario_state: dict[str, Any]) -> str:
-    parts = [
-        scenario_state.get("place"),
-        scenario_state.get("partner"),
-        scenario_state.get("goal"),
-    ]
-    cleaned = [part.strip() for part in parts if isinstance(part, str) and part.strip()]
-    if not cleaned:
-        return "Conversation"
-    return " / ".join(cleaned)
+def _new_client_id() -> str:
+    return uuid.uuid4().hex[:8]
@@ -1,18 +1,151 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Awaitable, Callable, Iterable, Union
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
 
 EventHandler = Callable[[dict[str, Any]], Union[Awaitable[None], None]]
+EventFilter = Callable[[dict[str, Any]], bool]
 
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+DEFAULT_MAX_QUEUE = 256
 
-def fanout_event_handler(handlers: Iterable[EventHandler]) -> EventHandler:
-    handler_list = [handler for handler in handlers if handler is not None]
 
-    async def _handler(event: dict[str, Any]) -> None:
-        for handler in handler_list:
-            result = handler(event)
-            if asyncio.iscoroutine(result):
-                await result
+@dataclass(frozen=True)
+class HandlerSpec:
+    handler: EventHandler
+    name: Optional[str] = None
+    max_queue: int = DEFAULT_MAX_QUEUE
+    # "block" waits for room (backpressure on the upstream reader); "drop_oldest" sheds stale events
+    overflow: str = OVERFLOW_BLOCK
+    accepts: Optional[EventFilter] = None
 
-    return _handler
+
+class _HandlerLane:
+    def __init__(self, spec: HandlerSpec, logger: logging.Logger) -> None:
+        self.spec = spec
+        self.name = spec.name or getattr(spec.handler, "__qualname__", repr(spec.handler))
+        self.queue: asyncio.Queue[tuple[float, dict[str, Any]]] = asyncio.Queue(maxsize=spec.max_queue)
+        self.task: Optional[asyncio.Task[None]] = None
+        self._logger = logger
+
+        self.handled = 0
+        self.errors = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.wait_ms_total = 0.0
+        self.max_wait_ms = 0.0
+        self.run_ms_total = 0.0
+        self.max_run_ms = 0.0
+
+    async def offer(self, event: dict[str, Any]) -> None:
+        if self.spec.accepts is not None and not self.spec.accepts(event):
+            return
+        item = (time.perf_counter(), event)
+        if self.queue.full():
+            if self.spec.overflow == OVERFLOW_DROP_OLDEST:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.dropped += 1
+            else:
+                await self.queue.put(item)
+                self._track_depth()
+                return
+        self.queue.put_nowait(item)
+        self._track_depth()
+
+    def _track_depth(self) -> None:
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    async def run(self) -> None:
+        while True:
+            enqueued_at, event = await self.queue.get()
+            started = time.perf_counter()
+            try:
+                result = self.spec.handler(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                # one failing handler must not stop the others or the upstream reader
+                self.errors += 1
+                self._logger.exception("Event handler %s failed on %s: %s", self.name, event.get("type"), exc)
+            finally:
+                finished = time.perf_counter()
+                self.queue.task_done()
+            self.handled += 1
+            wait_ms = (started - enqueued_at) * 1000
+            run_ms = (finished - started) * 1000
+            self.wait_ms_total += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            self.run_ms_total += run_ms
+            self.max_run_ms = max(self.max_run_ms, run_ms)
+
+    def stats(self) -> dict[str, Any]:
+        handled = self.handled or 1
+        return {
+            "handled": self.handled,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "max_depth": self.max_depth,
+            "avg_wait_ms": round(self.wait_ms_total / handled, 2),
+            "max_wait_ms": round(self.max_wait_ms, 2),
+            "avg_run_ms": round(self.run_ms_total / handled, 2),
+            "max_run_ms": round(self.max_run_ms, 2),
+        }
+
+
+class EventFanout:
+    """Delivers each upstream event to every handler through its own ordered queue.
+
+    Every handler runs in its own task, so a slow one (the scenario pipeline
+    waiting on the LLM) never delays another (the audio relay). Order is kept
+    per handler, exceptions are logged per handler, and each queue has its own
+    bound and overflow policy.
+    """
+
+    def __init__(self, handlers: Iterable[Union[EventHandler, HandlerSpec, None]], logger: Optional[logging.Logger] = None) -> None:
+        self._logger = logger or logging.getLogger(__name__)
+        self._lanes = [
+            _HandlerLane(item if isinstance(item, HandlerSpec) else HandlerSpec(item), self._logger)
+            for item in handlers
+            if item is not None
+        ]
+        self._closed = False
+
+    async def __call__(self, event: dict[str, Any]) -> None:
+        if self._closed:
+            return
+        for lane in self._lanes:
+            if lane.task is None:
+                lane.task = asyncio.create_task(lane.run())
+            await lane.offer(event)
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        await asyncio.gather(*(lane.queue.join() for lane in self._lanes if lane.task is not None))
+
+    async def aclose(self, timeout: float = 1.0) -> None:
+        self._closed = True
+        try:
+            await asyncio.wait_for(self.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        tasks = [lane.task for lane in self._lanes if lane.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {lane.name: lane.stats() for lane in self._lanes}
+
+
+def fanout_event_handler(
+    handlers: Iterable[Union[EventHandler, HandlerSpec, None]],
+    logger: Optional[logging.Logger] = None,
+) -> EventFanout:
+    return EventFanout(handlers, logger=logger)
@@ -6,6 +6,7 @@ from .scenario_builder import ScenarioBuilder
 
 SendResponse = Callable[[str], Any]
 OnComplete = Callable[[ScenarioBuilder], Any]
+OnTurn = Callable[[ScenarioBuilder], Any]
 
 
 class RealtimeScenarioPipeline:
@@ -17,12 +18,14 @@ class RealtimeScenarioPipeline:
         max_attempts: int = 3,
         on_complete: Optional[OnComplete] = None,
         send_final_response: bool = True,
+        on_turn: Optional[OnTurn] = None,
     ) -> None:
         self._builder = builder
         self._send_response = send_response
         self._max_attempts = max_attempts
         self._on_complete = on_complete
         self._send_final_response = send_final_response
+        self._on_turn = on_turn
 
     async def handle_event(self, event: dict[str, Any]) -> None:
         if self._builder.state.completed:
@@ -30,27 +33,44 @@ class RealtimeScenarioPipeline:
         user_text = self._extract_user_text(event)
         if not user_text:
             return
+        await self.handle_text(user_text)
 
-        self._builder.ingest_user_text(user_text)
+    async def handle_text(self, user_text: str) -> None:
+        """One learner turn from text that is already extracted (transcripts or typed input)."""
+        if self._builder.state.completed:
+            return
+        question: Optional[str] = None
+        if self._builder.plans_turns:
+            # combined mode: extraction and the next question arrive in one response
+            question = await self._builder.plan_turn_async(user_text)
+        elif self._builder.speculates:
+            # candidate questions are generated while extraction runs
+            question = await self._builder.ingest_and_follow_up_async(user_text)
+        else:
+            await self._builder.ingest_user_text_async(user_text)
         if self._builder.state.is_complete():
             if self._send_final_response:
-                await self._maybe_await(self._send_response(self._builder.finalize_scenario()))
+                await self._maybe_await(self._send_response(await self._builder.finalize_scenario_async()))
             if self._on_complete:
                 await self._maybe_await(self._on_complete(self._builder))
             return
 
-        question = self._builder.build_follow_up_question()
+        if not (self._builder.plans_turns or self._builder.speculates):
+            question = await self._builder.build_follow_up_question_async()
         if question is None:
             if self._builder.state.attempts >= self._max_attempts:
                 if self._send_final_response:
-                    await self._maybe_await(self._send_response(self._builder.finalize_with_fallback()))
+                    await self._maybe_await(self._send_response(await self._builder.finalize_with_fallback_async()))
             else:
                 if self._send_final_response:
-                    await self._maybe_await(self._send_response(self._builder.finalize_scenario()))
+                    await self._maybe_await(self._send_response(await self._builder.finalize_scenario_async()))
             if self._on_complete:
                 await self._maybe_await(self._on_complete(self._builder))
             return
 
+        if self._on_turn:
+            # before the reply is spoken: a drop during TTS still resumes from this turn
+            await self._maybe_await(self._on_turn(self._builder))
         await self._maybe_await(self._send_response(question))
 
     def _extract_user_text(self, event: dict[str, Any]) -> Optional[str]:
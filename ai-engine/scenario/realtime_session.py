@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Optional, Union
 
 from openai import OpenAI
+from realtime_common.reconnect import ReconnectPolicy
 
 try:
     import websockets
@@ -19,6 +20,8 @@ except ImportError:  # pragma: no cover - optional dependency
 
 EventHandler = Callable[[dict[str, Any]], Union[Awaitable[None], None]]
 ErrorHandler = Callable[[Exception], Union[Awaitable[None], None]]
+ReplayProvider = Callable[[], list[dict[str, Any]]]
+ReconnectHandler = Callable[[str], Union[Awaitable[None], None]]
 
 
 @dataclass(frozen=True)
@@ -34,25 +37,51 @@ class RealtimeSessionInfo:
     wss_url: str
     bearer_token: Optional[str]
     model: str
+    # epoch seconds when the ephemeral token stops being accepted
+    expires_at: Optional[float] = None
 
 
 class RealtimeSessionManager:
-    def __init__(self, config: RealtimeConfig) -> None:
+    def __init__(
+        self,
+        config: RealtimeConfig,
+        client: Optional[Any] = None,
+        async_client: Optional[Any] = None,
+    ) -> None:
         self._config = config
+        self._client = client
+        self._async_client = async_client
 
     def create_session(self) -> RealtimeSessionInfo:
-        client = OpenAI(api_key=self._config.api_key)
-        bearer_token: Optional[str] = None
+        client = self._client or OpenAI(api_key=self._config.api_key)
+        session = None
 
         # Prefer ephemeral session creation when supported by SDK.
         if hasattr(client, "realtime") and hasattr(client.realtime, "sessions"):
             session = client.realtime.sessions.create(model=self._config.model)
-            client_secret = getattr(session, "client_secret", None)
-            if client_secret is not None:
-                bearer_token = getattr(client_secret, "value", None)
+        return self._session_info(session)
 
+    async def create_session_async(self) -> RealtimeSessionInfo:
+        client = self._async_client
+        if client is None or not (hasattr(client, "realtime") and hasattr(client.realtime, "sessions")):
+            return await asyncio.to_thread(self.create_session)
+        session = await client.realtime.sessions.create(model=self._config.model)
+        return self._session_info(session)
+
+    def _session_info(self, session: Any) -> RealtimeSessionInfo:
+        bearer_token: Optional[str] = None
+        expires_at: Optional[float] = None
+        client_secret = getattr(session, "client_secret", None)
+        if client_secret is not None:
+            bearer_token = getattr(client_secret, "value", None)
+            expires_at = getattr(client_secret, "expires_at", None)
         wss_url = self._build_wss_url(self._config.base_url, self._config.model)
-        return RealtimeSessionInfo(wss_url=wss_url, bearer_token=bearer_token, model=self._config.model)
+        return RealtimeSessionInfo(
+            wss_url=wss_url,
+            bearer_token=bearer_token,
+            model=self._config.model,
+            expires_at=float(expires_at) if isinstance(expires_at, (int, float)) else None,
+        )
 
     @staticmethod
     def _build_wss_url(base_url: str, model: str) -> str:
@@ -65,6 +94,30 @@ class RealtimeSessionManager:
         return f"{wss_base}/realtime?model={model}"
 
 
+class SessionHandshake:
+    """First-connect handshake: ``session.updated`` then an emptied input buffer.
+
+    Only the first ``session.updated`` clears the buffer. After a reconnect the
+    ack arrives behind the replayed held audio, and clearing then would drop it.
+    """
+
+    def __init__(self, send_event: Callable[[dict[str, Any]], Awaitable[None]]) -> None:
+        self._send_event = send_event
+        self._updated = False
+        self._cleared = False
+        self.ready = asyncio.Event()
+
+    async def handle_event(self, event: dict[str, Any]) -> None:
+        event_type = event.get("type")
+        if event_type == "session.updated" and not self.ready.is_set():
+            self._updated = True
+            await self._send_event({"type": "input_audio_buffer.clear"})
+        elif event_type == "input_audio_buffer.cleared":
+            self._cleared = True
+        if self._updated and self._cleared:
+            self.ready.set()
+
+
 class RealtimeWebSocketClient:
     def __init__(
         self,
@@ -75,6 +128,8 @@ class RealtimeWebSocketClient:
         max_retries: int = 1,
         error_handler: Optional[ErrorHandler] = None,
         logger: Optional[logging.Logger] = None,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        replay_provider: Optional[ReplayProvider] = None,
     ) -> None:
         self._session = session
         self._api_key = api_key
@@ -85,33 +140,92 @@ class RealtimeWebSocketClient:
         self._logger = logger or logging.getLogger(__name__)
         self._ws: Optional[WebSocketClientProtocol] = None
         self._connected_event = asyncio.Event()
+        self._reconnect_policy = reconnect_policy or ReconnectPolicy()
+        self._replay_provider = replay_provider
+        self._reconnect_handler: Optional[ReconnectHandler] = None
+        self._closing = False
+        self._recovering = False
+
+    @property
+    def is_connected(self) -> bool:
+        # stays False until replay is sent so new input cannot overtake held input
+        return self._ws is not None and not self._recovering
+
+    @property
+    def recovery_log(self):
+        return self._reconnect_policy.log
 
     async def connect_and_run(self) -> None:
         if websockets is None:
             raise RuntimeError("websockets dependency is required for Realtime API")
 
         retries = 0
-        last_error: Optional[Exception] = None
         while True:
             try:
                 await self._connect()
-                await self._run_loop()
-                return
+                break
             except Exception as exc:
                 self._logger.exception("Realtime websocket error: %s", exc)
-                last_error = exc
                 if retries >= self._max_retries:
-                    if self._error_handler and last_error is not None:
-                        result = self._error_handler(last_error)
-                        if asyncio.iscoroutine(result):
-                            await result
-                        return
-                    raise
+                    await self._give_up(exc)
+                    return
                 retries += 1
-                await asyncio.sleep(0.5)
+                await asyncio.sleep(self._reconnect_policy.delay(retries))
 
-    async def _connect(self) -> None:
-        bearer = self._session.bearer_token or self._api_key
+        while True:
+            try:
+                await self._run_loop()
+                exc: Exception = ConnectionError("Realtime websocket closed by upstream")
+            except Exception as error:
+                exc = error
+            if self._closing:
+                return
+            self._logger.warning("Realtime websocket dropped, reconnecting: %s", exc)
+            self._recovering = True
+            await self._notify_reconnect("reconnecting")
+            try:
+                recovered = await self._reconnect_policy.recover(self._reconnect, reason=str(exc))
+            finally:
+                self._recovering = False
+            if recovered:
+                await self._notify_reconnect("recovered")
+            else:
+                await self._give_up(exc)
+                return
+
+    async def _notify_reconnect(self, status: str) -> None:
+        if self._reconnect_handler is None:
+            return
+        try:
+            result = self._reconnect_handler(status)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as exc:
+            self._logger.warning("Reconnect notification failed: %s", exc)
+
+    async def _give_up(self, exc: Exception) -> None:
+        if self._error_handler is None:
+            raise exc
+        result = self._error_handler(exc)
+        if asyncio.iscoroutine(result):
+            await result
+
+    async def _reconnect(self) -> None:
+        stale_ws, self._ws = self._ws, None
+        if stale_ws is not None:
+            try:
+                await stale_ws.close()
+            except Exception:
+                pass
+        # ephemeral token may have expired by now; reconnect with the server key
+        await self._connect(prefer_api_key=True)
+        if self._replay_provider is not None:
+            # build every replay item first, then send them back-to-back
+            for event in self._replay_provider():
+                await self.send_event(event)
+
+    async def _connect(self, prefer_api_key: bool = False) -> None:
+        bearer = self._api_key if prefer_api_key else (self._session.bearer_token or self._api_key)
         headers = {
             "Authorization": f"Bearer {bearer}",
             "OpenAI-Beta": "realtime=v1",
@@ -155,7 +269,14 @@ class RealtimeWebSocketClient:
     def set_error_handler(self, error_handler: Optional[ErrorHandler]) -> None:
         self._error_handler = error_handler
 
+    def set_replay_provider(self, provider: Optional[ReplayProvider]) -> None:
+        self._replay_provider = provider
+
+    def set_reconnect_handler(self, handler: Optional[ReconnectHandler]) -> None:
+        self._reconnect_handler = handler
+
     async def close(self) -> None:
+        self._closing = True
         if self._ws is not None:
             await self._ws.close()
         self._connected_event.clear()
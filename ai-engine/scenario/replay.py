@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+from realtime_common.audio_buffer import PcmRingBuffer
+
+# 5 seconds of 24kHz PCM16 mono held while the upstream reconnects
+HELD_AUDIO_BYTES = 24000 * 2 * 5
+
+
+def build_scenario_replay(
+    scenario_state: Any, transcripts: list[str], limit: int = 6
+) -> list[dict[str, Any]]:
+    # a system item: user-role replays would be re-ingested by the scenario pipeline
+    lines = [
+        "The connection was restored mid-conversation. Continue from where it left off.",
+        f"Known so far - place: {scenario_state.place or 'unknown'}, "
+        f"partner: {scenario_state.partner or 'unknown'}, goal: {scenario_state.goal or 'unknown'}.",
+    ]
+    if scenario_state.asked_fields:
+        lines.append(f"Already asked about: {', '.join(sorted(scenario_state.asked_fields))}.")
+    recent = [text for text in transcripts if text.strip()][-limit:]
+    if recent:
+        lines.append("Recent user utterances:")
+        lines.extend(f"- {text}" for text in recent)
+    return [
+        {
+            "type": "conversation.item.create",
+            "item": {
+                "type": "message",
+                "role": "system",
+                "content": [{"type": "input_text", "text": "\n".join(lines)}],
+            },
+        }
+    ]
+
+
+class HeldInput:
+    """Client input held while the upstream recovers, replayed in arrival order."""
+
+    def __init__(self, max_audio_bytes: int = HELD_AUDIO_BYTES) -> None:
+        # audio and the events between it share one queue, so A, commit, B stays in that order
+        self.buffer = PcmRingBuffer(max_audio_bytes)
+
+    def hold(self, event: dict[str, Any]) -> None:
+        if event.get("type") == "input_audio_buffer.append":
+            self.buffer.append(base64.b64decode(event["audio"]))
+        else:
+            self.buffer.mark(event)
+
+    def drain(self) -> list[dict[str, Any]]:
+        return [
+            {"type": "input_audio_buffer.append", "audio": base64.b64encode(entry).decode("ascii")}
+            if isinstance(entry, bytes)
+            else entry
+            for entry in self.buffer.drain()
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        return self.buffer.stats()
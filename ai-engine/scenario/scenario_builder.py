@@ -1,13 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Callable, Optional
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
 
 from .scenario_state import ScenarioState
+from .speculation import SpeculationMetrics
 
-Extractor = Callable[[str], dict[str, Optional[str]]]
-QuestionGenerator = Callable[[ScenarioState, list[str]], str]
-FinalGenerator = Callable[[ScenarioState], str]
+T = TypeVar("T")
+MaybeAwaitable = Union[T, Awaitable[T]]
+
+# generators may be sync (tests, scripts) or async (realtime bridge); the *_async
+# methods accept both, the sync methods only sync ones
+Extractor = Callable[[str], MaybeAwaitable[dict[str, Optional[str]]]]
+QuestionGenerator = Callable[[ScenarioState, list[str]], MaybeAwaitable[str]]
+FinalGenerator = Callable[[ScenarioState], MaybeAwaitable[str]]
+# combined mode: one call returns extracted fields, completeness, next question and final message
+TurnPlanner = Callable[[ScenarioState, str], MaybeAwaitable[dict[str, Any]]]
+
+DEFAULT_QUESTIONS = {
+    "place": "Where are you having this conversation?",
+    "partner": "Who are you talking to?",
+    "goal": "What do you want to achieve in this conversation?",
+}
 
 
 class ScenarioBuilder:
@@ -19,6 +35,8 @@ class ScenarioBuilder:
         question_generator: QuestionGenerator | None = None,
         final_generator: FinalGenerator | None = None,
         fallback_generator: FinalGenerator | None = None,
+        turn_planner: TurnPlanner | None = None,
+        speculation: SpeculationMetrics | None = None,
         max_attempts: int = 3,
         fallback_korean_prompt: str = "음성이 잘 들리지 않았어요. 다시 말해 주세요.",
         logger=None,
@@ -28,33 +46,177 @@ class ScenarioBuilder:
         self._question_generator = question_generator
         self._final_generator = final_generator
         self._fallback_generator = fallback_generator
+        self._turn_planner = turn_planner
+        self._speculation = speculation
+        self._planned_final: str | None = None
         self._max_attempts = max_attempts
         self._fallback_korean_prompt = fallback_korean_prompt
         self._logger = logger
-        self._default_questions = {
-            "place": "Where are you having this conversation?",
-            "partner": "Who are you talking to?",
-            "goal": "What do you want to achieve in this conversation?",
-        }
+        self._default_questions = dict(DEFAULT_QUESTIONS)
 
     @property
     def state(self) -> ScenarioState:
         return self._state
 
+    def restore(self, state: ScenarioState) -> None:
+        # another writer advanced the same checkpoint; continue from its state
+        self._state = state
+        self._planned_final = None
+
     def ingest_user_text(self, text: str) -> None:
-        if not text.strip():
-            return
-        if self._state.completed:
+        if not self._should_extract(text):
             return
-        if self._extractor is None:
+        extracted = _sync_result(self._extractor(text), "ingest_user_text_async")
+        self._state.update_from_extraction(extracted)
+
+    async def ingest_user_text_async(self, text: str) -> None:
+        if not self._should_extract(text):
             return
-        extracted = self._extractor(text)
+        extracted = await _async_result(self._extractor(text))
         self._state.update_from_extraction(extracted)
 
+    @property
+    def speculates(self) -> bool:
+        return self._speculation is not None
+
+    async def ingest_and_follow_up_async(self, text: str) -> str | None:
+        """Extract and return the next question, generating candidate questions while extraction runs.
+
+        Every field still missing before extraction may still be missing after it,
+        so one question per such field is started alongside the extractor. The
+        one matching the real target is kept; the rest are cancelled. Candidates
+        only see the pre-extraction state.
+        """
+        candidates = self._speculation_candidates(text)
+        if not candidates:
+            await self.ingest_user_text_async(text)
+            if self._state.is_complete():
+                return None
+            return await self.build_follow_up_question_async()
+
+        started = time.perf_counter()
+        snapshot = ScenarioState(place=self._state.place, partner=self._state.partner, goal=self._state.goal)
+        tasks = {
+            field: asyncio.ensure_future(_timed(self._question_generator(snapshot, [field])))
+            for field in candidates
+        }
+        used: asyncio.Future | None = None
+        cancelled = 0
+        saved_ms = 0.0
+
+        def discard_others() -> int:
+            count = 0
+            for task in tasks.values():
+                if task is used:
+                    continue
+                if task.done():
+                    if not task.cancelled():
+                        task.exception()  # discarded results must not log "exception never retrieved"
+                else:
+                    task.cancel()
+                    count += 1
+            return count
+
+        try:
+            await self.ingest_user_text_async(text)
+            extract_ms = (time.perf_counter() - started) * 1000
+            target = None if self._state.is_complete() else self._next_question_target()
+            used = tasks.get(target) if target is not None else None
+            # the target is known: stop paying for the other candidates right away
+            cancelled = discard_others()
+            if target is None:
+                return None
+            if used is None:
+                response = await _async_result(self._question_generator(self._state, [target]))
+                return self._sanitize_question(response)
+            response, question_ms = await used
+            # sequential cost minus what the learner actually waited
+            saved_ms = extract_ms + question_ms - (time.perf_counter() - started) * 1000
+            return self._sanitize_question(response)
+        finally:
+            if used is None:
+                cancelled += discard_others()
+            self._speculation.record(
+                started=len(tasks),
+                used=used is not None and used.done() and not used.cancelled() and used.exception() is None,
+                cancelled=cancelled,
+                saved_ms=saved_ms,
+            )
+
+    def _speculation_candidates(self, text: str) -> list[str]:
+        if not self._should_extract(text) or self._question_generator is None:
+            return []
+        if self._state.attempts >= self._max_attempts:
+            return []
+        return self._state.missing_fields()
+
+    def _should_extract(self, text: str) -> bool:
+        return bool(text.strip()) and not self._state.completed and self._extractor is not None
+
+    @property
+    def plans_turns(self) -> bool:
+        return self._turn_planner is not None
+
+    def plan_turn(self, text: str) -> str | None:
+        """Combined mode: apply one planner response and return the next question (None when done)."""
+        if self._state.completed:
+            return None
+        plan = _sync_result(self._turn_planner(self._state, text), "plan_turn_async")
+        return self._apply_turn_plan(plan)
+
+    async def plan_turn_async(self, text: str) -> str | None:
+        if self._state.completed:
+            return None
+        plan = await _async_result(self._turn_planner(self._state, text))
+        return self._apply_turn_plan(plan)
+
+    def _apply_turn_plan(self, plan: dict[str, Any]) -> str | None:
+        self._state.update_from_extraction(plan)
+        if self._state.is_complete():
+            self._planned_final = plan.get("final_message") or None
+            return None
+        target = self._next_question_target()
+        if target is None:
+            return None
+        # the planner's wording only counts when it asks about the field recorded as asked
+        question = plan.get("next_question") if plan.get("question_field") == target else None
+        return self._sanitize_question(question or self._default_questions.get(target, self._default_questions["goal"]))
+
     def get_missing_fields(self) -> list[str]:
         return self._state.missing_fields()
 
     def build_follow_up_question(self) -> str | None:
+        target = self._next_question_target()
+        if target is None:
+            return None
+        if self._question_generator:
+            response = _sync_result(self._question_generator(self._state, [target]), "build_follow_up_question_async")
+        else:
+            response = self._default_questions.get(target, self._default_questions["goal"])
+        return self._sanitize_question(response)
+
+    async def build_follow_up_question_async(self) -> str | None:
+        target = self._next_question_target()
+        if target is None:
+            return None
+        if self._question_generator:
+            response = await _async_result(self._question_generator(self._state, [target]))
+        else:
+            response = self._default_questions.get(target, self._default_questions["goal"])
+        return self._sanitize_question(response)
+
+    def resume_question(self) -> str | None:
+        """Default question for the next missing field after a reconnect.
+
+        Uses the fixed (TTS-cached) wording and does not count as an attempt:
+        the learner may never have heard the question asked before the drop.
+        """
+        if self._state.completed or self._state.is_complete():
+            return None
+        target = self._state.question_order()[0]
+        return self._default_questions.get(target, self._default_questions["goal"])
+
+    def _next_question_target(self) -> str | None:
         if self._state.completed:
             return None
         missing = self.get_missing_fields()
@@ -62,52 +224,66 @@ class ScenarioBuilder:
             return None
         if self._state.attempts >= self._max_attempts:
             return None
-        target = next((field for field in missing if field not in self._state.asked_fields), None)
-        if target is None:
-            target = missing[0]
+        target = self._state.question_order()[0]
         self._state.asked_fields.add(target)
         self._state.attempts += 1
-        if self._question_generator:
-            response = self._question_generator(self._state, [target])
-        else:
-            response = self._default_questions.get(target, self._default_questions["goal"])
-        response = self._sanitize_question(response)
-        return response
+        return target
 
     def finalize_scenario(self) -> str:
-        if self._state.completed:
-            place = self._state.place or ""
-            partner = self._state.partner or ""
-            goal = self._state.goal or ""
-            return (
-                f"Great. You're at {place} talking to {partner} because you want to {goal}. Let's start."
-            )
+        if self._planned_final and not self._state.completed:
+            self._state.completed = True
+            return self._planned_final
+        if self._state.completed or not self._final_generator:
+            self._state.completed = True
+            return self._default_final_message()
         self._state.completed = True
-        if self._final_generator:
-            response = self._final_generator(self._state)
-            return response
-        place = self._state.place or ""
-        partner = self._state.partner or ""
-        goal = self._state.goal or ""
-        response = (
-            f"Great. You're at {place} talking to {partner} because you want to {goal}. Let's start."
-        )
-        return response
+        return _sync_result(self._final_generator(self._state), "finalize_scenario_async")
+
+    async def finalize_scenario_async(self) -> str:
+        if self._planned_final and not self._state.completed:
+            self._state.completed = True
+            return self._planned_final
+        if self._state.completed or not self._final_generator:
+            self._state.completed = True
+            return self._default_final_message()
+        self._state.completed = True
+        return await _async_result(self._final_generator(self._state))
 
     def finalize_with_fallback(self) -> str:
         if self._state.completed:
             return self.finalize_scenario()
         if self._fallback_generator:
             for attempt in range(2):
-                response = self._fallback_generator(self._state)
-                extracted = self._extract_json_object(response)
-                if extracted:
-                    self._state.update_from_extraction(extracted)
+                response = _sync_result(self._fallback_generator(self._state), "finalize_with_fallback_async")
+                if self._apply_fallback_response(response, attempt):
                     return self.finalize_scenario()
-                if self._logger:
-                    self._logger.warning("Fallback JSON parse failed (attempt %s)", attempt + 1)
         return self.finalize_scenario()
 
+    async def finalize_with_fallback_async(self) -> str:
+        if self._state.completed:
+            return await self.finalize_scenario_async()
+        if self._fallback_generator:
+            for attempt in range(2):
+                response = await _async_result(self._fallback_generator(self._state))
+                if self._apply_fallback_response(response, attempt):
+                    return await self.finalize_scenario_async()
+        return await self.finalize_scenario_async()
+
+    def _apply_fallback_response(self, response: str, attempt: int) -> bool:
+        extracted = self._extract_json_object(response)
+        if extracted:
+            self._state.update_from_extraction(extracted)
+            return True
+        if self._logger:
+            self._logger.warning("Fallback JSON parse failed (attempt %s)", attempt + 1)
+        return False
+
+    def _default_final_message(self) -> str:
+        place = self._state.place or ""
+        partner = self._state.partner or ""
+        goal = self._state.goal or ""
+        return f"Great. You're at {place} talking to {partner} because you want to {goal}. Let's start."
+
     def ensure_defaults(self) -> None:
         self._fill_defaults_if_missing()
 
@@ -150,3 +326,23 @@ class ScenarioBuilder:
         if len(words) > 15:
             return self._default_questions["goal"]
         return first_sentence
+
+
+async def _timed(result: Any) -> tuple[Any, float]:
+    started = time.perf_counter()
+    value = await _async_result(result)
+    return value, (time.perf_counter() - started) * 1000
+
+
+def _sync_result(result: Any, async_method: str) -> Any:
+    if hasattr(result, "__await__"):
+        if hasattr(result, "close"):
+            result.close()
+        raise TypeError(f"async generator configured; use ScenarioBuilder.{async_method}")
+    return result
+
+
+async def _async_result(result: Any) -> Any:
+    if hasattr(result, "__await__"):
+        return await result
+    return result
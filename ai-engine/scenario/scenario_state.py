@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass
@@ -12,6 +13,27 @@ class ScenarioState:
     asked_fields: set[str] = field(default_factory=set)
     completed: bool = False
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "place": self.place,
+            "partner": self.partner,
+            "goal": self.goal,
+            "attempts": self.attempts,
+            "asked_fields": sorted(self.asked_fields),
+            "completed": self.completed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScenarioState":
+        return cls(
+            place=data.get("place"),
+            partner=data.get("partner"),
+            goal=data.get("goal"),
+            attempts=int(data.get("attempts") or 0),
+            asked_fields=set(data.get("asked_fields") or ()),
+            completed=bool(data.get("completed")),
+        )
+
     def is_complete(self) -> bool:
         return all([self.place, self.partner, self.goal])
 
@@ -25,6 +47,13 @@ class ScenarioState:
             missing.append("goal")
         return missing
 
+    def question_order(self) -> list[str]:
+        # the builder asks about the first of these that is still missing: unasked fields first
+        missing = self.missing_fields()
+        return [name for name in missing if name not in self.asked_fields] + [
+            name for name in missing if name in self.asked_fields
+        ]
+
     def update_from_extraction(self, extracted: dict[str, str | None]) -> None:
         place = extracted.get("place")
         partner = extracted.get("partner")
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from .logging_utils import get_logger
+from .realtime_session import RealtimeSessionInfo, RealtimeSessionManager
+
+# ephemeral Realtime tokens are valid for about a minute
+DEFAULT_TOKEN_TTL_SEC = 60.0
+REFRESH_MARGIN_SEC = 15.0
+RATE_WINDOW_SEC = 60.0
+# keep enough tokens for the connections expected over this horizon
+POOL_HORIZON_SEC = 10.0
+# no idle floor: every pooled token is billed, so an idle process mints nothing
+POOL_MIN_SIZE = 0
+POOL_MAX_SIZE = 8
+REFILL_INTERVAL_SEC = 1.0
+MINT_RETRY_SEC = 5.0
+
+
+class RealtimeSessionPool:
+    """Ephemeral Realtime sessions minted in the background ahead of connections.
+
+    ``acquire`` hands out a pooled session when one is still fresh, otherwise it
+    mints one on demand without blocking the loop. The refill task drops tokens
+    that are within ``refresh_margin_sec`` of expiry and tops the pool up to a
+    target sized from the connection rate over the last ``rate_window_sec``.
+    """
+
+    def __init__(
+        self,
+        manager: RealtimeSessionManager,
+        *,
+        min_size: int = POOL_MIN_SIZE,
+        max_size: int = POOL_MAX_SIZE,
+        horizon_sec: float = POOL_HORIZON_SEC,
+        rate_window_sec: float = RATE_WINDOW_SEC,
+        refresh_margin_sec: float = REFRESH_MARGIN_SEC,
+        token_ttl_sec: float = DEFAULT_TOKEN_TTL_SEC,
+        refill_interval_sec: float = REFILL_INTERVAL_SEC,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._manager = manager
+        self._min_size = min_size
+        self._max_size = max_size
+        self._horizon_sec = horizon_sec
+        self._rate_window_sec = rate_window_sec
+        self._refresh_margin_sec = refresh_margin_sec
+        self._token_ttl_sec = token_ttl_sec
+        self._refill_interval_sec = refill_interval_sec
+        self._clock = clock
+        self._logger = get_logger("session_pool")
+
+        self._ready: deque[tuple[float, RealtimeSessionInfo]] = deque()
+        self._arrivals: deque[float] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.minted = 0
+        self.expired = 0
+        self.mint_failures = 0
+
+    async def acquire(self) -> RealtimeSessionInfo:
+        now = self._clock()
+        self._arrivals.append(now)
+        self._discard_stale(now)
+        self._wakeup.set()
+        if self._ready:
+            self.hits += 1
+            return self._ready.popleft()[1]
+        self.misses += 1
+        return await self._manager.create_session_async()
+
+    def target_size(self) -> int:
+        now = self._clock()
+        while self._arrivals and self._arrivals[0] < now - self._rate_window_sec:
+            self._arrivals.popleft()
+        expected = len(self._arrivals) / self._rate_window_sec * self._horizon_sec
+        return max(self._min_size, min(self._max_size, math.ceil(expected)))
+
+    async def refill(self) -> int:
+        """Drop stale tokens and mint up to the target. Returns how many were minted."""
+        self._discard_stale(self._clock())
+        missing = self.target_size() - len(self._ready)
+        if missing <= 0:
+            return 0
+        results = await asyncio.gather(
+            *(self._manager.create_session_async() for _ in range(missing)),
+            return_exceptions=True,
+        )
+        minted = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                self.mint_failures += 1
+                self._logger.warning("Realtime session pre-mint failed: %s", result)
+                continue
+            self._ready.append((self._expires_at(result), result))
+            minted += 1
+        self.minted += minted
+        if minted < missing:
+            raise RuntimeError(f"pre-minted {minted}/{missing} realtime sessions")
+        return minted
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> dict[str, Any]:
+        acquired = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / acquired, 3) if acquired else 0.0,
+            "minted": self.minted,
+            "expired": self.expired,
+            "mint_failures": self.mint_failures,
+            "ready": len(self._ready),
+            "target": self.target_size(),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            delay = self._refill_interval_sec
+            try:
+                await self.refill()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                delay = MINT_RETRY_SEC
+            # sleep until the next refresh or until a connection takes a token
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._next_wakeup(delay))
+            except asyncio.TimeoutError:
+                pass
+
+    def _next_wakeup(self, delay: float) -> float:
+        if not self._ready:
+            return delay
+        until_stale = self._ready[0][0] - self._refresh_margin_sec - self._clock()
+        return max(0.0, min(delay, until_stale))
+
+    def _expires_at(self, info: RealtimeSessionInfo) -> float:
+        if info.expires_at is not None:
+            return info.expires_at
+        return self._clock() + self._token_ttl_sec
+
+    def _discard_stale(self, now: float) -> None:
+        while self._ready and self._ready[0][0] - self._refresh_margin_sec <= now:
+            self._ready.popleft()
+            self.expired += 1
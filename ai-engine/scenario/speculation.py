@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+class SpeculationMetrics:
+    """Counters for speculative follow-up generation, shared across sessions."""
+
+    def __init__(self) -> None:
+        self.turns = 0
+        self.used = 0
+        self.wasted_calls = 0
+        self.cancelled = 0
+        self.saved_ms = 0.0
+
+    def record(self, *, started: int, used: bool, cancelled: int, saved_ms: float) -> None:
+        self.turns += 1
+        self.used += int(used)
+        self.wasted_calls += started - int(used)
+        self.cancelled += cancelled
+        self.saved_ms += max(0.0, saved_ms)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "turns": self.turns,
+            "used": self.used,
+            "wasted_calls": self.wasted_calls,
+            "cancelled": self.cancelled,
+            "saved_ms": round(self.saved_ms, 1),
+            "avg_saved_ms": round(self.saved_ms / self.used, 1) if self.used else 0.0,
+        }
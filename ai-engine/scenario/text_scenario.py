@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from .checkpoints import ScenarioCheckpointStore
+from .realtime_pipeline import RealtimeScenarioPipeline
+from .scenario_builder import ScenarioBuilder
+from .scenario_state import ScenarioState
+from .titles import build_session_title
+
+BuilderFactory = Callable[[Optional[ScenarioState]], ScenarioBuilder]
+# persist_scenario_state(session_id=..., scenario_state=..., title=..., user_id=...)
+PersistScenario = Callable[..., Awaitable[Any]]
+OnCompleted = Callable[[str, dict[str, Any], list[str]], Any]
+
+TEXT_GREETING = "Hi! Let's set up your conversation practice."
+
+
+class TextScenarioNotFound(LookupError):
+    """Unknown, expired or foreign scenario token."""
+
+
+@dataclass
+class TextScenarioTurn:
+    token: str
+    message: str
+    completed: bool = False
+    session_id: Optional[str] = None
+    scenario: dict[str, Any] = field(default_factory=dict)
+
+
+class TextScenarioService:
+    """Scenario building for typed input: no Realtime session, no TTS.
+
+    Turns run through the same ``RealtimeScenarioPipeline`` the voice bridge
+    uses, with replies collected as text. State lives server-side in the
+    process's checkpoint store under the returned token.
+    """
+
+    def __init__(
+        self,
+        builder_factory: BuilderFactory,
+        checkpoints: ScenarioCheckpointStore,
+        *,
+        persist: PersistScenario,
+        on_completed: Optional[OnCompleted] = None,
+    ) -> None:
+        self._builder_factory = builder_factory
+        self._checkpoints = checkpoints
+        self._persist = persist
+        self._on_completed = on_completed
+
+    def start(self, user_id: Optional[int] = None) -> TextScenarioTurn:
+        token = self._checkpoints.new_token()
+        builder = self._builder_factory(None)
+        self._checkpoints.save(token, builder.state, [], user_id=user_id)
+        # fixed wording: the first question costs no LLM call
+        return TextScenarioTurn(token=token, message=f"{TEXT_GREETING} {builder.resume_question()}")
+
+    async def reply(self, token: str, text: str, user_id: Optional[int] = None) -> TextScenarioTurn:
+        # one turn at a time per token; a double submit must not extract twice
+        async with self._checkpoints.lock(token):
+            return await self._reply(token, text, user_id)
+
+    async def _reply(self, token: str, text: str, user_id: Optional[int]) -> TextScenarioTurn:
+        checkpoint = self._checkpoints.load(token, user_id=user_id)
+        if checkpoint is None:
+            raise TextScenarioNotFound(token)
+        builder = self._builder_factory(checkpoint.restore_state())
+        transcripts = list(checkpoint.transcripts)
+        if text.strip():
+            transcripts.append(text.strip())
+        replies: list[str] = []
+        turn = TextScenarioTurn(token=token, message="")
+
+        def save(turn_builder: ScenarioBuilder) -> None:
+            self._checkpoints.save(token, turn_builder.state, transcripts, user_id=user_id)
+
+        async def complete(done: ScenarioBuilder) -> None:
+            done.ensure_defaults()
+            scenario_state = done.state.to_dict()
+            session_id = str(uuid.uuid4())
+            await self._persist(
+                session_id=session_id,
+                scenario_state=scenario_state,
+                title=build_session_title(scenario_state),
+                user_id=user_id,
+            )
+            self._checkpoints.discard(token)
+            turn.completed = True
+            turn.session_id = session_id
+            if self._on_completed:
+                result = self._on_completed(session_id, scenario_state, transcripts)
+                if hasattr(result, "__await__"):
+                    await result
+
+        if text.strip():
+            pipeline = RealtimeScenarioPipeline(builder, replies.append, on_complete=complete, on_turn=save)
+            await pipeline.handle_text(text)
+        else:
+            # empty input: ask again without spending an attempt or an LLM call
+            replies.append(builder.resume_question() or "")
+        turn.message = replies[-1] if replies else ""
+        turn.scenario = {
+            "place": builder.state.place,
+            "conversation_partner": builder.state.partner,
+            "conversation_goal": builder.state.goal,
+        }
+        return turn
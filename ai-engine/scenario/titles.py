@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Optional
+
+from .llm_client import _response_output_text
+
+TITLE_MAX_CHARS = 50
+
+
+def build_session_title(scenario_state: dict[str, Any]) -> str:
+    parts = [
+        scenario_state.get("place"),
+        scenario_state.get("partner"),
+        scenario_state.get("goal"),
+    ]
+    cleaned = [part.strip() for part in parts if isinstance(part, str) and part.strip()]
+    if not cleaned:
+        return "Conversation"
+    return " / ".join(cleaned)
+
+
+def build_title_prompt(scenario_state: dict[str, Any], transcripts: list[str]) -> str:
+    place = scenario_state.get("place") or "unknown"
+    partner = scenario_state.get("partner") or "unknown"
+    goal = scenario_state.get("goal") or "unknown"
+    transcript_text = " ".join(transcripts[-6:]) if transcripts else ""
+    return (
+        "Create a concise English conversation title (max 50 characters). "
+        "Base it on the user's conversation and the scenario context. "
+        "Return only the title, no quotes.\n\n"
+        f"Scenario: place={place}, partner={partner}, goal={goal}\n"
+        f"User conversation: {transcript_text}"
+    )
+
+
+def normalize_title(title: str, *, fallback: str) -> str:
+    cleaned = title.replace("\n", " ").strip().strip("\"'")
+    if not cleaned:
+        return fallback
+    if len(cleaned) > TITLE_MAX_CHARS:
+        cleaned = cleaned[:TITLE_MAX_CHARS].rstrip()
+    return cleaned
+
+
+async def request_title(client: Any, model: str, prompt: str) -> str:
+    if hasattr(client, "responses"):
+        try:
+            response = await client.responses.create(
+                model=model,
+                input=prompt,
+                temperature=0.7,
+            )
+        except TypeError:
+            response = await client.responses.create(
+                model=model,
+                input=prompt,
+            )
+        return _response_output_text(response)
+    if hasattr(client, "chat"):
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7,
+        )
+        return response.choices[0].message.content.strip()
+    raise RuntimeError("OpenAI client does not support responses or chat completions")
+
+
+async def generate_session_title(
+    client: Any,
+    model: str,
+    *,
+    scenario_state: dict[str, Any],
+    transcripts: list[str],
+) -> str:
+    fallback = build_session_title(scenario_state)
+    try:
+        title = await request_title(client, model, build_title_prompt(scenario_state, transcripts))
+    except Exception:
+        return fallback
+    return normalize_title(title, fallback=fallback)
+
+
+async def refine_session_title(
+    client: Any,
+    model: str,
+    *,
+    scenario_state: dict[str, Any],
+    transcripts: list[str],
+    persist: Callable[[str], Awaitable[Any]],
+    notify: Optional[Callable[[str], Awaitable[Any]]] = None,
+) -> Optional[str]:
+    """Replace the fallback title with an LLM title after completion has been sent."""
+    title = await generate_session_title(client, model, scenario_state=scenario_state, transcripts=transcripts)
+    if title == build_session_title(scenario_state):
+        return None
+    await persist(title)
+    if notify is not None:
+        await notify(title)
+    return title
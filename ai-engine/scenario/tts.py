@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import time
+from typing import Any, AsyncIterator, Optional
+
+TTS_MODEL = "gpt-4o-mini-tts"
+TTS_VOICE = "alloy"
+# response_format="pcm" is raw 24kHz 16-bit mono little-endian
+TTS_SAMPLE_RATE = 24000
+TTS_READ_CHUNK_BYTES = 4800
+
+
+class TtsMetrics:
+    def __init__(self) -> None:
+        self.utterances = 0
+        self.ttfb_ms: list[float] = []
+        self.synth_ms: list[float] = []
+        self.audio_bytes = 0
+
+    def record(self, ttfb_ms: Optional[float], synth_ms: float, audio_bytes: int) -> None:
+        self.utterances += 1
+        if ttfb_ms is not None:
+            self.ttfb_ms.append(ttfb_ms)
+        self.synth_ms.append(synth_ms)
+        self.audio_bytes += audio_bytes
+
+    def stats(self) -> dict[str, Any]:
+        if not self.utterances:
+            return {"utterances": 0}
+        avg_ttfb = sum(self.ttfb_ms) / len(self.ttfb_ms) if self.ttfb_ms else None
+        avg_synth = sum(self.synth_ms) / len(self.synth_ms)
+        return {
+            "utterances": self.utterances,
+            "avg_ttfb_ms": round(avg_ttfb, 1) if avg_ttfb is not None else None,
+            "max_ttfb_ms": round(max(self.ttfb_ms), 1) if self.ttfb_ms else None,
+            # the full-body path could not start playback before synthesis finished
+            "avg_synth_ms": round(avg_synth, 1),
+            "avg_first_audio_saved_ms": round(avg_synth - avg_ttfb, 1) if avg_ttfb is not None else None,
+            "audio_bytes": self.audio_bytes,
+        }
+
+
+async def stream_tts_pcm16(
+    client: Any,
+    text: str,
+    *,
+    voice: str = TTS_VOICE,
+    model: str = TTS_MODEL,
+    chunk_bytes: int = TTS_READ_CHUNK_BYTES,
+    metrics: Optional[TtsMetrics] = None,
+) -> AsyncIterator[bytes]:
+    started = time.perf_counter()
+    ttfb_ms: Optional[float] = None
+    total = 0
+    async with client.audio.speech.with_streaming_response.create(
+        model=model,
+        voice=voice,
+        input=text,
+        response_format="pcm",
+    ) as response:
+        async for chunk in response.iter_bytes(chunk_bytes):
+            if not chunk:
+                continue
+            if ttfb_ms is None:
+                ttfb_ms = (time.perf_counter() - started) * 1000
+            total += len(chunk)
+            yield chunk
+    if metrics is not None:
+        metrics.record(ttfb_ms, (time.perf_counter() - started) * 1000, total)
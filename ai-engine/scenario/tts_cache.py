@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import mmap
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Optional, Union
+
+from .logging_utils import get_logger
+from .prompts import KOREAN_FALLBACK_MESSAGE
+from .scenario_builder import DEFAULT_QUESTIONS
+from .tts import TTS_MODEL, TTS_VOICE, TtsMetrics, stream_tts_pcm16
+
+TTS_FORMAT = "pcm"
+MEMORY_CACHE_BYTES = 32 * 1024 * 1024
+DISK_CACHE_BYTES = 512 * 1024 * 1024
+# fixed phrases the scenario flow speaks verbatim
+PREWARM_PHRASES = (KOREAN_FALLBACK_MESSAGE, *DEFAULT_QUESTIONS.values())
+
+CacheKey = tuple[str, str, str, str]
+PcmBuffer = Union[bytes, mmap.mmap]
+
+
+def default_cache_dir() -> Path:
+    configured = os.getenv("SCENARIO_TTS_CACHE_DIR", "").strip()
+    if configured:
+        return Path(configured)
+    return Path(tempfile.gettempdir()) / "malangee-tts-cache"
+
+
+class TtsCache:
+    """PCM cache for synthesized phrases: in-memory LRU over memory-mapped files.
+
+    The memory tier holds recently used buffers up to ``memory_bytes``. Only the
+    fixed ``disk_phrases`` are also written to disk: generated questions rarely
+    repeat and would only churn the directory. Entries evicted from memory come
+    back as read-only mmaps, so a disk hit costs a page-cache read instead of a
+    TTS round trip. The disk tier is trimmed oldest-first past ``disk_bytes``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        *,
+        memory_bytes: int = MEMORY_CACHE_BYTES,
+        disk_bytes: int = DISK_CACHE_BYTES,
+        disk_phrases: Iterable[str] = PREWARM_PHRASES,
+    ) -> None:
+        self._dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._memory: "OrderedDict[CacheKey, PcmBuffer]" = OrderedDict()
+        self._memory_size = 0
+        self._memory_limit = memory_bytes
+        self._disk_limit = disk_bytes
+        self._disk_phrases = frozenset(text.strip() for text in disk_phrases)
+        # kept up to date on writes; the directory is only listed again when trimming
+        self._disk_size = sum(size for _, size, _ in self._scan_disk() or ())
+        self._logger = get_logger("tts_cache")
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.write_failures = 0
+
+    @staticmethod
+    def make_key(text: str, voice: str = TTS_VOICE, model: str = TTS_MODEL, fmt: str = TTS_FORMAT) -> CacheKey:
+        return (text.strip(), voice, model, fmt)
+
+    def get(self, key: CacheKey) -> Optional[PcmBuffer]:
+        buffer = self._memory.get(key)
+        if buffer is not None:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return buffer
+        buffer = self._load(key)
+        if buffer is None:
+            self.misses += 1
+            return None
+        self.disk_hits += 1
+        self._remember(key, buffer)
+        return buffer
+
+    def put(self, key: CacheKey, pcm: bytes) -> None:
+        if not pcm:
+            return
+        self._remember(key, bytes(pcm))
+        if key[0] in self._disk_phrases:
+            self._write(key, pcm)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+            "stores": self.stores,
+            "write_failures": self.write_failures,
+            "disk_bytes": self._disk_size,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_size,
+        }
+
+    def _write(self, key: CacheKey, pcm: bytes) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            previous = path.stat().st_size if path.exists() else 0
+            tmp_path.write_bytes(pcm)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            self.write_failures += 1
+            self._logger.warning("TTS cache write failed: %s", exc)
+            tmp_path.unlink(missing_ok=True)
+            return
+        self.stores += 1
+        self._disk_size += len(pcm) - previous
+        if self._disk_size > self._disk_limit:
+            self._trim_disk()
+
+    def _path(self, key: CacheKey) -> Path:
+        digest = hashlib.sha256("\x1f".join(key).encode("utf-8")).hexdigest()
+        return self._dir / f"{digest}.pcm"
+
+    def _load(self, key: CacheKey) -> Optional[mmap.mmap]:
+        path = self._path(key)
+        try:
+            with path.open("rb") as handle:
+                if os.fstat(handle.fileno()).st_size == 0:
+                    return None
+                # the mapping stays valid after the file handle is closed
+                return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+
+    def _remember(self, key: CacheKey, buffer: PcmBuffer) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous)
+        if len(buffer) > self._memory_limit:
+            return
+        self._memory[key] = buffer
+        self._memory_size += len(buffer)
+        while self._memory_size > self._memory_limit:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    def _scan_disk(self) -> Optional[list[tuple[float, int, Path]]]:
+        try:
+            return [(entry.stat().st_mtime, entry.stat().st_size, entry) for entry in self._dir.glob("*.pcm")]
+        except OSError:
+            return None
+
+    def _trim_disk(self) -> None:
+        files = self._scan_disk()
+        if files is None:
+            return
+        # other processes may share the directory; the listing also corrects the running total
+        total = sum(size for _, size, _ in files)
+        for _, size, entry in sorted(files):
+            if total <= self._disk_limit:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+        self._disk_size = total
+
+
+async def cached_tts_pcm16(
+    cache: Optional[TtsCache],
+    client: Any,
+    text: str,
+    *,
+    voice: str = TTS_VOICE,
+    model: str = TTS_MODEL,
+    metrics: Optional[TtsMetrics] = None,
+) -> Union[PcmBuffer, AsyncIterator[bytes]]:
+    """Cached PCM for ``text`` or a live TTS stream that fills the cache when it completes."""
+    key = TtsCache.make_key(text, voice, model)
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None:
+        return cached
+    stream = stream_tts_pcm16(client, text, voice=voice, model=model, metrics=metrics)
+    if cache is None:
+        return stream
+    return _tee_into_cache(cache, key, stream)
+
+
+async def _tee_into_cache(cache: TtsCache, key: CacheKey, stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    collected = bytearray()
+    async for chunk in stream:
+        collected.extend(chunk)
+        yield chunk
+    # only complete syntheses are cached; an interrupted stream never reaches here
+    cache.put(key, bytes(collected))
+
+
+async def prewarm_tts_cache(
+    cache: TtsCache,
+    client: Any,
+    phrases: Iterable[str] = PREWARM_PHRASES,
+    *,
+    voice: str = TTS_VOICE,
+    model: str = TTS_MODEL,
+) -> int:
+    """Synthesize fixed phrases that are not cached yet. Returns how many were fetched."""
+    logger = get_logger("tts_cache")
+    fetched = 0
+    for text in phrases:
+        key = TtsCache.make_key(text, voice, model)
+        if cache.get(key) is not None:
+            continue
+        try:
+            pcm = bytearray()
+            async for chunk in stream_tts_pcm16(client, text, voice=voice, model=model):
+                pcm.extend(chunk)
+            cache.put(key, bytes(pcm))
+            fetched += 1
+        except Exception as exc:
+            logger.warning("TTS prewarm failed for %r: %s", text, exc)
+        await asyncio.sleep(0)
+    return fetched
+
+
+_shared_cache: Optional[TtsCache] = None
+
+
+def get_tts_cache() -> TtsCache:
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = TtsCache()
+    return _shared_cache
+
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Event-loop stall under concurrent scenario sessions: blocking vs async LLM client.
+
+Runs N scenario pipelines concurrently against a fake LLM with a fixed round-trip
+latency (no network) and reports how long the event loop was blocked.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.llm_client import OpenAIScenarioLLM
+from scenario.loop_monitor import LoopStallMonitor
+from scenario.realtime_pipeline import RealtimeScenarioPipeline
+from scenario.scenario_builder import ScenarioBuilder
+
+UTTERANCES = ["I'm at a cafe", "I'm talking to the barista", "I want to order a latte"]
+
+
+def _reply(prompt: str) -> SimpleNamespace:
+    if "JSON" in prompt or "json" in prompt:
+        text = json.dumps({"place": "cafe", "partner": None, "goal": None})
+    else:
+        text = "Who are you talking to?"
+    return SimpleNamespace(output_text=text)
+
+
+class BlockingResponses:
+    def __init__(self, latency_sec: float) -> None:
+        self._latency_sec = latency_sec
+
+    def create(self, *, model: str, input: str, **_kwargs) -> SimpleNamespace:
+        time.sleep(self._latency_sec)
+        return _reply(input)
+
+
+class AsyncResponses:
+    def __init__(self, latency_sec: float) -> None:
+        self._latency_sec = latency_sec
+
+    async def create(self, *, model: str, input: str, **_kwargs) -> SimpleNamespace:
+        await asyncio.sleep(self._latency_sec)
+        return _reply(input)
+
+
+def build_builder(mode: str, latency_sec: float) -> ScenarioBuilder:
+    llm = OpenAIScenarioLLM(
+        api_key="bench",
+        model="bench",
+        client=SimpleNamespace(responses=BlockingResponses(latency_sec)),
+        async_client=SimpleNamespace(responses=AsyncResponses(latency_sec)),
+    )
+    if mode == "sync":
+        return ScenarioBuilder(extractor=llm.extract_fields, question_generator=llm.generate_followup)
+    return ScenarioBuilder(extractor=llm.extract_fields_async, question_generator=llm.generate_followup_async)
+
+
+async def run_session(mode: str, latency_sec: float) -> None:
+    async def send_response(_text: str) -> None:
+        await asyncio.sleep(0)
+
+    pipeline = RealtimeScenarioPipeline(build_builder(mode, latency_sec), send_response, send_final_response=False)
+    for text in UTTERANCES:
+        await pipeline.handle_event({"type": "conversation.item.input_audio_transcription.completed", "transcript": text})
+
+
+async def measure(mode: str, sessions: int, latency_sec: float) -> dict:
+    started = time.perf_counter()
+    async with LoopStallMonitor() as monitor:
+        await asyncio.gather(*(run_session(mode, latency_sec) for _ in range(sessions)))
+    return {
+        "mode": mode,
+        "sessions": sessions,
+        "wall_ms": round((time.perf_counter() - started) * 1000, 1),
+        **monitor.stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    args = parser.parse_args()
+
+    for sessions in args.sessions:
+        for mode in ("sync", "async"):
+            print(json.dumps(asyncio.run(measure(mode, sessions, args.latency_ms / 1000))))
+
+
+if __name__ == "__main__":
+    main()
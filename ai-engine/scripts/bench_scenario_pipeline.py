@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Scenario-building benchmark: scripted learners against a fake LLM with simulated latency.
+
+Fully offline. For each concurrency level and mode, reports turns to completion,
+per-turn latency (transcript to reply), event-loop stall and audio relay delay.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.benchmark import MODES, LatencyModel, run_benchmark
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--mode", choices=MODES, nargs="+", default=list(MODES))
+    parser.add_argument(
+        "--latency",
+        type=LatencyModel.parse,
+        default=LatencyModel(),
+        help="fixed:MS, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA (default lognormal:400:0.35)",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for sessions in args.sessions:
+        for mode in args.mode:
+            report = asyncio.run(run_benchmark(sessions, mode=mode, latency=args.latency, seed=args.seed))
+            print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import unittest
+
+from scenario.audio_pacing import PACING_BURST, AudioPacer, send_pcm16_audio
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+        self.oversleep = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 4))
+        self.now += seconds + self.oversleep
+
+
+class FakeLink:
+    def __init__(self, send_ahead_frames: int) -> None:
+        self.frames = send_ahead_frames
+
+    def chunk_ms(self) -> int:
+        return 100
+
+    def send_ahead_frames(self, _chunk_ms: int) -> int:
+        return self.frames
+
+
+class AudioPacerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_lead_is_sent_immediately_then_paced(self) -> None:
+        clock = FakeClock()
+        pacer = AudioPacer(lead_ms=500, clock=clock, sleep=clock.sleep)
+        pacer.begin()
+        for _ in range(8):
+            await pacer.after_frame(100)
+        pacer.end()
+        # frames 1-5 fill the 500ms lead, then one frame per 100ms of playback
+        self.assertEqual(clock.sleeps, [0.1, 0.1, 0.1])
+        self.assertEqual(pacer.stats()["busy_ms"], 300.0)
+
+    async def test_oversleep_is_corrected_on_next_frame(self) -> None:
+        clock = FakeClock()
+        clock.oversleep = 0.03
+        pacer = AudioPacer(lead_ms=100, clock=clock, sleep=clock.sleep)
+        pacer.begin()
+        for _ in range(4):
+            await pacer.after_frame(100)
+        # absolute schedule: each 30ms oversleep shortens the next wait
+        self.assertEqual(clock.sleeps, [0.1, 0.07, 0.07])
+        self.assertAlmostEqual(clock.now - 100.0, 0.33)
+
+    async def test_slow_source_reanchors_with_fresh_lead(self) -> None:
+        clock = FakeClock()
+        pacer = AudioPacer(lead_ms=200, clock=clock, sleep=clock.sleep)
+        pacer.begin()
+        await pacer.after_frame(100)
+        clock.now += 1.0  # TTS stalled for a second; the client buffer ran dry
+        await pacer.after_frame(100)
+        await pacer.after_frame(100)
+        self.assertEqual(pacer.stats()["underruns"], 1)
+        self.assertEqual(clock.sleeps, [])
+
+    async def test_burst_never_sleeps(self) -> None:
+        clock = FakeClock()
+        pacer = AudioPacer(PACING_BURST, clock=clock, sleep=clock.sleep)
+        sent: list[dict] = []
+
+        async def send_to_client(payload: dict) -> None:
+            sent.append(payload)
+
+        await send_pcm16_audio(send_to_client, b"\x00" * 48000, sample_rate=24000, pacer=pacer)
+        self.assertEqual(clock.sleeps, [])
+        self.assertEqual(len(sent), 11)
+        self.assertEqual(pacer.stats()["audio_ms"], 1000.0)
+
+    async def test_link_lead_drops_back_once_the_link_recovers(self) -> None:
+        clock = FakeClock()
+        pacer = AudioPacer(lead_ms=500, clock=clock, sleep=clock.sleep)
+        link = FakeLink(send_ahead_frames=10)
+
+        async def send_to_client(_payload: dict) -> None:
+            return None
+
+        await send_pcm16_audio(send_to_client, b"\x00" * 4800, sample_rate=24000, link=link, pacer=pacer)
+        self.assertEqual(pacer.stats()["last_lead_ms"], 1000)
+        link.frames = 2
+        await send_pcm16_audio(send_to_client, b"\x00" * 4800, sample_rate=24000, link=link, pacer=pacer)
+        self.assertEqual(pacer.stats()["last_lead_ms"], 500)
+        self.assertEqual(pacer.lead_ms, 500)
+
+    def test_unknown_mode_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            AudioPacer("turbo")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from scenario.background import BackgroundTaskRunner
+from scenario.titles import build_session_title, refine_session_title
+
+SCENARIO = {"place": "hotel", "partner": "receptionist", "goal": "check in"}
+
+
+class SlowTitleResponses:
+    def __init__(self, title: str, delay_sec: float = 0.05, error: bool = False) -> None:
+        self._title = title
+        self._delay_sec = delay_sec
+        self._error = error
+
+    async def create(self, **_kwargs):
+        await asyncio.sleep(self._delay_sec)
+        if self._error:
+            raise RuntimeError("rate limited")
+        return SimpleNamespace(output_text=f'"{self._title}"')
+
+
+class SessionTitleTests(unittest.IsolatedAsyncioTestCase):
+    async def test_title_is_refined_in_background(self) -> None:
+        runner = BackgroundTaskRunner()
+        persisted: list[str] = []
+        notified: list[str] = []
+
+        async def persist(title: str) -> None:
+            persisted.append(title)
+
+        async def notify(title: str) -> None:
+            notified.append(title)
+
+        client = SimpleNamespace(responses=SlowTitleResponses("Hotel check-in with a receptionist"))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        runner.spawn(
+            refine_session_title(
+                client, "gpt-4o-mini", scenario_state=SCENARIO, transcripts=["I'm checking in"],
+                persist=persist, notify=notify,
+            )
+        )
+        # completion path returns right away; the title arrives later
+        self.assertLess(loop.time() - started, 0.01)
+        self.assertEqual(persisted, [])
+
+        await runner.drain()
+        self.assertEqual(persisted, ["Hotel check-in with a receptionist"])
+        self.assertEqual(notified, persisted)
+        self.assertEqual(runner.stats(), {"started": 1, "completed": 1, "failed": 0, "running": 0})
+
+    async def test_llm_failure_keeps_fallback_title(self) -> None:
+        persisted: list[str] = []
+
+        async def persist(title: str) -> None:
+            persisted.append(title)
+
+        client = SimpleNamespace(responses=SlowTitleResponses("", delay_sec=0, error=True))
+        result = await refine_session_title(
+            client, "gpt-4o-mini", scenario_state=SCENARIO, transcripts=[], persist=persist, notify=persist,
+        )
+        self.assertIsNone(result)
+        self.assertEqual(persisted, [])
+        self.assertEqual(build_session_title(SCENARIO), "hotel / receptionist / check in")
+
+    async def test_failures_are_isolated_and_drain_cancels_stragglers(self) -> None:
+        runner = BackgroundTaskRunner(max_concurrency=1)
+
+        async def boom() -> None:
+            raise RuntimeError("db down")
+
+        async def forever() -> None:
+            await asyncio.sleep(10)
+
+        runner.spawn(boom())
+        runner.spawn(forever())
+        queued = runner.spawn(forever())
+        await runner.drain(timeout=0.05)
+
+        self.assertTrue(queued.cancelled())
+        self.assertEqual(runner.stats()["failed"], 1)
+        self.assertEqual(runner.stats()["running"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import random
+import unittest
+
+from scenario.benchmark import LatencyModel, run_benchmark
+
+
+class LatencyModelTests(unittest.TestCase):
+    def test_parse_specs(self) -> None:
+        self.assertEqual(LatencyModel.parse("fixed:120"), LatencyModel("fixed", 120.0, 0.0))
+        self.assertEqual(LatencyModel.parse("uniform:50:150"), LatencyModel("uniform", 50.0, 150.0))
+        with self.assertRaises(ValueError):
+            LatencyModel.parse("normal:1:2")
+
+    def test_samples_stay_in_range(self) -> None:
+        rng = random.Random(1)
+        samples = [LatencyModel("uniform", 50, 150).sample_sec(rng) for _ in range(100)]
+        self.assertTrue(all(0.05 <= value <= 0.15 for value in samples))
+
+
+class RunBenchmarkTests(unittest.IsolatedAsyncioTestCase):
+    async def test_all_scripted_sessions_complete(self) -> None:
+        report = await run_benchmark(4, latency=LatencyModel("fixed", 5, 0))
+        self.assertEqual(report["completed"], 4)
+        self.assertEqual(report["turns_max"], 4)
+        self.assertGreater(report["turn_ms_p50"], 0)
+        self.assertIn("max_stall_ms", report["loop"])
+
+    async def test_combined_mode_halves_llm_calls(self) -> None:
+        latency = LatencyModel("fixed", 5, 0)
+        baseline = await run_benchmark(4, mode="baseline", latency=latency)
+        combined = await run_benchmark(4, mode="combined", latency=latency)
+        self.assertLess(combined["llm_calls"], baseline["llm_calls"])
+        self.assertEqual(combined["completed"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import asyncio
+import unittest
+
+from scenario.catalog_extractor import CatalogFastPath, CatalogIndex
+from scenario.realtime_pipeline import RealtimeScenarioPipeline
+from scenario.scenario_builder import ScenarioBuilder
+
+CATALOG = [
+    {"place": "Airport Check-in Counter", "partner": "Check-in Agent", "goal": "Get a window seat and check baggage"},
+    {"place": "Starbucks Counter", "partner": "Busy Barista", "goal": "Order an Iced Americano with minimal ice"},
+]
+
+
+class CatalogIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = CatalogIndex.from_definitions(CATALOG)
+
+    def test_catalog_values_and_synonyms_are_matched(self) -> None:
+        match = self.index.match("I'm at the airport check-in counter talking to staff")
+        self.assertTrue(match.confident)
+        self.assertEqual(match.fields, {"place": "Airport Check-in Counter", "partner": "staff", "goal": None})
+
+    def test_asr_typos_match_with_lower_confidence(self) -> None:
+        match = self.index.match("I am at the airprt to check in")
+        self.assertEqual(match.fields["place"], "airport")
+        self.assertEqual(match.fields["goal"], "check in")
+        self.assertLess(match.confidence, 1.0)
+        self.assertTrue(match.confident)
+
+    def test_unexplained_words_are_left_to_the_llm(self) -> None:
+        self.assertFalse(self.index.match("I want to get a refund at the airport").confident)
+        self.assertFalse(self.index.match("yes").confident)
+
+
+class CatalogFastPathTests(unittest.IsolatedAsyncioTestCase):
+    async def test_fast_path_skips_llm_on_confident_match(self) -> None:
+        llm_calls: list[str] = []
+
+        async def llm_extract(text: str) -> dict:
+            llm_calls.append(text)
+            await asyncio.sleep(0.01)
+            return {"place": "airport", "partner": None, "goal": "get a refund"}
+
+        fast_path = CatalogFastPath(CatalogIndex.from_definitions(CATALOG))
+        sent: list[str] = []
+
+        async def send_response(text: str) -> None:
+            sent.append(text)
+
+        builder = ScenarioBuilder(extractor=fast_path.extractor(llm_extract))
+        pipeline = RealtimeScenarioPipeline(builder, send_response)
+        for transcript in ("I want to get a refund at the airport", "talking to a busy barista"):
+            await pipeline.handle_event(
+                {"type": "conversation.item.input_audio_transcription.completed", "transcript": transcript}
+            )
+
+        self.assertEqual(llm_calls, ["I want to get a refund at the airport"])
+        self.assertEqual(builder.state.partner, "Busy Barista")
+        stats = fast_path.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["hit_rate"]), (1, 1, 0.5))
+        self.assertGreater(stats["avg_llm_ms"], 5)
+        self.assertGreater(stats["saved_ms"], 0)
+
+    async def test_planner_hit_uses_default_question(self) -> None:
+        async def llm_plan(_state, _text) -> dict:
+            raise AssertionError("LLM should not be called")
+
+        fast_path = CatalogFastPath()
+        builder = ScenarioBuilder(turn_planner=fast_path.planner(llm_plan))
+        self.assertEqual(await builder.plan_turn_async("at a cafe"), "Who are you talking to?")
+        self.assertEqual(builder.state.place, "cafe")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from scenario.checkpoints import ScenarioCheckpointStore
+from scenario.realtime_pipeline import RealtimeScenarioPipeline
+from scenario.scenario_builder import DEFAULT_QUESTIONS, ScenarioBuilder
+from scenario.scenario_state import ScenarioState
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ScenarioStateRoundTripTests(unittest.TestCase):
+    def test_to_dict_and_back(self) -> None:
+        state = ScenarioState(place="cafe", attempts=2, asked_fields={"partner", "goal"})
+        data = state.to_dict()
+        self.assertEqual(data["asked_fields"], ["goal", "partner"])
+        self.assertEqual(ScenarioState.from_dict(data), state)
+
+
+class CheckpointStoreTests(unittest.TestCase):
+    def test_load_is_bound_to_user_and_expires(self) -> None:
+        clock = FakeClock()
+        store = ScenarioCheckpointStore(ttl_sec=60, clock=clock)
+        token = store.new_token()
+        store.save(token, ScenarioState(place="hotel"), ["hotel front desk"], user_id=7)
+
+        self.assertIsNone(store.load(token, user_id=8))
+        checkpoint = store.load(token, user_id=7)
+        self.assertEqual(checkpoint.restore_state().place, "hotel")
+        self.assertEqual(checkpoint.transcripts, ["hotel front desk"])
+
+        clock.now = 61
+        self.assertIsNone(store.load(token, user_id=7))
+        self.assertEqual(store.stats()["expired"], 1)
+
+    def test_evicts_oldest_past_capacity(self) -> None:
+        store = ScenarioCheckpointStore(max_entries=2)
+        for token in ("a", "b", "c"):
+            store.save(token, ScenarioState(), [])
+        self.assertIsNone(store.load("a"))
+        self.assertIsNotNone(store.load("c"))
+        self.assertEqual(store.stats()["evicted"], 1)
+
+
+class ResumeTests(unittest.IsolatedAsyncioTestCase):
+    async def test_checkpoint_each_turn_and_resume_at_next_missing_field(self) -> None:
+        store = ScenarioCheckpointStore()
+        token = store.new_token()
+        facts = {"I'm at a cafe": {"place": "cafe", "partner": None, "goal": None}}
+        builder = ScenarioBuilder(
+            extractor=lambda text: facts.get(text, {}),
+            question_generator=lambda state, missing: "Who are you talking to?",
+        )
+        order: list[str] = []
+
+        def on_turn(turn_builder: ScenarioBuilder) -> None:
+            order.append("checkpoint")
+            store.save(token, turn_builder.state, ["I'm at a cafe"])
+
+        async def send_response(text: str) -> None:
+            order.append("reply")
+
+        pipeline = RealtimeScenarioPipeline(builder, send_response, on_turn=on_turn)
+        await pipeline.handle_event(
+            {"type": "conversation.item.input_audio_transcription.completed", "transcript": "I'm at a cafe"}
+        )
+        self.assertEqual(order, ["checkpoint", "reply"])
+
+        # the socket drops; a new connection restores the builder from the token
+        restored = ScenarioBuilder(state=store.load(token).restore_state())
+        self.assertEqual(restored.state.place, "cafe")
+        self.assertEqual(restored.state.attempts, 1)
+        self.assertEqual(restored.resume_question(), DEFAULT_QUESTIONS["goal"])
+        self.assertEqual(restored.state.attempts, 1)
+
+    def test_no_resume_question_when_complete(self) -> None:
+        builder = ScenarioBuilder(state=ScenarioState(place="cafe", partner="barista", goal="order coffee"))
+        self.assertIsNone(builder.resume_question())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,348 @@
+import asyncio
+import base64
+import json
+import unittest
+from unittest import mock
+
+from fastapi import WebSocketDisconnect
+
+from realtime_conversation import connection_handler
+from realtime_common.audio_buffer import PcmRingBuffer
+from realtime_conversation.connection_handler import ConnectionHandler
+from realtime_conversation.endpointing import AdaptiveEndpointing
+from realtime_conversation.greeting_cache import CachedGreeting, GreetingCache
+
+
+class FakeOpenAIWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+        self.closed = False
+        self._incoming: asyncio.Queue = asyncio.Queue()
+
+    async def send(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+    async def close(self) -> None:
+        self.closed = True
+        self._incoming.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        message = await self._incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+class FakeClientWebSocket:
+    def __init__(self, messages: list[dict] | None = None, linger: float = 0.05) -> None:
+        self.sent: list[dict] = []
+        self._messages = list(messages or [])
+        self._linger = linger
+
+    async def send_json(self, payload: dict) -> None:
+        self.sent.append(payload)
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+    async def receive_text(self) -> str:
+        if not self._messages:
+            # 업스트림 연결이 백그라운드로 끝날 시간을 준 뒤 연결 종료
+            await asyncio.sleep(self._linger)
+            raise WebSocketDisconnect()
+        return json.dumps(self._messages.pop(0))
+
+
+class IdleSuspensionTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.upstreams: list[FakeOpenAIWebSocket] = []
+
+        async def fake_connect(*_args, **_kwargs):
+            ws = FakeOpenAIWebSocket()
+            self.upstreams.append(ws)
+            return ws
+
+        patcher = mock.patch.object(connection_handler.websockets, "connect", fake_connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_suspend_after_idle_and_resume_on_audio(self) -> None:
+        client = FakeClientWebSocket([{"type": "input_audio_buffer.append", "audio": "AAAA"}])
+        handler = ConnectionHandler(client, "test-key", idle_timeout_sec=0.05)
+        await handler.connect_to_openai()
+        handler.tracker.add_transcript("assistant", "Hello there")
+
+        handler.idle_task = asyncio.create_task(handler.watch_idle())
+        await asyncio.sleep(0.2)
+        handler.idle_task.cancel()
+
+        self.assertTrue(handler.is_suspended)
+        self.assertIsNone(handler.openai_ws)
+        self.assertTrue(self.upstreams[0].closed)
+        self.assertIn({"type": "session.suspended", "reason": "idle"}, client.sent)
+
+        await handler.receive_from_client()
+        await handler.connect_task
+
+        self.assertFalse(handler.is_suspended)
+        self.assertEqual(len(self.upstreams), 2)
+        resumed_types = [event["type"] for event in self.upstreams[1].sent]
+        self.assertNotIn("response.create", resumed_types)
+        self.assertEqual(resumed_types[-1], "input_audio_buffer.append")
+        replayed = [
+            event["item"]["content"][0]["text"]
+            for event in self.upstreams[1].sent
+            if event["type"] == "conversation.item.create"
+        ]
+        self.assertEqual(replayed, ["Hello there"])
+        self.assertIn({"type": "session.resumed"}, client.sent)
+        await handler.cleanup()
+
+    async def test_prewarmed_socket_is_reused_after_session_data(self) -> None:
+        handler = ConnectionHandler(FakeClientWebSocket(), "test-key", idle_timeout_sec=0)
+        await handler.prewarm_openai()
+        handler.apply_session_data(history=[{"role": "user", "content": "Hi"}], voice="shimmer")
+
+        await handler.start()
+
+        self.assertEqual(len(self.upstreams), 1)
+        sent = self.upstreams[0].sent
+        self.assertEqual(sent[0]["type"], "session.update")
+        self.assertEqual(sent[0]["session"]["voice"], "shimmer")
+        self.assertEqual(sent[1]["item"]["content"][0]["text"], "Hi")
+
+    async def test_audio_during_connect_is_buffered_and_flushed_in_order(self) -> None:
+        gate = asyncio.Event()
+
+        async def slow_connect(*_args, **_kwargs):
+            await gate.wait()
+            ws = FakeOpenAIWebSocket()
+            self.upstreams.append(ws)
+            return ws
+
+        chunks = [base64.b64encode(bytes([idx]) * 4800).decode("ascii") for idx in range(3)]
+        appends = [{"type": "input_audio_buffer.append", "audio": chunk} for chunk in chunks]
+        client = FakeClientWebSocket(appends[:2] + [{"type": "input_audio_buffer.commit"}] + appends[2:])
+        handler = ConnectionHandler(client, "test-key", idle_timeout_sec=0)
+
+        with mock.patch.object(connection_handler.websockets, "connect", slow_connect):
+            handler.connect_task = asyncio.create_task(handler.connect_to_openai(trigger_first_turn=False))
+            await handler.receive_from_client()
+            self.assertEqual(handler.early_audio.size, 3 * 4800)
+            gate.set()
+            await handler.connect_task
+
+        sent = self.upstreams[0].sent
+        appended = [event["audio"] for event in sent if event["type"] == "input_audio_buffer.append"]
+        self.assertEqual(appended, chunks)
+        # the commit covers only the audio that arrived before it
+        input_types = [event["type"] for event in sent if event["type"].startswith("input_audio_buffer.")]
+        self.assertEqual(
+            input_types[-4:],
+            ["input_audio_buffer.append"] * 2 + ["input_audio_buffer.commit", "input_audio_buffer.append"],
+        )
+        self.assertTrue(handler.upstream_ready)
+        self.assertEqual(handler.early_audio.stats()["preserved_ms"], 300)
+
+    async def test_upstream_drop_reconnects_and_replays_history(self) -> None:
+        client = FakeClientWebSocket()
+        handler = ConnectionHandler(client, "test-key", idle_timeout_sec=0)
+        await handler.connect_to_openai(trigger_first_turn=False)
+        handler.tracker.add_transcript("assistant", "Where are you going?")
+        handler.tracker.add_transcript("user", "To the airport")
+
+        # 의도하지 않은 끊김 (close() 호출 없이 스트림 종료)
+        self.upstreams[0]._incoming.put_nowait(None)
+        await handler.openai_task
+        await handler.recovery_task
+
+        self.assertEqual(len(self.upstreams), 2)
+        self.assertIs(handler.openai_ws, self.upstreams[1])
+        resumed = self.upstreams[1].sent
+        self.assertEqual(resumed[0]["type"], "session.update")
+        replayed = [
+            event["item"]["content"][0]["text"]
+            for event in resumed
+            if event["type"] == "conversation.item.create"
+        ]
+        self.assertEqual(replayed, ["Where are you going?", "To the airport"])
+        self.assertEqual(resumed[-1]["type"], "response.create")
+        self.assertIn({"type": "session.reconnecting"}, client.sent)
+        self.assertIn({"type": "session.recovered"}, client.sent)
+        self.assertEqual(handler.reconnect_policy.log.stats()["recovered"], 1)
+        await handler.cleanup()
+
+    def test_compact_history_keeps_recent_messages(self) -> None:
+        history = [{"role": "user", "content": f"msg {idx}"} for idx in range(30)]
+        handler = ConnectionHandler(FakeClientWebSocket(), "test-key", history=history)
+        compacted = handler.compact_history(limit=5)
+        self.assertEqual([msg["content"] for msg in compacted], [f"msg {idx}" for idx in range(25, 30)])
+
+
+class EventSubscriptionTests(unittest.IsolatedAsyncioTestCase):
+    async def test_show_text_off_prunes_captions(self) -> None:
+        client = FakeClientWebSocket()
+        handler = ConnectionHandler(client, "test-key")
+        handler.apply_session_data(show_text=False)
+
+        await handler.send_to_client({"type": "transcript.done", "transcript": "Hello there"})
+        await handler.send_to_client({"type": "speech.started"})
+
+        self.assertEqual(client.sent, [{"type": "speech.started"}])
+        stats = handler.subscription.stats()
+        self.assertEqual(stats["suppressed_messages"], 1)
+        self.assertGreater(stats["suppressed_bytes"], len("Hello there"))
+
+    async def test_explicit_events_override_show_text(self) -> None:
+        handler = ConnectionHandler(FakeClientWebSocket(), "test-key", events="captions")
+        handler.apply_session_data(show_text=True)
+        self.assertFalse(handler.subscription.wants("audio"))
+        self.assertTrue(handler.subscription.wants("captions"))
+
+    async def test_unknown_events_fall_back_to_show_text(self) -> None:
+        handler = ConnectionHandler(FakeClientWebSocket(), "test-key", events="foo,bar")
+        handler.apply_session_data(show_text=False)
+        self.assertFalse(handler.subscription.explicit)
+        self.assertTrue(handler.subscription.wants("audio"))
+        self.assertFalse(handler.subscription.wants("captions"))
+
+        await handler.update_subscription(["foo"])
+        self.assertTrue(handler.subscription.wants("audio"))
+
+    async def test_captions_only_requests_text_modality(self) -> None:
+        upstreams: list[FakeOpenAIWebSocket] = []
+
+        async def fake_connect(*_args, **_kwargs):
+            ws = FakeOpenAIWebSocket()
+            upstreams.append(ws)
+            return ws
+
+        handler = ConnectionHandler(FakeClientWebSocket(), "test-key", events="captions")
+        with mock.patch.object(connection_handler.websockets, "connect", fake_connect):
+            await handler.connect_to_openai()
+            await handler.update_subscription(["audio", "captions"])
+        await handler.cleanup()
+
+        sent = upstreams[0].sent
+        self.assertEqual(sent[0]["session"]["modalities"], ["text"])
+        first_turn = [event for event in sent if event["type"] == "response.create"]
+        self.assertEqual(first_turn[0]["response"]["modalities"], ["text"])
+        self.assertEqual(sent[-1], {"type": "session.update", "session": {"modalities": ["audio", "text"]}})
+
+
+class PcmRingBufferTests(unittest.TestCase):
+    def test_overflow_drops_oldest_chunks(self) -> None:
+        buffer = PcmRingBuffer(max_bytes=10)
+        for chunk in (b"aaaa", b"bbbb", b"cccc"):
+            buffer.append(chunk)
+        self.assertEqual(buffer.drain(), [b"bbbb", b"cccc"])
+        self.assertEqual(buffer.stats()["preserved_bytes"], 8)
+        self.assertEqual(buffer.stats()["dropped_bytes"], 4)
+
+    def test_oversized_chunk_keeps_latest_bytes(self) -> None:
+        buffer = PcmRingBuffer(max_bytes=4)
+        buffer.append(b"abcdef")
+        self.assertEqual(buffer.drain(), [b"cdef"])
+        self.assertEqual(buffer.dropped_bytes, 2)
+
+
+class AdaptiveEndpointingTests(unittest.TestCase):
+    BASE = {"type": "server_vad", "threshold": 0.7, "prefix_padding_ms": 300, "silence_duration_ms": 1500}
+
+    def test_clean_turns_shrink_silence_within_bounds(self) -> None:
+        endpointing = AdaptiveEndpointing(self.BASE)
+        for _ in range(20):
+            endpointing.on_speech_stopped()
+            endpointing.on_speech_started(5.0)
+        self.assertEqual(endpointing.silence_ms, 500)
+        self.assertEqual(endpointing.turn_detection()["threshold"], 0.7)
+        stats = endpointing.stats()
+        self.assertEqual(stats["false_endpoints"], 0)
+        self.assertGreater(stats["saved_ms_per_turn"], 0)
+
+    def test_false_endpoint_backs_off_above_observed_pause(self) -> None:
+        endpointing = AdaptiveEndpointing(self.BASE)
+        for _ in range(8):
+            endpointing.on_speech_stopped()
+            endpointing.on_speech_started(5.0)
+        endpointing.on_speech_stopped()
+        changed = endpointing.on_speech_started(0.3)
+        self.assertTrue(changed)
+        self.assertEqual(endpointing.false_endpoints, 1)
+        # 적용 중이던 700ms + 간격 300ms 멈춤 + 여유 200ms
+        self.assertEqual(endpointing.silence_ms, 1200)
+
+    def test_non_server_vad_is_left_untouched(self) -> None:
+        endpointing = AdaptiveEndpointing({"type": "semantic_vad"})
+        endpointing.on_speech_stopped()
+        self.assertFalse(endpointing.on_speech_started(5.0))
+
+
+class GreetingCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        GreetingCache().clear()
+        self.addCleanup(GreetingCache().clear)
+        self.upstreams: list[FakeOpenAIWebSocket] = []
+
+        async def fake_connect(*_args, **_kwargs):
+            ws = FakeOpenAIWebSocket()
+            self.upstreams.append(ws)
+            return ws
+
+        patcher = mock.patch.object(connection_handler.websockets, "connect", fake_connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_edited_definition_changes_cache_key(self) -> None:
+        context = {"title": "Ordering coffee", "place": "Cafe", "partner": "Barista", "goal": "Order a latte"}
+        original = ConnectionHandler(FakeClientWebSocket(), "test-key", context=dict(context), scenario_id="cafe")
+        same = ConnectionHandler(FakeClientWebSocket(), "test-key", context=dict(reversed(list(context.items()))), scenario_id="cafe")
+        edited = ConnectionHandler(
+            FakeClientWebSocket(), "test-key", context={**context, "goal": "Order tea"}, scenario_id="cafe"
+        )
+        self.assertEqual(original.greeting_cache_key(), same.greeting_cache_key())
+        self.assertNotEqual(original.greeting_cache_key(), edited.greeting_cache_key())
+
+    def test_capture_first_response(self) -> None:
+        handler = ConnectionHandler(FakeClientWebSocket(), "test-key", scenario_id="airport_01")
+        handler.start_greeting_capture()
+        audio = base64.b64encode(b"\x01\x02" * 10).decode("ascii")
+        handler.capture_greeting_event({"type": "response.audio.delta", "delta": audio})
+        handler.capture_greeting_event({"type": "response.audio_transcript.done", "transcript": "Welcome!"})
+        handler.capture_greeting_event({"type": "response.done", "response": {"status": "completed"}})
+
+        cached = GreetingCache().get(handler.greeting_cache_key())
+        self.assertEqual(cached.text, "Welcome!")
+        self.assertEqual(cached.audio, b"\x01\x02" * 10)
+
+    def test_interrupted_response_is_not_cached(self) -> None:
+        handler = ConnectionHandler(FakeClientWebSocket(), "test-key", scenario_id="airport_01")
+        handler.start_greeting_capture()
+        handler.capture_greeting_event({"type": "response.audio.delta", "delta": "AQI="})
+        handler.capture_greeting_event({"type": "input_audio_buffer.speech_started"})
+        handler.capture_greeting_event({"type": "response.audio_transcript.done", "transcript": "Welcome!"})
+        handler.capture_greeting_event({"type": "response.done", "response": {"status": "completed"}})
+        self.assertIsNone(GreetingCache().get(handler.greeting_cache_key()))
+
+    async def test_cached_greeting_plays_and_seeds_upstream(self) -> None:
+        client = FakeClientWebSocket()
+        handler = ConnectionHandler(client, "test-key", scenario_id="airport_01", idle_timeout_sec=0)
+        GreetingCache().put(handler.greeting_cache_key(), CachedGreeting(text="Welcome!", audio=b"\x00" * 10000))
+
+        await handler.start()
+
+        client_types = [payload["type"] for payload in client.sent]
+        self.assertEqual(client_types[:3], ["audio.delta", "audio.delta", "audio.delta"])
+        self.assertIn({"type": "transcript.done", "transcript": "Welcome!"}, client.sent)
+        upstream = self.upstreams[0].sent
+        self.assertNotIn("response.create", [event["type"] for event in upstream])
+        seeded = [event["item"] for event in upstream if event["type"] == "conversation.item.create"]
+        self.assertEqual(seeded[0]["role"], "assistant")
+        self.assertEqual(seeded[0]["content"][0]["text"], "Welcome!")
+
+
+if __name__ == "__main__":
+    unittest.main()
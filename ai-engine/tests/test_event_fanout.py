@@ -0,0 +1,95 @@
+import asyncio
+import unittest
+
+from scenario.realtime_handlers import OVERFLOW_DROP_OLDEST, HandlerSpec, fanout_event_handler
+
+
+class EventFanoutTests(unittest.IsolatedAsyncioTestCase):
+    async def test_audio_relay_does_not_wait_for_slow_pipeline(self) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        audio_at: list[float] = []
+        pipeline_seen: list[str] = []
+
+        async def audio_relay(event: dict) -> None:
+            if event["type"] == "response.audio.delta":
+                audio_at.append(loop.time() - started)
+
+        async def pipeline(event: dict) -> None:
+            pipeline_seen.append(event["type"])
+            await asyncio.sleep(0.2)  # LLM extraction
+
+        fanout = fanout_event_handler(
+            [
+                HandlerSpec(audio_relay, name="audio_relay"),
+                HandlerSpec(pipeline, name="pipeline", accepts=lambda e: e["type"].startswith("conversation.item")),
+            ]
+        )
+        await fanout({"type": "conversation.item.input_audio_transcription.completed", "transcript": "hi"})
+        for _ in range(3):
+            await fanout({"type": "response.audio.delta", "delta": "AAAA"})
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(len(audio_at), 3)
+        self.assertLess(max(audio_at), 0.05)
+        self.assertEqual(pipeline_seen, ["conversation.item.input_audio_transcription.completed"])
+        await fanout.aclose(timeout=0.5)
+        stats = fanout.stats()
+        self.assertEqual(stats["pipeline"]["handled"], 1)
+        self.assertGreaterEqual(stats["pipeline"]["max_run_ms"], 150)
+        self.assertEqual(stats["audio_relay"]["handled"], 4)
+
+    async def test_order_is_kept_and_failures_are_isolated(self) -> None:
+        seen: list[int] = []
+
+        async def flaky(event: dict) -> None:
+            if event["n"] == 1:
+                raise RuntimeError("boom")
+
+        def ordered(event: dict) -> None:
+            seen.append(event["n"])
+
+        fanout = fanout_event_handler([HandlerSpec(flaky, name="flaky"), HandlerSpec(ordered, name="ordered")])
+        for n in range(5):
+            await fanout({"type": "x", "n": n})
+        await fanout.join()
+
+        self.assertEqual(seen, [0, 1, 2, 3, 4])
+        self.assertEqual(fanout.stats()["flaky"]["errors"], 1)
+        self.assertEqual(fanout.stats()["flaky"]["handled"], 5)
+        await fanout.aclose()
+
+    async def test_backpressure_policies(self) -> None:
+        release = asyncio.Event()
+        debug_seen: list[int] = []
+
+        async def stuck(event: dict) -> None:
+            await release.wait()
+
+        async def debug(event: dict) -> None:
+            await release.wait()
+            debug_seen.append(event["n"])
+
+        fanout = fanout_event_handler(
+            [HandlerSpec(debug, name="debug", max_queue=2, overflow=OVERFLOW_DROP_OLDEST), HandlerSpec(stuck, name="stuck", max_queue=2)]
+        )
+        await fanout({"type": "x", "n": 0})
+        await asyncio.sleep(0)  # both lanes pick up event 0
+        await fanout({"type": "x", "n": 1})
+        await fanout({"type": "x", "n": 2})
+
+        blocked = asyncio.create_task(fanout({"type": "x", "n": 3}))
+        await asyncio.sleep(0.01)
+        # the bounded "block" lane holds the producer back once it is full
+        self.assertFalse(blocked.done())
+        release.set()
+        await blocked
+        await fanout.join()
+
+        self.assertEqual(fanout.stats()["debug"]["dropped"], 1)
+        self.assertEqual(debug_seen, [0, 2, 3])
+        await fanout.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import asyncio
+import unittest
+
+from scenario.extraction_cache import EXTRACTION_PROMPT_VERSION, ExtractionCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingExtractor:
+    def __init__(self, result: dict, delay_sec: float = 0.0) -> None:
+        self.result = result
+        self.delay_sec = delay_sec
+        self.calls: list[str] = []
+
+    async def __call__(self, text: str) -> dict:
+        self.calls.append(text)
+        await asyncio.sleep(self.delay_sec)
+        return dict(self.result)
+
+
+class ExtractionCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_normalized_repeats_hit_the_cache(self) -> None:
+        llm = CountingExtractor({"place": "cafe", "partner": None, "goal": None})
+        cache = ExtractionCache()
+        extract = cache.extractor(llm)
+
+        first = await extract("At a cafe.")
+        first["place"] = "mutated"
+        second = await extract("  at a  CAFE ")
+
+        self.assertEqual(llm.calls, ["At a cafe."])
+        self.assertEqual(second, {"place": "cafe", "partner": None, "goal": None})
+        self.assertEqual(cache.stats()["hit_rate"], 0.5)
+
+    async def test_cache_is_shared_by_sessions(self) -> None:
+        llm = CountingExtractor({"place": "hotel front desk", "partner": None, "goal": None}, delay_sec=0.02)
+        cache = ExtractionCache()
+        results = await asyncio.gather(*(cache.extractor(llm)("hotel front desk") for _ in range(5)))
+        self.assertEqual(len(llm.calls), 1)
+        self.assertTrue(all(result["place"] == "hotel front desk" for result in results))
+        self.assertEqual(cache.stats()["hits"], 4)
+
+    async def test_entries_expire_and_are_bounded(self) -> None:
+        clock = FakeClock()
+        llm = CountingExtractor({"place": None, "partner": None, "goal": "order coffee"})
+        cache = ExtractionCache(max_entries=2, ttl_sec=60, clock=clock)
+        extract = cache.extractor(llm)
+
+        await extract("ordering coffee")
+        clock.now = 61
+        await extract("ordering coffee")
+        self.assertEqual(len(llm.calls), 2)
+        self.assertEqual(cache.stats()["expired"], 1)
+
+        await extract("order a latte")
+        await extract("order a tea")
+        self.assertEqual(cache.stats()["entries"], 2)
+        self.assertEqual(cache.stats()["evicted"], 1)
+
+    async def test_prompt_version_and_empty_results(self) -> None:
+        cache = ExtractionCache()
+        cache.put("at a cafe", {"place": "cafe", "partner": None, "goal": None})
+        self.assertNotEqual(ExtractionCache(prompt_version="other").key("at a cafe"), cache.key("at a cafe"))
+        self.assertEqual(cache.key("at a cafe")[0], EXTRACTION_PROMPT_VERSION)
+
+        cache.put("yes", {"place": None, "partner": None, "goal": None})
+        self.assertIsNone(cache.get("yes"))
+
+    async def test_failures_are_not_cached(self) -> None:
+        calls = 0
+
+        async def flaky(_text: str) -> dict:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("timeout")
+            return {"place": "bank", "partner": None, "goal": None}
+
+        extract = ExtractionCache().extractor(flaky)
+        with self.assertRaises(RuntimeError):
+            await extract("at the bank")
+        self.assertEqual((await extract("at the bank"))["place"], "bank")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from realtime_common.link_quality import (
+    DEFAULT_CHUNK_MS,
+    MAX_CHUNK_MS,
+    MIN_CHUNK_MS,
+    AudioFrameCoalescer,
+    LinkQualityEstimator,
+)
+
+
+class LinkQualityEstimatorTests(unittest.TestCase):
+    def test_defaults_to_fixed_chunk_without_samples(self) -> None:
+        link = LinkQualityEstimator()
+        self.assertEqual(link.chunk_ms(), DEFAULT_CHUNK_MS)
+        self.assertEqual(link.chunk_bytes(24000), 4800)
+        self.assertEqual(link.send_ahead_frames(), 1)
+
+    def test_low_latency_link_uses_small_frames(self) -> None:
+        link = LinkQualityEstimator()
+        for _ in range(5):
+            link.record_rtt(15)
+        self.assertEqual(link.chunk_ms(), MIN_CHUNK_MS)
+
+    def test_high_latency_link_uses_large_frames_and_deeper_send_ahead(self) -> None:
+        link = LinkQualityEstimator()
+        for _ in range(5):
+            link.record_rtt(350)
+        self.assertEqual(link.chunk_ms(), 360)
+        self.assertEqual(link.send_ahead_frames(), 2)
+
+    def test_congested_link_grows_frames(self) -> None:
+        link = LinkQualityEstimator()
+        link.record_rtt(60)
+        link.record_send(8000, 0.5)
+        self.assertTrue(link.congested)
+        self.assertEqual(link.chunk_ms(), 200)
+        self.assertLessEqual(link.chunk_ms(), MAX_CHUNK_MS)
+
+    def test_pong_matches_ping(self) -> None:
+        link = LinkQualityEstimator()
+        ping = link.make_ping()
+        self.assertTrue(link.handle_pong({"type": "pong", "id": ping["id"]}))
+        self.assertFalse(link.handle_pong({"type": "pong", "id": ping["id"]}))
+        self.assertIsNotNone(link.stats()["rtt_ms"])
+
+
+class AudioFrameCoalescerTests(unittest.TestCase):
+    def test_regroups_deltas_into_link_sized_frames(self) -> None:
+        link = LinkQualityEstimator()
+        link.record_rtt(40)
+        coalescer = AudioFrameCoalescer(link)
+        frames = coalescer.push(b"\x00" * 1000)
+        self.assertEqual(frames, [])
+        frames = coalescer.push(b"\x00" * 4000)
+        self.assertEqual([len(frame) for frame in frames], [1920, 1920])
+        self.assertEqual(len(coalescer.flush()), 1160)
+        self.assertIsNone(coalescer.flush())
+
+
+if __name__ == "__main__":
+    unittest.main()
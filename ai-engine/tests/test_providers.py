@@ -0,0 +1,70 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from scenario import providers
+from scenario.config import AppConfig
+from scenario.providers import ScenarioRuntime, close_scenario_runtime, get_scenario_runtime, set_scenario_runtime
+
+
+class FakeSessions:
+    def __init__(self) -> None:
+        self.created = 0
+
+    def create(self, model: str):
+        self.created += 1
+        return SimpleNamespace(client_secret=SimpleNamespace(value=f"ek_{self.created}"))
+
+
+class FakeAsyncClient:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class ScenarioRuntimeTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        set_scenario_runtime(None)
+        self.addCleanup(set_scenario_runtime, None)
+
+    def _runtime(self) -> ScenarioRuntime:
+        client = SimpleNamespace(realtime=SimpleNamespace(sessions=FakeSessions()))
+        return ScenarioRuntime(config=AppConfig(api_key="sk-test"), client=client, async_client=FakeAsyncClient())
+
+    def test_config_and_clients_are_built_once_per_process(self) -> None:
+        runtime = self._runtime()
+        with mock.patch.object(providers.ScenarioRuntime, "from_config", return_value=runtime) as from_config, \
+                mock.patch.object(providers.AppConfig, "from_env", return_value=runtime.config) as from_env:
+            first = get_scenario_runtime()
+            second = get_scenario_runtime()
+        self.assertIs(first, second)
+        self.assertEqual(from_env.call_count, 1)
+        self.assertEqual(from_config.call_count, 1)
+
+    def test_connections_share_the_sdk_clients(self) -> None:
+        runtime = self._runtime()
+        info = runtime.session_manager().create_session()
+        runtime.session_manager().create_session()
+        self.assertEqual(info.bearer_token, "ek_1")
+        self.assertEqual(runtime.client.realtime.sessions.created, 2)
+
+        llm_a, llm_b = runtime.llm(), runtime.llm()
+        self.assertIs(llm_a._client, runtime.client)
+        self.assertIs(llm_b._async_client, runtime.async_client)
+
+    async def test_close_releases_clients_and_resets(self) -> None:
+        runtime = self._runtime()
+        set_scenario_runtime(runtime)
+        await close_scenario_runtime()
+        self.assertTrue(runtime.async_client.closed)
+        self.assertIsNone(providers._runtime)
+
+    async def test_start_without_api_key_is_skipped(self) -> None:
+        with mock.patch.object(providers.AppConfig, "from_env", side_effect=RuntimeError("OPENAI_API_KEY is required")):
+            self.assertIsNone(await providers.start_scenario_runtime())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,249 @@
+import asyncio
+import base64
+import json
+import unittest
+from unittest import mock
+
+from realtime_common.reconnect import ReconnectPolicy, build_replay_items
+from scenario import realtime_session
+from scenario.replay import HeldInput, build_scenario_replay
+from scenario.realtime_session import RealtimeSessionInfo, RealtimeWebSocketClient, SessionHandshake
+from scenario.scenario_state import ScenarioState
+
+
+class ReconnectPolicyTests(unittest.IsolatedAsyncioTestCase):
+    def test_delay_grows_with_jitter_and_cap(self) -> None:
+        policy = ReconnectPolicy(base_delay_sec=0.5, max_delay_sec=2.0, rng=lambda: 1.0)
+        self.assertEqual(policy.delay(0), 0.0)
+        self.assertEqual([policy.delay(n) for n in (1, 2, 3, 4)], [0.5, 1.0, 2.0, 2.0])
+        low = ReconnectPolicy(base_delay_sec=0.5, rng=lambda: 0.0)
+        self.assertEqual(low.delay(2), 0.5)
+
+    async def test_recover_retries_until_success(self) -> None:
+        waits: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            waits.append(seconds)
+
+        calls = {"count": 0}
+
+        async def reconnect() -> None:
+            calls["count"] += 1
+            if calls["count"] < 3:
+                raise ConnectionError("refused")
+
+        policy = ReconnectPolicy(rng=lambda: 0.0, sleep=fake_sleep)
+        self.assertTrue(await policy.recover(reconnect, "dropped"))
+        self.assertEqual(waits, [0.25, 0.5])
+        stats = policy.log.stats()
+        self.assertEqual(stats["recovered"], 1)
+        self.assertEqual(stats["history"][0]["attempts"], 3)
+
+    async def test_recover_gives_up_after_max_attempts(self) -> None:
+        async def fake_sleep(_seconds: float) -> None:
+            return None
+
+        async def reconnect() -> None:
+            raise ConnectionError("refused")
+
+        policy = ReconnectPolicy(max_attempts=2, sleep=fake_sleep)
+        self.assertFalse(await policy.recover(reconnect, "dropped"))
+        self.assertEqual(policy.log.stats()["failed"], 1)
+
+    async def test_repeated_drops_after_recovery_give_up(self) -> None:
+        now = {"t": 0.0}
+
+        async def fake_sleep(_seconds: float) -> None:
+            return None
+
+        async def reconnect() -> None:
+            return None
+
+        policy = ReconnectPolicy(sleep=fake_sleep, min_healthy_sec=30.0, max_flaps=2, clock=lambda: now["t"])
+        self.assertTrue(await policy.recover(reconnect, "drop 1"))
+        now["t"] = 100.0
+        self.assertTrue(await policy.recover(reconnect, "healthy for a while"))
+        now["t"] = 101.0
+        self.assertTrue(await policy.recover(reconnect, "flap 1"))
+        now["t"] = 102.0
+        self.assertFalse(await policy.recover(reconnect, "flap 2"))
+        self.assertTrue(policy.log.stats()["history"][-1]["flapping"])
+
+    def test_replay_items_keep_recent_dialogue(self) -> None:
+        messages = [{"role": "system", "content": "x"}] + [
+            {"role": "user" if idx % 2 else "assistant", "content": f"m{idx}"} for idx in range(5)
+        ]
+        events = build_replay_items(messages, limit=2)
+        self.assertEqual([event["item"]["content"][0]["text"] for event in events], ["m3", "m4"])
+        self.assertEqual(events[0]["item"]["content"][0]["type"], "input_text")
+
+
+class FakeUpstream:
+    def __init__(self, messages: list[dict]) -> None:
+        self.sent: list[dict] = []
+        self.closed = False
+        self._messages = [json.dumps(message) for message in messages]
+
+    async def send(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        await asyncio.sleep(0)
+        if self._messages:
+            return self._messages.pop(0)
+        raise ConnectionError("upstream dropped")
+
+
+class BufferingUpstream(FakeUpstream):
+    """Keeps the input audio buffer the way the Realtime API would."""
+
+    def __init__(self, messages: list[dict]) -> None:
+        super().__init__(messages)
+        self.buffer: list[bytes] = []
+
+    async def send(self, message: str) -> None:
+        await super().send(message)
+        event = self.sent[-1]
+        if event["type"] == "input_audio_buffer.append":
+            self.buffer.append(base64.b64decode(event["audio"]))
+        elif event["type"] == "input_audio_buffer.clear":
+            self.buffer.clear()
+
+
+class RealtimeClientReconnectTests(unittest.IsolatedAsyncioTestCase):
+    async def test_drop_reapplies_session_and_replays_state(self) -> None:
+        upstreams: list[FakeUpstream] = []
+        received: list[str] = []
+        async def fake_connect(*_args, **_kwargs):
+            ws = FakeUpstream([{"type": "session.updated"}])
+            upstreams.append(ws)
+            return ws
+
+        async def on_event(event: dict) -> None:
+            received.append(event["type"])
+            if len(received) == 2:
+                await client.close()
+
+        async def fake_sleep(_seconds: float) -> None:
+            return None
+
+        client = RealtimeWebSocketClient(
+            session=RealtimeSessionInfo(wss_url="wss://example", bearer_token="ephemeral", model="m"),
+            api_key="server-key",
+            event_handler=on_event,
+            session_config={"voice": "alloy"},
+            reconnect_policy=ReconnectPolicy(sleep=fake_sleep),
+            replay_provider=lambda: build_scenario_replay(ScenarioState(place="airport"), ["I need a taxi"]),
+        )
+        with mock.patch.object(realtime_session.websockets, "connect", fake_connect):
+            await client.connect_and_run()
+
+        self.assertEqual(len(upstreams), 2)
+        self.assertTrue(upstreams[0].closed)
+        resumed = upstreams[1].sent
+        self.assertEqual(resumed[0], {"type": "session.update", "session": {"voice": "alloy"}})
+        self.assertEqual(resumed[1]["item"]["role"], "system")
+        summary = resumed[1]["item"]["content"][0]["text"]
+        self.assertIn("place: airport", summary)
+        self.assertIn("I need a taxi", summary)
+        self.assertEqual(client.recovery_log.stats()["recovered"], 1)
+
+    async def test_reconnect_keeps_replayed_held_audio(self) -> None:
+        upstreams: list[BufferingUpstream] = []
+
+        async def fake_connect(*_args, **_kwargs):
+            if upstreams:
+                ws = BufferingUpstream([{"type": "session.updated"}])
+            else:
+                ws = BufferingUpstream([{"type": "session.updated"}, {"type": "input_audio_buffer.cleared"}])
+            upstreams.append(ws)
+            return ws
+
+        async def fake_sleep(_seconds: float) -> None:
+            return None
+
+        held = HeldInput()
+
+        async def on_event(event: dict) -> None:
+            await handshake.handle_event(event)
+            if len(upstreams) == 2 and event["type"] == "session.updated":
+                await client.close()
+
+        client = RealtimeWebSocketClient(
+            session=RealtimeSessionInfo(wss_url="wss://example", bearer_token="ephemeral", model="m"),
+            api_key="server-key",
+            event_handler=on_event,
+            session_config={"voice": "alloy"},
+            reconnect_policy=ReconnectPolicy(sleep=fake_sleep),
+            replay_provider=held.drain,
+        )
+        handshake = SessionHandshake(client.send_event)
+        held.hold({"type": "input_audio_buffer.append", "audio": "AAAA"})
+        with mock.patch.object(realtime_session.websockets, "connect", fake_connect):
+            await asyncio.wait_for(client.connect_and_run(), timeout=1.0)
+
+        self.assertTrue(handshake.ready.is_set())
+        self.assertEqual(len(upstreams), 2)
+        self.assertEqual(upstreams[1].buffer, [b"\x00\x00\x00"])
+        self.assertNotIn("input_audio_buffer.clear", [event["type"] for event in upstreams[1].sent])
+
+    async def test_flapping_upstream_is_given_up(self) -> None:
+        upstreams: list[FakeUpstream] = []
+        failures: list[Exception] = []
+
+        async def fake_connect(*_args, **_kwargs):
+            ws = FakeUpstream([])
+            upstreams.append(ws)
+            return ws
+
+        async def fake_sleep(_seconds: float) -> None:
+            return None
+
+        client = RealtimeWebSocketClient(
+            session=RealtimeSessionInfo(wss_url="wss://example", bearer_token="ephemeral", model="m"),
+            api_key="server-key",
+            event_handler=lambda _event: None,
+            error_handler=failures.append,
+            reconnect_policy=ReconnectPolicy(sleep=fake_sleep, max_flaps=2),
+        )
+        with mock.patch.object(realtime_session.websockets, "connect", fake_connect):
+            await asyncio.wait_for(client.connect_and_run(), timeout=1.0)
+
+        self.assertEqual(len(upstreams), 3)
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(client.recovery_log.stats()["failed"], 1)
+
+
+class HeldInputTests(unittest.TestCase):
+    def test_drain_keeps_arrival_order(self) -> None:
+        held = HeldInput()
+        held.hold({"type": "input_audio_buffer.append", "audio": "AAAA"})
+        held.hold({"type": "input_audio_buffer.commit"})
+        held.hold({"type": "input_audio_buffer.append", "audio": "AQEB"})
+        drained = held.drain()
+        self.assertEqual(
+            [event["type"] for event in drained],
+            ["input_audio_buffer.append", "input_audio_buffer.commit", "input_audio_buffer.append"],
+        )
+        self.assertEqual(drained[2]["audio"], "AQEB")
+        self.assertEqual(held.drain(), [])
+
+    def test_overflow_drops_oldest_audio_with_its_commit(self) -> None:
+        held = HeldInput(max_audio_bytes=4)
+        held.hold({"type": "input_audio_buffer.append", "audio": "AAAA"})
+        held.hold({"type": "input_audio_buffer.commit"})
+        held.hold({"type": "input_audio_buffer.append", "audio": "AQEBAQ=="})
+        drained = held.drain()
+        self.assertEqual([event["type"] for event in drained], ["input_audio_buffer.append"])
+        self.assertEqual(drained[0]["audio"], "AQEBAQ==")
+        self.assertEqual(held.stats()["dropped_bytes"], 3)
+        self.assertEqual(held.stats()["dropped_marks"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
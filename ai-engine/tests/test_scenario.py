@@ -1,7 +1,14 @@
+import asyncio
+import json
+import time
 import unittest
+from types import SimpleNamespace
 from typing import Optional
 
 from scenario.fallbacks import build_realtime_error_handler
+from scenario.llm_client import OpenAIScenarioLLM
+from scenario.loop_monitor import LoopStallMonitor
+from scenario.realtime_pipeline import RealtimeScenarioPipeline
 from scenario.prompts import KOREAN_FALLBACK_MESSAGE
 from scenario.scenario_builder import ScenarioBuilder
 from scenario.scenario_state import ScenarioState
@@ -34,6 +41,146 @@ class ScenarioBuilderTests(unittest.TestCase):
         self.assertIn("Great.", response)
 
 
+class SlowResponses:
+    def __init__(self, latency_sec: float, blocking: bool) -> None:
+        self._latency_sec = latency_sec
+        self._blocking = blocking
+
+    def create(self, *, model: str, input: str, **_kwargs):
+        if self._blocking:
+            time.sleep(self._latency_sec)
+            return SimpleNamespace(output_text=json.dumps({"place": "cafe", "partner": None, "goal": None}))
+        return self._create_async()
+
+    async def _create_async(self):
+        await asyncio.sleep(self._latency_sec)
+        return SimpleNamespace(output_text=json.dumps({"place": "cafe", "partner": None, "goal": None}))
+
+
+class AsyncScenarioBuilderTests(unittest.IsolatedAsyncioTestCase):
+    def _llm(self, latency_sec: float) -> OpenAIScenarioLLM:
+        return OpenAIScenarioLLM(
+            api_key="test",
+            model="test",
+            client=SimpleNamespace(responses=SlowResponses(latency_sec, blocking=True)),
+            async_client=SimpleNamespace(responses=SlowResponses(latency_sec, blocking=False)),
+        )
+
+    async def test_async_extraction_does_not_stall_loop(self) -> None:
+        llm = self._llm(0.1)
+        sent: list[str] = []
+
+        async def send_response(text: str) -> None:
+            sent.append(text)
+
+        pipelines = [
+            RealtimeScenarioPipeline(ScenarioBuilder(extractor=llm.extract_fields_async), send_response)
+            for _ in range(10)
+        ]
+        event = {"type": "conversation.item.input_audio_transcription.completed", "transcript": "I'm at a cafe"}
+        async with LoopStallMonitor() as monitor:
+            await asyncio.gather(*(pipeline.handle_event(event) for pipeline in pipelines))
+
+        self.assertEqual(len(sent), 10)
+        self.assertTrue(all(pipeline._builder.state.place == "cafe" for pipeline in pipelines))
+        # 10 sessions x 100ms of LLM latency overlap instead of blocking the loop for ~1s
+        self.assertLess(monitor.stats()["max_stall_ms"], 50)
+
+    async def test_blocking_extraction_stalls_loop(self) -> None:
+        llm = self._llm(0.05)
+        builder = ScenarioBuilder(extractor=llm.extract_fields)
+        async with LoopStallMonitor() as monitor:
+            await builder.ingest_user_text_async("I'm at a cafe")
+            await asyncio.sleep(0.02)
+        self.assertGreaterEqual(monitor.stats()["max_stall_ms"], 40)
+
+    def test_sync_api_rejects_async_generators(self) -> None:
+        async def extractor(_: str) -> dict[str, Optional[str]]:
+            return {"place": "cafe", "partner": None, "goal": None}
+
+        builder = ScenarioBuilder(extractor=extractor)
+        with self.assertRaises(TypeError):
+            builder.ingest_user_text("I am at a cafe")
+
+
+class ScriptedResponses:
+    def __init__(self, outputs: list[dict]) -> None:
+        self._outputs = list(outputs)
+        self.prompts: list[str] = []
+
+    async def create(self, *, model: str, input: str, **_kwargs):
+        self.prompts.append(input)
+        return SimpleNamespace(output_text=json.dumps(self._outputs.pop(0)))
+
+
+class CombinedTurnTests(unittest.IsolatedAsyncioTestCase):
+    async def test_one_llm_call_per_turn(self) -> None:
+        responses = ScriptedResponses(
+            [
+                {
+                    "place": "airport",
+                    "partner": None,
+                    "goal": None,
+                    "question_field": "partner",
+                    "next_question": "Who will you talk to at the airport?",
+                    "final_message": None,
+                },
+                {
+                    "place": None,
+                    "partner": "check-in staff",
+                    "goal": "check in my bag",
+                    "question_field": None,
+                    "next_question": None,
+                    "final_message": "Hello! May I see your passport, please?",
+                },
+            ]
+        )
+        llm = OpenAIScenarioLLM(api_key="test", model="test", client=SimpleNamespace(), async_client=SimpleNamespace(responses=responses))
+        builder = ScenarioBuilder(
+            extractor=llm.extract_fields_async,
+            question_generator=llm.generate_followup_async,
+            final_generator=llm.generate_final_async,
+            turn_planner=llm.plan_turn_async,
+        )
+        sent: list[str] = []
+        completed: list[ScenarioBuilder] = []
+
+        async def send_response(text: str) -> None:
+            sent.append(text)
+
+        pipeline = RealtimeScenarioPipeline(builder, send_response, on_complete=completed.append)
+        for transcript in ("I'm at the airport", "Talking to check-in staff to check in my bag"):
+            await pipeline.handle_event(
+                {"type": "conversation.item.input_audio_transcription.completed", "transcript": transcript}
+            )
+
+        self.assertEqual(len(responses.prompts), 2)
+        self.assertEqual(sent, ["Who will you talk to at the airport?", "Hello! May I see your passport, please?"])
+        self.assertEqual((builder.state.place, builder.state.partner, builder.state.goal), ("airport", "check-in staff", "check in my bag"))
+        self.assertTrue(builder.state.completed)
+        self.assertEqual(completed, [builder])
+        self.assertIn("Already asked about: partner", responses.prompts[1])
+        self.assertIn("the first of [place, partner, goal]", responses.prompts[0])
+        self.assertIn("the first of [goal, partner]", responses.prompts[1])
+
+    def test_missing_question_falls_back_to_default(self) -> None:
+        def planner(_state: ScenarioState, _text: str) -> dict:
+            return {"place": "cafe", "partner": None, "goal": None, "question_field": None, "next_question": None}
+
+        builder = ScenarioBuilder(turn_planner=planner)
+        self.assertEqual(builder.plan_turn("I'm at a cafe"), "Who are you talking to?")
+        self.assertEqual(builder.state.attempts, 1)
+
+    def test_question_about_another_field_is_replaced_by_the_default(self) -> None:
+        def planner(_state: ScenarioState, _text: str) -> dict:
+            # the planner asks about the goal while the builder records partner as asked
+            return {"place": "cafe", "question_field": "goal", "next_question": "What will you order?"}
+
+        builder = ScenarioBuilder(turn_planner=planner)
+        self.assertEqual(builder.plan_turn("I'm at a cafe"), "Who are you talking to?")
+        self.assertEqual(builder.state.asked_fields, {"partner"})
+
+
 class RealtimeFallbackTests(unittest.IsolatedAsyncioTestCase):
     async def test_realtime_error_fallback(self) -> None:
         messages: list[str] = []
@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from scenario.realtime_session import RealtimeConfig, RealtimeSessionInfo, RealtimeSessionManager
+from scenario.session_pool import RealtimeSessionPool
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeManager:
+    def __init__(self, clock: FakeClock, delay_sec: float = 0.0) -> None:
+        self._clock = clock
+        self._delay_sec = delay_sec
+        self.created = 0
+
+    async def create_session_async(self) -> RealtimeSessionInfo:
+        await asyncio.sleep(self._delay_sec)
+        self.created += 1
+        return RealtimeSessionInfo(
+            wss_url="wss://example/realtime",
+            bearer_token=f"ek_{self.created}",
+            model="gpt-4o-realtime",
+            expires_at=self._clock.now + 60,
+        )
+
+
+class RealtimeSessionPoolTests(unittest.IsolatedAsyncioTestCase):
+    async def test_pooled_session_is_handed_out_without_minting(self) -> None:
+        clock = FakeClock()
+        manager = FakeManager(clock, delay_sec=0.05)
+        pool = RealtimeSessionPool(manager, clock=clock, min_size=1)
+        await pool.refill()
+        created = manager.created
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        info = await pool.acquire()
+
+        self.assertLess(loop.time() - started, 0.01)
+        self.assertEqual(info.bearer_token, "ek_1")
+        self.assertEqual(manager.created, created)
+        self.assertEqual(pool.stats()["hits"], 1)
+
+    async def test_empty_pool_mints_on_demand(self) -> None:
+        clock = FakeClock()
+        pool = RealtimeSessionPool(FakeManager(clock), clock=clock)
+        info = await pool.acquire()
+        self.assertEqual(info.bearer_token, "ek_1")
+        self.assertEqual(pool.stats()["misses"], 1)
+
+    async def test_tokens_near_expiry_are_dropped(self) -> None:
+        clock = FakeClock()
+        manager = FakeManager(clock)
+        pool = RealtimeSessionPool(manager, clock=clock, refresh_margin_sec=15, min_size=1)
+        await pool.refill()
+        clock.now += 46  # 14s left on the pooled token
+
+        info = await pool.acquire()
+
+        self.assertEqual(info.bearer_token, "ek_2")
+        self.assertEqual(pool.stats()["expired"], 1)
+
+    async def test_target_follows_recent_connection_rate(self) -> None:
+        clock = FakeClock()
+        pool = RealtimeSessionPool(FakeManager(clock), clock=clock, max_size=8)
+        self.assertEqual(pool.target_size(), 0)
+        for _ in range(30):  # 0.5 connections/s over the last minute
+            await pool.acquire()
+        self.assertEqual(pool.target_size(), 5)
+        clock.now += 120
+        self.assertEqual(pool.target_size(), 0)
+
+    async def test_idle_pool_mints_nothing_by_default(self) -> None:
+        clock = FakeClock()
+        manager = FakeManager(clock)
+        pool = RealtimeSessionPool(manager, clock=clock)
+        self.assertEqual(await pool.refill(), 0)
+        self.assertEqual(manager.created, 0)
+        self.assertEqual(RealtimeSessionPool(manager, clock=clock, min_size=1).target_size(), 1)
+
+    async def test_background_task_refills_after_acquire(self) -> None:
+        clock = FakeClock()
+        manager = FakeManager(clock)
+        pool = RealtimeSessionPool(manager, clock=clock, refill_interval_sec=10, min_size=1)
+        pool.start()
+        try:
+            await asyncio.sleep(0.01)
+            self.assertEqual(pool.stats()["ready"], 1)
+            await pool.acquire()
+            await asyncio.sleep(0.01)
+            self.assertEqual(pool.stats()["ready"], 1)
+            self.assertEqual(pool.stats()["misses"], 0)
+        finally:
+            await pool.stop()
+
+    async def test_async_creation_reads_token_expiry(self) -> None:
+        secret = SimpleNamespace(value="ek_x", expires_at=1234)
+
+        class Sessions:
+            async def create(self, model: str):
+                return SimpleNamespace(client_secret=secret)
+
+        async_client = SimpleNamespace(realtime=SimpleNamespace(sessions=Sessions()))
+        manager = RealtimeSessionManager(RealtimeConfig(api_key="sk"), async_client=async_client)
+        info = await manager.create_session_async()
+        self.assertEqual((info.bearer_token, info.expires_at), ("ek_x", 1234.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
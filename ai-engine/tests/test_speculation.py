@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+
+from scenario.realtime_pipeline import RealtimeScenarioPipeline
+from scenario.scenario_builder import ScenarioBuilder
+from scenario.scenario_state import ScenarioState
+from scenario.speculation import SpeculationMetrics
+
+QUESTIONS = {
+    "place": "Where are you?",
+    "partner": "Who are you talking to?",
+    "goal": "What do you want to do?",
+}
+
+
+class FakeLLM:
+    def __init__(self, extraction: dict, latency_sec: float = 0.05) -> None:
+        self.extraction = extraction
+        self.latency_sec = latency_sec
+        self.started: list[str] = []
+        self.finished: list[str] = []
+
+    async def extract(self, _text: str) -> dict:
+        await asyncio.sleep(self.latency_sec)
+        return dict(self.extraction)
+
+    async def question(self, _state: ScenarioState, fields: list[str]) -> str:
+        self.started.append(fields[0])
+        await asyncio.sleep(self.latency_sec * 1.5)
+        self.finished.append(fields[0])
+        return QUESTIONS[fields[0]]
+
+
+class SpeculativeFollowUpTests(unittest.IsolatedAsyncioTestCase):
+    async def _turn(self, builder: ScenarioBuilder, text: str) -> tuple[list[str], float]:
+        sent: list[str] = []
+
+        async def send_response(message: str) -> None:
+            sent.append(message)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await RealtimeScenarioPipeline(builder, send_response).handle_event(
+            {"type": "conversation.item.input_audio_transcription.completed", "transcript": text}
+        )
+        return sent, loop.time() - started
+
+    async def test_question_overlaps_extraction_and_losers_are_cancelled(self) -> None:
+        llm = FakeLLM({"place": "airport", "partner": None, "goal": None})
+        metrics = SpeculationMetrics()
+        builder = ScenarioBuilder(extractor=llm.extract, question_generator=llm.question, speculation=metrics)
+
+        sent, elapsed = await self._turn(builder, "I'm at the airport")
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(sent, ["Who are you talking to?"])
+        # question latency only, instead of extraction (50ms) + question (75ms)
+        self.assertLess(elapsed, 0.11)
+        self.assertEqual(sorted(llm.started), ["goal", "partner", "place"])
+        self.assertEqual(llm.finished, ["partner"])
+        self.assertEqual(builder.state.asked_fields, {"partner"})
+        self.assertEqual(builder.state.attempts, 1)
+        stats = metrics.stats()
+        self.assertEqual((stats["used"], stats["wasted_calls"], stats["cancelled"]), (1, 2, 2))
+        self.assertGreater(stats["saved_ms"], 30)
+
+    async def test_completed_scenario_discards_every_candidate(self) -> None:
+        llm = FakeLLM({"place": "cafe", "partner": "barista", "goal": "order coffee"}, latency_sec=0.01)
+        metrics = SpeculationMetrics()
+        builder = ScenarioBuilder(extractor=llm.extract, question_generator=llm.question, speculation=metrics)
+
+        sent, _ = await self._turn(builder, "At a cafe ordering coffee from the barista")
+
+        self.assertTrue(builder.state.completed)
+        self.assertEqual(len(sent), 1)
+        self.assertIn("cafe", sent[0])
+        self.assertEqual(metrics.stats()["used"], 0)
+        self.assertEqual(metrics.stats()["wasted_calls"], 3)
+
+    async def test_without_speculation_calls_are_sequential(self) -> None:
+        llm = FakeLLM({"place": "airport", "partner": None, "goal": None})
+        builder = ScenarioBuilder(extractor=llm.extract, question_generator=llm.question)
+        sent, elapsed = await self._turn(builder, "I'm at the airport")
+        self.assertEqual(sent, ["Who are you talking to?"])
+        self.assertGreaterEqual(elapsed, 0.12)
+        self.assertEqual(llm.started, ["partner"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+from typing import Optional
+
+from scenario.checkpoints import ScenarioCheckpointStore
+from scenario.scenario_builder import DEFAULT_QUESTIONS, ScenarioBuilder
+from scenario.scenario_state import ScenarioState
+from scenario.text_scenario import TextScenarioNotFound, TextScenarioService
+
+FACTS = {
+    "I'm at a cafe": {"place": "cafe", "partner": None, "goal": None},
+    "the barista, I want to order a latte": {"place": None, "partner": "barista", "goal": "order a latte"},
+}
+
+
+class TextScenarioServiceTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.llm_calls = 0
+        self.saved: list[dict] = []
+        self.completed: list[str] = []
+
+        def extract(text: str) -> dict:
+            self.llm_calls += 1
+            return FACTS.get(text, {})
+
+        def factory(state: Optional[ScenarioState]) -> ScenarioBuilder:
+            return ScenarioBuilder(
+                state=state,
+                extractor=extract,
+                question_generator=lambda state, missing: "Who are you talking to?",
+                final_generator=lambda state: "Great, let's start!",
+            )
+
+        async def persist(**kwargs) -> None:
+            self.saved.append(kwargs)
+
+        self.store = ScenarioCheckpointStore()
+        self.service = TextScenarioService(
+            factory,
+            self.store,
+            persist=persist,
+            on_completed=lambda session_id, state, transcripts: self.completed.append(session_id),
+        )
+
+    async def test_typed_turns_complete_and_persist(self) -> None:
+        started = self.service.start(user_id=3)
+        self.assertIn(DEFAULT_QUESTIONS["place"], started.message)
+        self.assertEqual(self.llm_calls, 0)
+
+        first = await self.service.reply(started.token, "I'm at a cafe", user_id=3)
+        self.assertFalse(first.completed)
+        self.assertEqual(first.message, "Who are you talking to?")
+        self.assertEqual(first.scenario["place"], "cafe")
+
+        final = await self.service.reply(started.token, "the barista, I want to order a latte", user_id=3)
+        self.assertTrue(final.completed)
+        self.assertEqual(final.message, "Great, let's start!")
+        self.assertEqual(len(self.saved), 1)
+        self.assertEqual(self.saved[0]["session_id"], final.session_id)
+        self.assertEqual(self.saved[0]["user_id"], 3)
+        self.assertEqual(self.saved[0]["scenario_state"]["partner"], "barista")
+        self.assertEqual(self.completed, [final.session_id])
+
+        # the token is spent once the scenario is saved
+        with self.assertRaises(TextScenarioNotFound):
+            await self.service.reply(started.token, "hello", user_id=3)
+
+    async def test_state_survives_between_requests_and_is_user_bound(self) -> None:
+        started = self.service.start(user_id=None)
+        await self.service.reply(started.token, "I'm at a cafe")
+        checkpoint = self.store.load(started.token)
+        self.assertEqual(checkpoint.restore_state().place, "cafe")
+        self.assertEqual(checkpoint.transcripts, ["I'm at a cafe"])
+        with self.assertRaises(TextScenarioNotFound):
+            await self.service.reply(started.token, "the barista", user_id=9)
+
+    async def test_blank_input_repeats_question_without_llm(self) -> None:
+        started = self.service.start()
+        turn = await self.service.reply(started.token, "   ")
+        self.assertEqual(turn.message, DEFAULT_QUESTIONS["place"])
+        self.assertEqual(self.llm_calls, 0)
+        self.assertEqual(self.store.load(started.token).restore_state().attempts, 0)
+
+
+    async def test_text_turn_shares_the_token_lock_with_voice(self) -> None:
+        started = self.service.start()
+        seen = self.store.load(started.token)
+        # a voice turn on the same token holds the lock
+        async with self.store.lock(started.token):
+            task = asyncio.create_task(self.service.reply(started.token, "I'm at a cafe"))
+            await asyncio.sleep(0)
+            self.assertFalse(task.done())
+            self.assertIsNone(self.store.changed_since(started.token, seen))
+        await task
+        # the voice side sees the typed turn instead of overwriting it
+        newer = self.store.changed_since(started.token, seen)
+        self.assertEqual(newer.restore_state().place, "cafe")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import base64
+import mmap
+import tempfile
+import unittest
+from pathlib import Path
+
+from scenario.audio_pacing import PACING_BURST, AudioPacer, send_pcm16_audio
+from scenario.prompts import KOREAN_FALLBACK_MESSAGE
+from scenario.tts_cache import PREWARM_PHRASES, TtsCache, cached_tts_pcm16, prewarm_tts_cache
+from tests.test_tts_streaming import FakeStreamedSpeech, fake_tts_client
+
+
+class CountingSpeech(FakeStreamedSpeech):
+    def __init__(self, chunks: list[bytes]) -> None:
+        super().__init__(chunks, delay_sec=0)
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return super().create(**kwargs)
+
+
+class TtsCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    async def _play(self, audio) -> bytes:
+        sent: list[dict] = []
+
+        async def send_to_client(payload: dict) -> None:
+            sent.append(payload)
+
+        await send_pcm16_audio(send_to_client, audio, sample_rate=24000, pacer=AudioPacer(PACING_BURST))
+        return b"".join(base64.b64decode(item["delta"]) for item in sent if item["type"] == "response.audio.delta")
+
+    async def test_second_request_is_served_from_memory(self) -> None:
+        pcm = bytes(range(256)) * 40
+        speech = CountingSpeech([pcm[:5000], pcm[5000:]])
+        client = fake_tts_client(speech)
+        cache = TtsCache(self.cache_dir)
+
+        first = await self._play(await cached_tts_pcm16(cache, client, KOREAN_FALLBACK_MESSAGE))
+        second = await self._play(await cached_tts_pcm16(cache, client, KOREAN_FALLBACK_MESSAGE))
+
+        self.assertEqual(first, pcm)
+        self.assertEqual(second, pcm)
+        self.assertEqual(speech.calls, 1)
+        stats = cache.stats()
+        self.assertEqual((stats["misses"], stats["memory_hits"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    async def test_disk_tier_survives_memory_eviction_and_restart(self) -> None:
+        cache = TtsCache(self.cache_dir, memory_bytes=1000)
+        key_a = TtsCache.make_key("Where are you having this conversation?")
+        key_b = TtsCache.make_key("Who are you talking to?")
+        cache.put(key_a, b"\x01\x00" * 400)
+        cache.put(key_b, b"\x02\x00" * 400)
+
+        # a was evicted from memory but is still mapped from disk
+        buffer = cache.get(key_a)
+        self.assertIsInstance(buffer, mmap.mmap)
+        self.assertEqual(await self._play(buffer), b"\x01\x00" * 400)
+        self.assertEqual(cache.stats()["disk_hits"], 1)
+
+        restarted = TtsCache(self.cache_dir)
+        self.assertEqual(bytes(restarted.get(key_b)), b"\x02\x00" * 400)
+        self.assertEqual(restarted.stats()["disk_hits"], 1)
+
+    async def test_key_includes_voice_and_model(self) -> None:
+        cache = TtsCache(self.cache_dir)
+        cache.put(TtsCache.make_key("Hello", voice="alloy"), b"\x00\x00")
+        self.assertIsNone(cache.get(TtsCache.make_key("Hello", voice="shimmer")))
+        self.assertIsNone(cache.get(TtsCache.make_key("Hello", model="tts-1")))
+
+    async def test_disk_tier_is_trimmed_to_budget(self) -> None:
+        phrases = [f"phrase {index}" for index in range(3)]
+        cache = TtsCache(self.cache_dir, disk_bytes=1500, disk_phrases=phrases)
+        for phrase in phrases:
+            cache.put(TtsCache.make_key(phrase), b"\x00" * 1000)
+        self.assertLessEqual(sum(path.stat().st_size for path in self.cache_dir.glob("*.pcm")), 1500)
+        self.assertEqual(cache.stats()["disk_bytes"], 1000)
+        self.assertEqual(cache.stats()["stores"], 3)
+
+    async def test_only_fixed_phrases_reach_disk(self) -> None:
+        cache = TtsCache(self.cache_dir)
+        cache.put(TtsCache.make_key("Which gate is your flight leaving from?"), b"\x00\x00")
+        self.assertEqual(list(self.cache_dir.glob("*.pcm")), [])
+        self.assertIsNotNone(cache.get(TtsCache.make_key("Which gate is your flight leaving from?")))
+        self.assertEqual(cache.stats()["stores"], 0)
+
+        cache.put(TtsCache.make_key(KOREAN_FALLBACK_MESSAGE), b"\x00\x00")
+        self.assertEqual(len(list(self.cache_dir.glob("*.pcm"))), 1)
+        self.assertEqual(cache.stats()["stores"], 1)
+
+    async def test_failed_write_is_not_counted_as_stored(self) -> None:
+        cache = TtsCache(self.cache_dir)
+        self._tmp.cleanup()  # the cache directory disappears under the cache
+        cache.put(TtsCache.make_key(KOREAN_FALLBACK_MESSAGE), b"\x00\x00")
+        self.assertEqual((cache.stats()["stores"], cache.stats()["write_failures"]), (0, 1))
+        self.assertIsNotNone(cache.get(TtsCache.make_key(KOREAN_FALLBACK_MESSAGE)))
+
+    async def test_interrupted_stream_is_not_cached(self) -> None:
+        cache = TtsCache(self.cache_dir)
+        speech = CountingSpeech([b"\x00\x00" * 100, b"\x00\x00" * 100])
+        stream = await cached_tts_pcm16(cache, fake_tts_client(speech), "Hello")
+        async for _ in stream:
+            break
+        await stream.aclose()
+        self.assertIsNone(cache.get(TtsCache.make_key("Hello")))
+
+    async def test_prewarm_fetches_each_fixed_phrase_once(self) -> None:
+        cache = TtsCache(self.cache_dir)
+        speech = CountingSpeech([b"\x00\x00" * 10])
+        client = fake_tts_client(speech)
+
+        self.assertEqual(await prewarm_tts_cache(cache, client), len(PREWARM_PHRASES))
+        self.assertEqual(await prewarm_tts_cache(cache, client), 0)
+        self.assertEqual(speech.calls, len(PREWARM_PHRASES))
+        self.assertIn(KOREAN_FALLBACK_MESSAGE, PREWARM_PHRASES)
+
+
+if __name__ == "__main__":
+    unittest.main()
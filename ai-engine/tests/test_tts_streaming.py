@@ -0,0 +1,77 @@
+import asyncio
+import base64
+import unittest
+from types import SimpleNamespace
+
+from scenario.audio_pacing import send_pcm16_audio
+from scenario.tts import TtsMetrics, stream_tts_pcm16
+
+
+class FakeStreamedSpeech:
+    def __init__(self, chunks: list[bytes], delay_sec: float) -> None:
+        self._chunks = chunks
+        self._delay_sec = delay_sec
+        self.request: dict = {}
+
+    def create(self, **kwargs):
+        self.request = kwargs
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc) -> None:
+        return None
+
+    async def iter_bytes(self, _chunk_size: int):
+        for chunk in self._chunks:
+            await asyncio.sleep(self._delay_sec)
+            yield chunk
+
+
+def fake_tts_client(speech: FakeStreamedSpeech):
+    return SimpleNamespace(audio=SimpleNamespace(speech=SimpleNamespace(with_streaming_response=speech)))
+
+
+class StreamingTtsTests(unittest.IsolatedAsyncioTestCase):
+    async def test_first_frame_is_sent_before_synthesis_finishes(self) -> None:
+        # 4 network chunks of 0.1s audio each, arriving 50ms apart; odd sizes split samples
+        audio = bytes(range(256)) * 75
+        chunks = [audio[:4801], audio[4801:9600], audio[9600:14401], audio[14401:]]
+        speech = FakeStreamedSpeech(chunks, delay_sec=0.05)
+        metrics = TtsMetrics()
+        sent: list[tuple[float, dict]] = []
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async def send_to_client(payload: dict) -> None:
+            sent.append((loop.time() - started, payload))
+
+        stream = stream_tts_pcm16(fake_tts_client(speech), "Who are you talking to?", metrics=metrics)
+        await send_pcm16_audio(send_to_client, stream, sample_rate=24000)
+
+        self.assertEqual(speech.request["response_format"], "pcm")
+        deltas = [payload for _, payload in sent if payload["type"] == "response.audio.delta"]
+        self.assertEqual(b"".join(base64.b64decode(item["delta"]) for item in deltas), audio)
+        self.assertTrue(all(len(base64.b64decode(item["delta"])) % 2 == 0 for item in deltas))
+        self.assertEqual(sent[-1][1], {"type": "response.audio.done"})
+        # first audio after the first network chunk, not after the whole body (~200ms)
+        self.assertLess(sent[0][0], 0.12)
+
+        stats = metrics.stats()
+        self.assertEqual(stats["utterances"], 1)
+        self.assertLess(stats["avg_ttfb_ms"], stats["avg_synth_ms"])
+        self.assertGreater(stats["avg_first_audio_saved_ms"], 100)
+
+    async def test_empty_stream_sends_nothing(self) -> None:
+        sent: list[dict] = []
+
+        async def send_to_client(payload: dict) -> None:
+            sent.append(payload)
+
+        await send_pcm16_audio(send_to_client, b"", sample_rate=24000)
+        self.assertEqual(sent, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,7 +14,7 @@ from app.services.user_service import UserService
 from app.services.auth_service import AuthService
 from app.services.chat_service import ChatService
 
-from app.db.database import get_db
+from app.db.database import AsyncSessionLocal, get_db
 
 # Repository Dependencies
 def get_user_repository(db: AsyncSession = Depends(get_db)) -> UserRepository:
@@ -33,6 +33,14 @@ def get_auth_service(repo: UserRepository = Depends(get_user_repository)) -> Aut
 def get_chat_service(repo: ChatRepository = Depends(get_chat_repository)) -> ChatService:
     return ChatService(repo)
 
+def get_realtime_chat_service() -> ChatService:
+    """
+    WebSocket 전용 ChatService
+    요청 범위 DB 세션(get_db)을 잡지 않고, 작업 단위(Unit of Work)로 짧은 세션을 열고 닫습니다.
+    (대화가 이어지는 동안 커넥션 풀을 점유하지 않음)
+    """
+    return ChatService(session_factory=AsyncSessionLocal)
+
 # OAuth2 스킴 정의 (Token URL은 /api/v1/auth/login)
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login"
@@ -97,11 +105,10 @@ async def get_current_user_optional(
 async def get_current_user_ws(
     websocket: WebSocket,
     token: Optional[str] = Query(None, description="JWT Access Token"),
-    auth_service: AuthService = Depends(get_auth_service),
-    user_service: UserService = Depends(get_user_service)
 ) -> models.User:
     """
     WebSocket 연결 전용 인증 의존성
+    - 요청 범위 DB 세션(get_db)은 WebSocket이 끝날 때까지 유지되므로, 조회용 짧은 세션을 직접 열고 닫습니다.
     우선순위:
     1. Header: Authorization (Bearer <token>)
     2. Header: Sec-WebSocket-Protocol (token, ...)
@@ -133,8 +140,10 @@ async def get_current_user_ws(
     if not token_str:
         raise WebSocketException(code=1008, reason="Missing authentication token")
 
-    # 공통 인증 로직 사용
-    user = await _authenticate_user(token_str, auth_service, user_service)
+    # 공통 인증 로직 사용 (조회 후 커넥션 즉시 반환)
+    async with AsyncSessionLocal() as db:
+        user_repo = UserRepository(db)
+        user = await _authenticate_user(token_str, AuthService(user_repo), UserService(user_repo))
     
     if not user:
         raise WebSocketException(code=1008, reason="Invalid token or user not found")
@@ -112,18 +112,20 @@ async def websocket_chat(
     user: models.User = Depends(deps.get_current_user_ws),
     voice: Optional[str] = Query(None),
     show_text: Optional[bool] = Query(None),
-    chat_service: ChatService = Depends(deps.get_chat_service),
+    events: Optional[str] = Query(None),
+    chat_service: ChatService = Depends(deps.get_realtime_chat_service),
 ):
     """
     실시간 대화 WebSocket 엔드포인트 (회원용)
     - token: 쿼리 파라미터 or 헤더로 전달 (Strict Auth)
     - session_id: Path Parameter
+    - events: 구독할 이벤트 클래스 (예: "audio,captions", 없으면 자막 설정 기준)
     """
     await websocket.accept()
 
     # 1. 토큰 검증 완료 (user 객체 존재 보장)
     # 2. AI 세션 시작 (user.id 전달)
-    await chat_service.start_ai_session(websocket, user_id=user.id, session_id=session_id, voice=voice, show_text=show_text)
+    await chat_service.start_ai_session(websocket, user_id=user.id, session_id=session_id, voice=voice, show_text=show_text, events=events)
 
 
 @router.websocket("/ws/guest-chat/{session_id}")
@@ -132,17 +134,19 @@ async def websocket_guest_chat(
     session_id: str,
     voice: Optional[str] = Query(None),
     show_text: Optional[bool] = Query(None),
-    chat_service: ChatService = Depends(deps.get_chat_service),
+    events: Optional[str] = Query(None),
+    chat_service: ChatService = Depends(deps.get_realtime_chat_service),
 ):
     """
     실시간 대화 WebSocket 엔드포인트 (게스트용)
     - 인증 없음
     - session_id: Path Parameter
+    - events: 구독할 이벤트 클래스 (예: "audio,captions", 없으면 자막 설정 기준)
     """
     await websocket.accept()
 
     # AI 세션 시작 (user_id=None)
-    await chat_service.start_ai_session(websocket, user_id=None, session_id=session_id, voice=voice, show_text=show_text)
+    await chat_service.start_ai_session(websocket, user_id=None, session_id=session_id, voice=voice, show_text=show_text, events=events)
 
 
 @router.get("/hints/{session_id}", response_model=HintResponse, summary="대화 힌트 생성")
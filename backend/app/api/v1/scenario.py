@@ -2,25 +2,30 @@ from __future__ import annotations
 
 import json
 import sys
+from dataclasses import asdict
 from pathlib import Path
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, HTTPException
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
 from app.db import models
 from app.db.database import get_db
-from app.schemas.scenario import ScenarioResponse
+from app.schemas.scenario import ScenarioResponse, TextScenarioTurnRequest, TextScenarioTurnResponse
 from websockets.exceptions import ConnectionClosedOK
 
 AI_ENGINE_ROOT = Path(__file__).resolve().parents[4] / "ai-engine"
 if str(AI_ENGINE_ROOT) not in sys.path:
     sys.path.append(str(AI_ENGINE_ROOT))
 
+from scenario.persistence import persist_scenario_state, persist_session_title
+from scenario.providers import get_scenario_runtime
 from scenario.realtime_bridge import handle_client
+from scenario.text_scenario import TextScenarioNotFound, TextScenarioService
+from scenario.titles import refine_session_title
 
 router = APIRouter()
 
@@ -38,6 +43,67 @@ async def get_scenarios(
     return result.scalars().all()
 
 
+def _text_scenario_service() -> TextScenarioService:
+    """
+    텍스트 시나리오 서비스 (공용 런타임의 LLM 클라이언트/캐시/체크포인트 저장소 재사용)
+    - 완료 시 음성 시나리오와 같은 경로(persist_scenario_state)로 저장, LLM 제목은 백그라운드에서 갱신
+    """
+    try:
+        runtime = get_scenario_runtime()
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+
+    def refine_title(session_id: str, scenario_state: dict, transcripts: list) -> None:
+        runtime.background.spawn(
+            refine_session_title(
+                runtime.async_client,
+                runtime.config.llm_model,
+                scenario_state=scenario_state,
+                transcripts=transcripts,
+                persist=lambda title: persist_session_title(session_id, title),
+            ),
+            name=f"session-title-{session_id}",
+        )
+
+    return TextScenarioService(
+        lambda state: runtime.scenario_builder(state=state),
+        runtime.checkpoints,
+        persist=persist_scenario_state,
+        on_completed=refine_title,
+    )
+
+
+@router.post("/text", response_model=TextScenarioTurnResponse, summary="텍스트 시나리오 생성 시작")
+async def start_text_scenario(
+    user: Optional[models.User] = Depends(deps.get_current_user_optional),
+    service: TextScenarioService = Depends(_text_scenario_service),
+):
+    """
+    Realtime 세션/TTS 없이 텍스트로 시나리오(장소/상대/목표)를 정합니다.
+    - 응답의 `token`으로 이후 턴을 이어가며, 상태는 서버에 저장됩니다 (30분 유지).
+    """
+    turn = service.start(user_id=user.id if user else None)
+    return TextScenarioTurnResponse(**asdict(turn))
+
+
+@router.post("/text/{token}", response_model=TextScenarioTurnResponse, summary="텍스트 시나리오 턴 진행")
+async def reply_text_scenario(
+    token: str,
+    body: TextScenarioTurnRequest,
+    user: Optional[models.User] = Depends(deps.get_current_user_optional),
+    service: TextScenarioService = Depends(_text_scenario_service),
+):
+    """
+    사용자 입력 한 턴을 처리하고 다음 질문(또는 완료 메시지)을 텍스트로 반환합니다.
+    - 완료 시 `completed=true`, `session_id`가 포함되며 세션이 DB에 저장됩니다.
+    """
+    try:
+        turn = await service.reply(token, body.text, user_id=user.id if user else None)
+    except TextScenarioNotFound:
+        raise HTTPException(status_code=404, detail="Scenario session not found or expired")
+    return TextScenarioTurnResponse(**asdict(turn))
+
+
 @router.get("/{scenario_id}", response_model=ScenarioResponse, summary="시나리오 상세 조회")
 async def get_scenario_detail(
     scenario_id: str,
@@ -116,11 +182,13 @@ class FastAPIWebSocketAdapter:
 async def websocket_scenario(
     websocket: WebSocket,
     user: models.User = Depends(deps.get_current_user_ws),
+    pacing: Optional[str] = Query(None, description="오디오 전송 방식 (realtime: 선행 버퍼 후 실시간 / burst: 즉시 전송, 클라이언트가 재생 스케줄링)"),
+    resume_token: Optional[str] = Query(None, alias="resumeToken", description="끊긴 시나리오 이어하기 토큰 (session.resumable 이벤트로 발급)"),
 ) -> None:
     await websocket.accept()
     adapter = FastAPIWebSocketAdapter(websocket)
     try:
-        await handle_client(adapter, user_id=user.id)
+        await handle_client(adapter, user_id=user.id, pacing=pacing, resume_token=resume_token)
     except (WebSocketDisconnect, ConnectionClosedOK):
         return
     except RuntimeError as exc:
@@ -129,11 +197,15 @@ async def websocket_scenario(
 
 
 @router.websocket("/ws/guest-scenario")
-async def websocket_guest_scenario(websocket: WebSocket) -> None:
+async def websocket_guest_scenario(
+    websocket: WebSocket,
+    pacing: Optional[str] = Query(None, description="오디오 전송 방식 (realtime / burst)"),
+    resume_token: Optional[str] = Query(None, alias="resumeToken", description="끊긴 시나리오 이어하기 토큰"),
+) -> None:
     await websocket.accept()
     adapter = FastAPIWebSocketAdapter(websocket)
     try:
-        await handle_client(adapter, user_id=None)
+        await handle_client(adapter, user_id=None, pacing=pacing, resume_token=resume_token)
     except (WebSocketDisconnect, ConnectionClosedOK):
         return
     except RuntimeError as exc:
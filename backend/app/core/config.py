@@ -32,6 +32,17 @@ class Settings(BaseSettings):
     SESSION_CLEANUP_INTERVAL_SECONDS: int = 3600  # 정리 주기 (기본 1시간)
     SESSION_GUEST_TTL_MINS: int = 30  # 게스트 세션 만료 시간 (분)
 
+    # Realtime Conversation Configuration
+    REALTIME_IDLE_TIMEOUT_MINS: float = 3  # 무입력 시 OpenAI 연결 일시 중단 기준 (분, 0이면 비활성화)
+
+    # Realtime Gateway (WebSocket 릴레이 전용 프로세스, python -m app.gateway)
+    GATEWAY_HOST: str = "0.0.0.0"
+    GATEWAY_PORT: int = 8090
+    # SO_REUSEPORT로 같은 포트를 공유하는 워커 프로세스 수
+    # 시나리오 재개 체크포인트는 워커 메모리에 있으므로 2 이상이면 resumeToken 재접속이 다른 워커로 가서 실패할 수 있음
+    GATEWAY_WORKERS: int = 1
+    GATEWAY_DRAIN_TIMEOUT_SEC: float = 300  # 종료 신호 후 진행 중인 대화를 기다리는 최대 시간
+
     # Database
     # 1. 로컬 개발/테스트용: SQLite 사용 (기본값)
     # 2. 배포용: config.sh 및 5-setup_services.sh에서 주입된 환경변수를 통해 PostgreSQL 사용
@@ -1,3 +1,6 @@
+import time
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -23,6 +26,49 @@ engine = create_async_engine(
     pool_timeout=30
 )
 
+
+
+class PoolMetrics:
+    """
+    [Pool Metrics] 커넥션 풀 체크아웃/체크인 통계
+    WebSocket 세션이 대화 내내 커넥션을 점유하지 않는지(checked_out이 0으로 돌아오는지) 확인하는 용도
+    """
+    def __init__(self):
+        self.checked_out = 0        # 현재 사용 중인 커넥션 수
+        self.peak_checked_out = 0   # 최대 동시 사용 수
+        self.total_checkouts = 0
+        self.total_hold_ms = 0.0
+        self.max_hold_ms = 0.0
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checkout_at"] = time.perf_counter()
+        self.checked_out += 1
+        self.total_checkouts += 1
+        self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def on_checkin(self, dbapi_connection, connection_record):
+        checkout_at = connection_record.info.pop("checkout_at", None)
+        if checkout_at is None:
+            return
+        self.checked_out -= 1
+        hold_ms = (time.perf_counter() - checkout_at) * 1000
+        self.total_hold_ms += hold_ms
+        self.max_hold_ms = max(self.max_hold_ms, hold_ms)
+
+    def snapshot(self) -> dict:
+        return {
+            "checked_out": self.checked_out,
+            "peak_checked_out": self.peak_checked_out,
+            "total_checkouts": self.total_checkouts,
+            "avg_hold_ms": round(self.total_hold_ms / self.total_checkouts, 1) if self.total_checkouts else 0.0,
+            "max_hold_ms": round(self.max_hold_ms, 1),
+        }
+
+
+pool_metrics = PoolMetrics()
+event.listen(engine.sync_engine, "checkout", pool_metrics.on_checkout)
+event.listen(engine.sync_engine, "checkin", pool_metrics.on_checkin)
+
 AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -0,0 +1,4 @@
+"""
+[Realtime Gateway] 대화/시나리오 WebSocket 릴레이 전용 프로세스
+REST API와 이벤트 루프를 나누어 오디오 트래픽만 따로 확장합니다. (실행: python -m app.gateway)
+"""
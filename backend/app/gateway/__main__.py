@@ -0,0 +1,4 @@
+from app.gateway.server import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from sqlalchemy.future import select
+
+from app.api.v1 import chat as chat_api
+from app.api.v1 import scenario as scenario_api
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, pool_metrics
+from app.db.models import ScenarioDefinition
+from app.gateway.state import GatewayConnectionMiddleware, GatewayState, gateway_state
+from scenario.providers import close_scenario_runtime, start_scenario_runtime
+
+# API 서버와 같은 경로를 사용하므로 로드밸런서에서 /ws/ 경로만 게이트웨이로 라우팅하면 됩니다
+WEBSOCKET_ROUTES = (
+    ("/chat/ws/chat/{session_id}", chat_api.websocket_chat),
+    ("/chat/ws/guest-chat/{session_id}", chat_api.websocket_guest_chat),
+    ("/scenarios/ws/scenario", scenario_api.websocket_scenario),
+    ("/scenarios/ws/guest-scenario", scenario_api.websocket_guest_scenario),
+)
+
+
+def create_gateway_app(state: GatewayState = gateway_state) -> FastAPI:
+    """
+    [Realtime Gateway] WebSocket 릴레이 + 헬스체크/메트릭만 노출하는 앱
+    - 테이블 생성/세션 정리 루프는 API 서버 담당 (게이트웨이는 릴레이만 수행)
+    - 종료 시 진행 중인 연결이 끝날 때까지 기다린 뒤(server.py의 드레인) 공용 런타임을 닫음
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # 시나리오 공용 런타임은 즉시 준비하고, 고정 문구 TTS 합성만 백그라운드로 수행
+        async with AsyncSessionLocal() as db:
+            definitions = (await db.execute(select(ScenarioDefinition))).scalars().all()
+        runtime = await start_scenario_runtime(prewarm=False, catalog=definitions)
+        prewarm_task = asyncio.create_task(runtime.prewarm()) if runtime else None
+        lag_task = asyncio.create_task(state.watch_loop_lag())
+        app.state.scenario_runtime = runtime
+        state.ready = runtime is not None
+        yield
+        state.begin_drain()
+        lag_task.cancel()
+        if prewarm_task:
+            prewarm_task.cancel()
+        app.state.scenario_runtime = None
+        await close_scenario_runtime()
+
+    app = FastAPI(title=f"{settings.PROJECT_NAME} Realtime Gateway", lifespan=lifespan)
+    for path, endpoint in WEBSOCKET_ROUTES:
+        app.add_api_websocket_route(f"{settings.API_V1_STR}{path}", endpoint)
+    app.add_middleware(GatewayConnectionMiddleware, state=state)
+
+    @app.get("/health")
+    def health():
+        # liveness: 프로세스가 응답하면 OK (드레인 중에도 200)
+        return {"status": "ok", "pid": os.getpid()}
+
+    @app.get("/ready")
+    def ready():
+        # readiness: 런타임 준비 완료 + 드레인 전일 때만 200
+        body = {"ready": state.ready, "draining": state.draining, "pid": os.getpid()}
+        return JSONResponse(body, status_code=200 if state.ready else 503)
+
+    @app.get("/metrics")
+    def metrics():
+        payload = {"pid": os.getpid(), "gateway": state.snapshot(), "db_pool": pool_metrics.snapshot()}
+        runtime = getattr(app.state, "scenario_runtime", None)
+        if runtime is not None:
+            payload["scenario"] = {
+                "session_pool": runtime.session_pool.stats(),
+                "tts_cache": runtime.tts_cache.stats(),
+                "checkpoints": runtime.checkpoints.stats(),
+                "background": runtime.background.stats(),
+            }
+        return payload
+
+    return app
@@ -0,0 +1,161 @@
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import signal
+import socket
+import time
+from typing import Optional
+
+import uvicorn
+
+from app.core.config import settings
+from app.gateway.state import gateway_state
+
+logger = logging.getLogger(__name__)
+
+LISTEN_BACKLOG = 2048
+RESTART_BACKOFF_SEC = 1.0
+
+
+def bind_reuseport_socket(host: str, port: int) -> socket.socket:
+    """
+    [SO_REUSEPORT] 워커마다 같은 포트에 리스닝 소켓을 따로 열고, 커널이 새 연결을 워커에 분배
+    (한 워커가 바빠도 accept 큐를 공유하지 않으므로 다른 워커의 오디오 릴레이가 밀리지 않음)
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(LISTEN_BACKLOG)
+    sock.setblocking(False)
+    return sock
+
+
+class DrainingServer(uvicorn.Server):
+    """
+    [Graceful Drain] 첫 종료 신호: readiness를 내리고 신규 WebSocket을 거부한 뒤
+    진행 중인 대화가 끝나거나 drain_timeout_sec가 지나면 종료. 두 번째 신호는 즉시 종료.
+    """
+
+    def __init__(self, config: uvicorn.Config, drain_timeout_sec: float):
+        super().__init__(config)
+        self.drain_timeout_sec = drain_timeout_sec
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._drain_requested = False
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def serve(self, sockets=None) -> None:
+        self._loop = asyncio.get_running_loop()
+        await super().serve(sockets=sockets)
+
+    def handle_exit(self, sig, frame) -> None:
+        if self._drain_requested or self._loop is None:
+            super().handle_exit(sig, frame)
+            return
+        self._drain_requested = True
+        self._loop.call_soon_threadsafe(self._start_drain)
+
+    def _start_drain(self) -> None:
+        self._drain_task = asyncio.ensure_future(self._drain())
+
+    async def _drain(self) -> None:
+        gateway_state.begin_drain()
+        started = time.perf_counter()
+        logger.info("Gateway draining: %s active connections", gateway_state.active_total)
+        drained = await gateway_state.wait_idle(self.drain_timeout_sec)
+        logger.info(
+            "Gateway drain %s after %.1fs (%s still active)",
+            "finished" if drained else "timed out",
+            time.perf_counter() - started,
+            gateway_state.active_total,
+        )
+        self.should_exit = True
+
+
+def run_worker(host: str, port: int, drain_timeout_sec: float, reuse_port: bool) -> None:
+    from app.gateway.app import create_gateway_app
+
+    config = uvicorn.Config(create_gateway_app(), host=host, port=port, ws="websockets", lifespan="on")
+    server = DrainingServer(config, drain_timeout_sec=drain_timeout_sec)
+    sockets = [bind_reuseport_socket(host, port)] if reuse_port else None
+    asyncio.run(server.serve(sockets=sockets))
+
+
+def run_gateway(
+    host: str = settings.GATEWAY_HOST,
+    port: int = settings.GATEWAY_PORT,
+    workers: int = settings.GATEWAY_WORKERS,
+    drain_timeout_sec: float = settings.GATEWAY_DRAIN_TIMEOUT_SEC,
+) -> None:
+    """
+    [Supervisor] 워커 프로세스를 띄우고, 비정상 종료된 워커는 재시작
+    SIGTERM은 모든 워커에 전달해 각자 드레인 후 종료하도록 함
+    (터미널 Ctrl+C의 SIGINT는 프로세스 그룹 전체가 직접 받으므로 다시 전달하지 않음)
+    """
+    reuse_port = hasattr(socket, "SO_REUSEPORT")
+    if workers > 1 and not reuse_port:
+        logger.warning("SO_REUSEPORT unavailable on this platform; running a single gateway worker")
+        workers = 1
+    if workers > 1:
+        logger.warning(
+            "Scenario resume checkpoints are per worker; with %s workers a resumeToken may reach a worker "
+            "that does not know it",
+            workers,
+        )
+    if workers == 1:
+        run_worker(host, port, drain_timeout_sec, reuse_port=False)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    processes: dict[int, multiprocessing.Process] = {}
+    stopping = False
+
+    def start(index: int) -> None:
+        process = context.Process(
+            target=run_worker,
+            args=(host, port, drain_timeout_sec, True),
+            name=f"gateway-worker-{index}",
+        )
+        process.start()
+        processes[index] = process
+
+    def stop(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        if signum != signal.SIGTERM:
+            return
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+
+    for index in range(workers):
+        start(index)
+    logger.info("Realtime gateway on %s:%s with %s workers", host, port, workers)
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while not stopping:
+        time.sleep(RESTART_BACKOFF_SEC)
+        for index, process in list(processes.items()):
+            if not stopping and not process.is_alive():
+                logger.warning("Gateway worker %s exited (code %s); restarting", index, process.exitcode)
+                start(index)
+
+    deadline = time.monotonic() + drain_timeout_sec + 10
+    for process in processes.values():
+        process.join(timeout=max(0.0, deadline - time.monotonic()))
+        if process.is_alive():
+            process.kill()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MaLangEE realtime gateway (chat/scenario WebSocket relays)")
+    parser.add_argument("--host", default=settings.GATEWAY_HOST)
+    parser.add_argument("--port", type=int, default=settings.GATEWAY_PORT)
+    parser.add_argument("--workers", type=int, default=settings.GATEWAY_WORKERS)
+    parser.add_argument("--drain-timeout", type=float, default=settings.GATEWAY_DRAIN_TIMEOUT_SEC)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(name)s: %(message)s")
+    run_gateway(args.host, args.port, args.workers, args.drain_timeout)
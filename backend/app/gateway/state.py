@@ -0,0 +1,123 @@
+import asyncio
+import time
+from typing import Optional
+
+# 드레인 중 새 연결 거부 시 close code (1013: Try Again Later → 클라이언트는 다른 워커로 재접속)
+CLOSE_TRY_AGAIN_LATER = 1013
+LOOP_LAG_INTERVAL_SEC = 0.5
+
+
+class GatewayState:
+    """
+    [Gateway State] 워커 프로세스 단위 연결/드레인 상태와 메트릭
+    - SO_REUSEPORT로 워커마다 커널이 연결을 나눠 주므로 메트릭도 워커(pid)별로 집계됩니다.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.ready = False
+        self.draining = False
+        self.active = {"chat": 0, "scenario": 0}
+        self.accepted = {"chat": 0, "scenario": 0}
+        self.rejected_draining = 0
+        self.closed = 0
+        self.total_connection_sec = 0.0
+        self.max_connection_sec = 0.0
+        self.loop_lag_ms = 0.0
+        self.max_loop_lag_ms = 0.0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def active_total(self) -> int:
+        return sum(self.active.values())
+
+    def begin_drain(self) -> None:
+        # readiness를 먼저 내려 로드밸런서가 새 연결을 보내지 않게 함
+        self.draining = True
+        self.ready = False
+
+    def open_connection(self, kind: str) -> bool:
+        if self.draining:
+            self.rejected_draining += 1
+            return False
+        self.active[kind] += 1
+        self.accepted[kind] += 1
+        self._idle.clear()
+        return True
+
+    def close_connection(self, kind: str, duration_sec: float) -> None:
+        self.active[kind] -= 1
+        self.closed += 1
+        self.total_connection_sec += duration_sec
+        self.max_connection_sec = max(self.max_connection_sec, duration_sec)
+        if self.active_total == 0:
+            self._idle.set()
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """진행 중인 연결이 모두 끝나면 True, 타임아웃이면 False"""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def watch_loop_lag(self, interval_sec: float = LOOP_LAG_INTERVAL_SEC) -> None:
+        # 오디오 릴레이 지연의 원인이 되는 이벤트 루프 정지 시간 측정
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(interval_sec)
+            self.loop_lag_ms = max(0.0, (loop.time() - started - interval_sec) * 1000)
+            self.max_loop_lag_ms = max(self.max_loop_lag_ms, self.loop_lag_ms)
+
+    def snapshot(self) -> dict:
+        return {
+            "ready": self.ready,
+            "draining": self.draining,
+            "uptime_sec": round(time.time() - self.started_at, 1),
+            "active": dict(self.active),
+            "accepted": dict(self.accepted),
+            "rejected_draining": self.rejected_draining,
+            "closed": self.closed,
+            "avg_connection_sec": round(self.total_connection_sec / self.closed, 1) if self.closed else 0.0,
+            "max_connection_sec": round(self.max_connection_sec, 1),
+            "loop_lag_ms": round(self.loop_lag_ms, 1),
+            "max_loop_lag_ms": round(self.max_loop_lag_ms, 1),
+        }
+
+
+def connection_kind(path: str) -> Optional[str]:
+    if "/ws/chat/" in path or "/ws/guest-chat/" in path:
+        return "chat"
+    if path.endswith("/ws/scenario") or path.endswith("/ws/guest-scenario"):
+        return "scenario"
+    return None
+
+
+class GatewayConnectionMiddleware:
+    """
+    [Gateway Middleware] WebSocket 연결 수 추적 및 드레인 중 신규 연결 거부 (순수 ASGI)
+    """
+
+    def __init__(self, app, state: GatewayState):
+        self.app = app
+        self.state = state
+
+    async def __call__(self, scope, receive, send):
+        kind = connection_kind(scope.get("path", "")) if scope["type"] == "websocket" else None
+        if kind is None:
+            await self.app(scope, receive, send)
+            return
+        if not self.state.open_connection(kind):
+            await receive()  # websocket.connect
+            await send({"type": "websocket.close", "code": CLOSE_TRY_AGAIN_LATER, "reason": "Gateway draining"})
+            return
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.state.close_connection(kind, time.perf_counter() - started)
+
+
+gateway_state = GatewayState()
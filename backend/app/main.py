@@ -3,11 +3,13 @@ import asyncio
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.future import select
 from app.core.config import settings
 from app.api.api import api_router
-from app.db.database import engine
-from app.db.models import Base
+from app.db.database import AsyncSessionLocal, engine, pool_metrics
+from app.db.models import Base, ScenarioDefinition
 from app.services.session_cleanup import run_cleanup_loop
+from scenario.providers import close_scenario_runtime, start_scenario_runtime
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -16,14 +18,21 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
     stop_event = asyncio.Event()
     cleanup_task = asyncio.create_task(run_cleanup_loop(stop_event))
+    # 시나리오 공용 설정/클라이언트 준비 및 고정 문구 TTS 미리 합성 (API 키가 없으면 건너뜀)
+    # 카탈로그(ScenarioDefinition) 값은 시나리오 추출 fast-path 인덱스로 사용
+    async with AsyncSessionLocal() as db:
+        definitions = (await db.execute(select(ScenarioDefinition))).scalars().all()
+    prewarm_task = asyncio.create_task(start_scenario_runtime(catalog=definitions))
     yield
     # Shutdown
     stop_event.set()
+    prewarm_task.cancel()
     cleanup_task.cancel()
     try:
         await cleanup_task
     except asyncio.CancelledError:
         pass
+    await close_scenario_runtime()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -47,3 +56,8 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 @app.get("/")
 def root():
     return {"message": "Welcome to MaLangEE Backend API"}
+
+@app.get("/health")
+def health():
+    # db_pool: 커넥션 풀 점유 현황 (WebSocket 대화 중에도 checked_out이 0으로 돌아오는지 확인)
+    return {"status": "ok", "db_pool": pool_metrics.snapshot()}
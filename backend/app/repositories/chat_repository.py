@@ -186,6 +186,20 @@ class ChatRepository:
             return True
         return False
 
+    async def update_session_title(self, session_id: str, title: str) -> bool:
+        """
+        세션 제목을 갱신합니다. (시나리오 완료 후 백그라운드에서 생성된 제목 반영)
+        """
+        stmt = select(ConversationSession).where(ConversationSession.session_id == session_id)
+        result = await self.db.execute(stmt)
+        session = result.scalars().first()
+
+        if session:
+            session.title = title
+            await self.db.commit()
+            return True
+        return False
+
     async def get_scenario_definition(self, scenario_id: str):
         """
         시나리오 정의를 조회합니다.
@@ -194,24 +208,17 @@ class ChatRepository:
         result = await self.db.execute(stmt)
         return result.scalars().first()
 
-    async def update_preferences(self, session_id: str, voice: Optional[str], show_text: Optional[bool]) -> bool:
+    async def apply_preferences(self, session: ConversationSession, voice: Optional[str], show_text: Optional[bool]) -> None:
         """
-        사용자 선호 설정(보이스, 자막)을 업데이트합니다.
+        이미 조회한 세션 객체에 사용자 선호 설정(보이스, 자막)을 반영하고 저장합니다.
+        (세션을 다시 SELECT하지 않음)
         """
-        stmt = select(ConversationSession).where(ConversationSession.session_id == session_id)
-        result = await self.db.execute(stmt)
-        session = result.scalars().first()
-        
-        if session:
-            if voice is not None:
-                session.voice = voice
-            if show_text is not None:
-                session.show_text = show_text
-            
-            await self.db.commit()
-            return True
-        return False
-        
+        if voice is not None:
+            session.voice = voice
+        if show_text is not None:
+            session.show_text = show_text
+        await self.db.commit()
+
     async def get_messages_by_session(self, session_id: str):
         """세션의 모든 메시지를 조회합니다 (ID 포함)."""
         stmt = select(ChatMessage).where(ChatMessage.session_id == session_id).order_by(ChatMessage.timestamp.asc())
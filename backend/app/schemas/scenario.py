@@ -20,3 +20,15 @@ class ScenarioResponse(ScenarioBase):
     
     class Config:
         from_attributes = True
+
+
+class TextScenarioTurnRequest(BaseModel):
+    text: str
+
+
+class TextScenarioTurnResponse(BaseModel):
+    token: str
+    message: str
+    completed: bool = False
+    session_id: Optional[str] = None
+    scenario: dict = {}
@@ -1,8 +1,11 @@
 import sys
 import asyncio
-from typing import Any, Dict, List, Optional
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Union
 
 from app.core.config import settings
+from app.db.database import AsyncSessionLocal
 from app.db.models import ConversationSession, User
 from app.repositories.chat_repository import ChatRepository
 from app.schemas.chat import SessionCreate, SessionResponse, SessionSummary, SessionStartRequest
@@ -12,14 +15,31 @@ from realtime_conversation.connection_handler import ConnectionHandler
 from realtime_conversation.session_manager import SessionManager
 from realtime_hint.hint_service import generate_hints
 from sqlalchemy.future import select
-from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class RealtimeSessionRejected(NamedTuple):
+    """[Bootstrap] 세션 검증 실패 시 WebSocket 종료 코드/사유 (커넥션 반환 후 종료하기 위해 값으로 전달)"""
+    code: int
+    reason: str
 
 
 class ChatService:
-    def __init__(self, chat_repo: ChatRepository):
+    def __init__(self, chat_repo: Optional[ChatRepository] = None, session_factory=AsyncSessionLocal):
+        # chat_repo: HTTP 요청 범위(get_db) 세션. WebSocket 세션에서는 None (session_factory로 짧게 열고 닫음)
         self.chat_repo = chat_repo
+        self.session_factory = session_factory
         self.session_manager = SessionManager()
 
+    @asynccontextmanager
+    async def _unit_of_work(self) -> AsyncIterator[ChatRepository]:
+        """
+        [Unit of Work] 작업 단위로 DB 세션을 열고 닫습니다.
+        장시간 유지되는 WebSocket 대화 동안 커넥션 풀을 점유하지 않도록
+        부트스트랩/저장/피드백 단계마다 짧은 세션을 사용합니다.
+        """
+        async with self.session_factory() as db:
+            yield ChatRepository(db)
+
     async def save_chat_log(self, session_data: SessionCreate, user_id: int = None) -> ConversationSession:
         return await self.chat_repo.create_session_log(session_data, user_id)
 
@@ -138,13 +158,14 @@ class ChatService:
 
         return history_messages
 
-    async def start_ai_session(self, websocket: WebSocket, user_id: Optional[int], session_id: str = None, voice: str = None, show_text: bool = None):
+    async def start_ai_session(self, websocket: WebSocket, user_id: Optional[int], session_id: str = None, voice: str = None, show_text: bool = None, events: str = None):
         """
         AI와의 실시간 대화 세션을 시작합니다.
         - OpenAI API Key 로드
-        - [New] 사용자 선호 설정(보이스, 자막) 선 저장
-        - 최신 세션 정보 및 히스토리 조회
-        - ConnectionHandler 시작
+        - [Bootstrap] OpenAI 소켓 사전 연결과 DB 작업을 병렬 수행
+        - 최신 세션 정보 및 히스토리 조회 + 사용자 선호 설정(보이스, 자막) 저장
+        - ConnectionHandler 시작 (세션 설정/히스토리 주입은 데이터 준비 후)
+        - events: 클라이언트가 구독할 이벤트 클래스 ("audio,captions,debug", 없으면 show_text 기준)
         """
         print(f"[DEBUG] start_ai_session called. session_id={session_id}, user_id={user_id}")
         # 1. OpenAI API Key 확인
@@ -155,20 +176,115 @@ class ChatService:
             await websocket.close(code=1008, reason="Server configuration error")
             return
 
-        # 2. 사용자 선호 설정 선 저장 (DB First)
-        # 파라미터가 들어온 경우에만 업데이트를 수행합니다.
-        if session_id and (voice is not None or show_text is not None):
-            await self.chat_repo.update_preferences(session_id, voice, show_text)
+        if not ConnectionHandler:
+            await websocket.close(code=1011, reason="Module error")
+            return
+
+        # 2. [Bootstrap] 핸들러(세션 설정 준비) 생성 후 OpenAI 소켓 연결을 DB 작업과 병렬로 시작
+        #    인증된 소켓만 사전 연결 (비회원은 임의 session_id만으로 유료 핸드셰이크를 유발할 수 있으므로 세션 확인 후 연결)
+        bootstrap_started = time.perf_counter()
+        handler = ConnectionHandler(
+            websocket, api_key, session_id=session_id,
+            idle_timeout_sec=settings.REALTIME_IDLE_TIMEOUT_MINS * 60,
+            events=events,
+        )
+        prewarm_task = None
+        if user_id is not None:
+            prewarm_task = asyncio.create_task(self._measure_ms(handler.prewarm_openai()))
+
+        # 3. 최신 세션 정보 및 히스토리 조회 (+ 사용자 선호 설정 저장)
+        db_started = time.perf_counter()
+        try:
+            session_payload = await self._load_realtime_session(user_id, session_id, voice, show_text)
+        except Exception:
+            await self._abort_bootstrap(handler, prewarm_task)
+            raise
+        if isinstance(session_payload, RealtimeSessionRejected):
+            # 세션 없음/권한 없음 (DB 커넥션을 반환한 뒤에 WebSocket 종료)
+            await self._abort_bootstrap(handler, prewarm_task)
+            await websocket.close(code=session_payload.code, reason=session_payload.reason)
+            return
+        db_ms = (time.perf_counter() - db_started) * 1000
+
+        # 4. 데이터 반영 후 사전 연결 완료 대기
+        handler.apply_session_data(**session_payload)
+        upstream_ms = await prewarm_task if prewarm_task else 0.0
+        total_ms = (time.perf_counter() - bootstrap_started) * 1000
+        bootstrap_metrics = {
+            "db_ms": round(db_ms, 1),
+            "upstream_connect_ms": round(upstream_ms, 1),
+            "total_ms": round(total_ms, 1),
+            "prewarmed": prewarm_task is not None,
+            # 기존 순차 실행 대비 절약 시간 (DB + 연결 - 실제 소요)
+            "saved_ms": round(max(0.0, db_ms + upstream_ms - total_ms), 1),
+        }
+        handler.tracker.record_metric("bootstrap", bootstrap_metrics)
+        print(f"[Bootstrap] session={session_id} {bootstrap_metrics}")
+
+        # 5. ConnectionHandler 시작 ([Manager] 세션 등록)
+        if session_id:
+            self.session_manager.add_session(session_id, handler)
+
+        try:
+            report = await handler.start()
+
+            # 6. 세션 종료 후 리포트 저장 (Auto-Save)
+            # user_id가 없어도(Guest/Demo) 저장합니다. (DB에는 user_id=NULL로 저장됨)
+            if report:
+                try:
+                    session_data = SessionCreate(**report)
+                    async with self._unit_of_work() as repo:
+                        await repo.create_session_log(session_data, user_id)
+                    print(f"Session {session_data.session_id} saved (User: {user_id})")
+                    
+                    # [Real-time Analytics Trigger]
+                    # 세션 종료 즉시 분석을 수행합니다.
+                    try:
+                        from app.analytics.processor import AnalyticsProcessor
+                        async with self.session_factory() as db:
+                            processor = AnalyticsProcessor(db)
+                            await processor.process_session_analytics(session_data.session_id)
+                        print(f"Real-time analytics completed for {session_data.session_id}")
+                        
+                        # [New] Feedback Generation (After DB Save)
+                        # DB에 저장된 메시지 ID를 기반으로 피드백을 생성하고 업데이트합니다.
+                        # 이번 세션에서 추가된 메시지 수만큼만 피드백 대상에 포함시킵니다.
+                        new_message_count = len(session_data.messages)
+                        await self.generate_and_save_feedback(session_data.session_id, new_message_count)
+                            
+                    except Exception as e:
+                        print(f"Real-time analytics/feedback failed: {e}")
+
+                except Exception as e:
+                    print(f"Failed to auto-save session log: {e}")
+        finally:
+            # [Manager] 세션 해제 (항상 보장)
+            if session_id:
+                self.session_manager.remove_session(session_id)
+
+    async def _load_realtime_session(self, user_id: Optional[int], session_id: Optional[str], voice: Optional[str], show_text: Optional[bool]) -> Union[Dict[str, Any], RealtimeSessionRejected]:
+        """
+        [Bootstrap] 짧은 DB 세션으로 실시간 대화 세션 데이터를 조회합니다.
+        조회가 끝나면 커넥션을 바로 반환하므로 대화 중에는 커넥션을 점유하지 않습니다.
+        """
+        async with self._unit_of_work() as repo:
+            return await self._read_realtime_session(repo, user_id, session_id, voice, show_text)
 
-        # 3. 최신 세션 정보 및 히스토리 조회
+    async def _read_realtime_session(self, repo: ChatRepository, user_id: Optional[int], session_id: Optional[str], voice: Optional[str], show_text: Optional[bool]) -> Union[Dict[str, Any], RealtimeSessionRejected]:
+        """
+        [Bootstrap] 실시간 대화에 필요한 세션 데이터(히스토리, 컨텍스트, 보이스)를 조회합니다.
+        세션이 없거나 접근 권한이 없으면 RealtimeSessionRejected를 반환합니다. (WebSocket 종료는 호출자가 수행)
+        """
         history_messages = []
         conversation_context = None
         voice_config = None  # DB에서 가져온 보이스 설정
+        scenario_id = None  # 카탈로그 시나리오 ID (첫 인사 캐시 키)
+        show_text_config = show_text  # 자막 설정 (이벤트 구독 기본값)
 
         if session_id:
             # DB에서 최신 세션 정보 조회
             # user_id 필터 없이 조회 후, 로직에서 소유권 검증 수행
-            session_obj = await self.chat_repo.get_session_by_id(session_id)
+            session_obj = await repo.get_session_by_id(session_id)
 
             if not session_obj:
                 print(f"Session {session_id} not found via get_session_by_id.")
@@ -176,7 +292,7 @@ class ChatService:
                 # [DEBUG] 혹시 삭제된 세션인지, 아니면 정말 없는지 확인
                 try:
                     stmt = select(ConversationSession).where(ConversationSession.session_id == session_id)
-                    result = await self.chat_repo.db.execute(stmt)
+                    result = await repo.db.execute(stmt)
                     debug_session = result.scalars().first()
 
                     if debug_session:
@@ -186,16 +302,19 @@ class ChatService:
                 except Exception as e:
                     print(f"[DEBUG] DB Check failed: {e}")
 
-                await websocket.close(code=4004, reason="Session not found")
-                return
+                return RealtimeSessionRejected(4004, "Session not found")
 
             # [Security Check] 소유권 검증
             # 세션에 주인이 있는데(owned), 요청자가 주인이 아니거나(mismatch) 비회원(None)인 경우 접근 차단
             if session_obj.user_id is not None:
                 if user_id is None or session_obj.user_id != user_id:
                     print(f"Unauthorized access attempt to session {session_id} by user {user_id}")
-                    await websocket.close(code=4003, reason="Unauthorized access to this session")
-                    return
+                    return RealtimeSessionRejected(4003, "Unauthorized access to this session")
+
+            # 사용자 선호 설정 저장 (조회한 세션에 바로 반영하여 추가 SELECT 생략)
+            # 파라미터가 들어온 경우에만 업데이트를 수행합니다.
+            if voice is not None or show_text is not None:
+                await repo.apply_preferences(session_obj, voice, show_text)
 
             # [New] 시나리오 컨텍스트 추출
             conversation_context = {
@@ -205,6 +324,9 @@ class ChatService:
                 "goal": session_obj.scenario_goal,
             }
 
+            scenario_id = session_obj.scenario_id
+            show_text_config = session_obj.show_text
+
             # [New] 저장된 Voice 설정 추출
             if session_obj.voice:
                 voice_config = session_obj.voice
@@ -214,73 +336,49 @@ class ChatService:
                 for msg in session_obj.messages:
                     history_messages.append({"role": msg.role, "content": msg.content})
 
-        # 4. ConnectionHandler 시작
-        if ConnectionHandler:
-            # context 및 voice 설정 전달
-            handler = ConnectionHandler(
-                websocket, api_key, history=history_messages, session_id=session_id, context=conversation_context, voice=voice_config  # [New]
-            )
-
-            # [Manager] 세션 등록
-            if session_id:
-                self.session_manager.add_session(session_id, handler)
-
-            try:
-                report = await handler.start()
-
-                # 5. 세션 종료 후 리포트 저장 (Auto-Save)
-                # user_id가 없어도(Guest/Demo) 저장합니다. (DB에는 user_id=NULL로 저장됨)
-                if report:
-                    try:
-                        session_data = SessionCreate(**report)
-                        await self.save_chat_log(session_data, user_id)
-                        print(f"Session {session_data.session_id} saved (User: {user_id})")
-                        
-                        # [Real-time Analytics Trigger]
-                        # 세션 종료 즉시 분석을 수행합니다.
-                        try:
-                            from app.analytics.processor import AnalyticsProcessor
-                            from app.db.database import AsyncSessionLocal
-                            async with AsyncSessionLocal() as db:
-                                processor = AnalyticsProcessor(db)
-                                await processor.process_session_analytics(session_data.session_id)
-                                print(f"Real-time analytics completed for {session_data.session_id}")
-                                
-                                # [New] Feedback Generation (After DB Save)
-                                # DB에 저장된 메시지 ID를 기반으로 피드백을 생성하고 업데이트합니다.
-                                # 이번 세션에서 추가된 메시지 수만큼만 피드백 대상에 포함시킵니다.
-                                new_message_count = len(session_data.messages)
-                                await self.generate_and_save_feedback(db, session_data.session_id, new_message_count)
-                                
-                        except Exception as e:
-                            print(f"Real-time analytics/feedback failed: {e}")
-
-                    except Exception as e:
-                        print(f"Failed to auto-save session log: {e}")
-            finally:
-                # [Manager] 세션 해제 (항상 보장)
-                if session_id:
-                    self.session_manager.remove_session(session_id)
-
-        else:
-            await websocket.close(code=1011, reason="Module error")
-
-    async def generate_and_save_feedback(self, db: AsyncSession, session_id: str, new_message_count: int):
+        return {
+            "history": history_messages,
+            "context": conversation_context,
+            "voice": voice_config,
+            "scenario_id": scenario_id,
+            "show_text": show_text_config,
+        }
+
+    @staticmethod
+    async def _measure_ms(coro) -> float:
+        """코루틴 실행 시간(ms) 측정"""
+        started = time.perf_counter()
+        await coro
+        return (time.perf_counter() - started) * 1000
+
+    @staticmethod
+    async def _abort_bootstrap(handler: ConnectionHandler, prewarm_task: Optional[asyncio.Task]):
+        """[Bootstrap] 검증 실패 시 진행 중인 사전 연결 취소 및 소켓 정리"""
+        if prewarm_task is None:
+            return
+        prewarm_task.cancel()
+        try:
+            await prewarm_task
+        except asyncio.CancelledError:
+            pass
+        await handler.discard_prewarmed()
+
+    async def generate_and_save_feedback(self, session_id: str, new_message_count: int):
         """
         [Feedback Generation]
         DB에 저장된 세션의 메시지를 조회하여 피드백을 생성하고,
         각 메시지(chat_messages)에 피드백(feedback, reason)을 업데이트합니다.
+
+        [Unit of Work] 조회 -> LLM 호출 -> 저장을 분리하여 LLM 호출 동안에는 DB 커넥션을 점유하지 않습니다.
         """
         # [Update] 통합된 generate_feedback 함수 사용
         from conversation_feedback.feedback_service import generate_feedback
         
         print(f"Starting feedback generation for session {session_id} (New messages: {new_message_count})")
         
-        # Temporary Repository instance with the current transaction session
-        repo = ChatRepository(db)
-        
         # 1. Repository를 통해 "모든" 메시지 조회 (Count 체크용)
-        db_messages = await repo.get_messages_by_session(session_id)
+        async with self._unit_of_work() as repo:
+            db_messages = await repo.get_messages_by_session(session_id)
         
         if not db_messages:
             print("No messages found for feedback.")
@@ -318,30 +416,31 @@ class ChatService:
             print("No feedback generated.")
             return
             
-        # 5. Global Feedback & Summary 저장 (Session Level)
-        session = await repo.get_session_by_id(session_id)
-        if session:
-            # 서머리 업데이트 (이번 세션 내용을 반영)
-            if feedback_result.get("scenario_summary"):
-                session.scenario_summary = feedback_result.get("scenario_summary")
-            
-        # 6. Detailed Feedback 저장 (Message Level)
-        feedback_details_list = feedback_result.get("feedback_details", [])
-        
-        if feedback_details_list:
-            update_count = 0
-            for item in feedback_details_list:
-                msg_id = item.get("message_id")
-                feedback_data = {
-                    "reason": item.get("fb_content"),
-                    "feedback": item.get("fb_after")
-                }
+        async with self._unit_of_work() as repo:
+            # 5. Global Feedback & Summary 저장 (Session Level)
+            session = await repo.get_session_by_id(session_id)
+            if session:
+                # 서머리 업데이트 (이번 세션 내용을 반영)
+                if feedback_result.get("scenario_summary"):
+                    session.scenario_summary = feedback_result.get("scenario_summary")
                 
-                await repo.update_message_feedback(msg_id, feedback_data)
-                update_count += 1
-            print(f"Feedback updated for {update_count} messages")
+            # 6. Detailed Feedback 저장 (Message Level)
+            feedback_details_list = feedback_result.get("feedback_details", [])
             
-        await db.commit()
+            if feedback_details_list:
+                update_count = 0
+                for item in feedback_details_list:
+                    msg_id = item.get("message_id")
+                    feedback_data = {
+                        "reason": item.get("fb_content"),
+                        "feedback": item.get("fb_after")
+                    }
+                    
+                    await repo.update_message_feedback(msg_id, feedback_data)
+                    update_count += 1
+                print(f"Feedback updated for {update_count} messages")
+                
+            await repo.db.commit()
         print(f"Feedback generation completed for session {session_id}")
 
     async def generate_hint(self, session_id: str) -> List[str]:
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from app.gateway.state import CLOSE_TRY_AGAIN_LATER, GatewayConnectionMiddleware, GatewayState, connection_kind
+
+
+def _websocket_scope(path: str) -> dict:
+    return {"type": "websocket", "path": path}
+
+
+async def _receive() -> dict:
+    return {"type": "websocket.connect"}
+
+
+def test_connection_kind_by_path() -> None:
+    assert connection_kind("/api/v1/chat/ws/chat/abc") == "chat"
+    assert connection_kind("/api/v1/chat/ws/guest-chat/abc") == "chat"
+    assert connection_kind("/api/v1/scenarios/ws/scenario") == "scenario"
+    assert connection_kind("/api/v1/scenarios/ws/guest-scenario") == "scenario"
+    assert connection_kind("/health") is None
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_active_connections_and_rejects_new_ones() -> None:
+    state = GatewayState()
+    release = asyncio.Event()
+
+    async def relay(scope, receive, send) -> None:
+        await release.wait()
+
+    middleware = GatewayConnectionMiddleware(relay, state)
+    active = asyncio.create_task(middleware(_websocket_scope("/api/v1/scenarios/ws/scenario"), _receive, None))
+    await asyncio.sleep(0)
+    assert state.active == {"chat": 0, "scenario": 1}
+
+    state.begin_drain()
+    assert not state.ready
+    sent = []
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    await middleware(_websocket_scope("/api/v1/chat/ws/chat/abc"), _receive, send)
+    assert sent == [{"type": "websocket.close", "code": CLOSE_TRY_AGAIN_LATER, "reason": "Gateway draining"}]
+    assert state.rejected_draining == 1
+
+    assert not await state.wait_idle(timeout=0.05)
+    release.set()
+    assert await state.wait_idle(timeout=1.0)
+    await active
+    snapshot = state.snapshot()
+    assert snapshot["active"] == {"chat": 0, "scenario": 0}
+    assert snapshot["accepted"] == {"chat": 0, "scenario": 1}
+    assert snapshot["closed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_http_requests_pass_through_untracked() -> None:
+    state = GatewayState()
+    calls = []
+
+    async def app(scope, receive, send) -> None:
+        calls.append(scope["path"])
+
+    state.begin_drain()
+    await GatewayConnectionMiddleware(app, state)({"type": "http", "path": "/metrics"}, _receive, None)
+    assert calls == ["/metrics"]
+    assert state.rejected_draining == 0
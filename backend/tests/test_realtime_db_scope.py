@@ -0,0 +1,98 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+import app.analytics.models  # noqa: F401  (SessionAnalytics 매퍼 등록)
+from app.db.database import engine, AsyncSessionLocal, pool_metrics
+from app.db.models import Base
+from app.repositories.chat_repository import ChatRepository
+from app.schemas.chat import SessionCreate
+from app.core.config import settings
+from app.services.chat_service import ChatService, RealtimeSessionRejected
+from realtime_conversation.connection_handler import ConnectionHandler
+
+
+class _FakeWebSocket:
+    def __init__(self) -> None:
+        self.closed_with = None
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.closed_with = code
+
+
+async def _create_session() -> str:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    now = datetime.now(timezone.utc).isoformat()
+    session_id = str(uuid.uuid4())
+    session_data = SessionCreate(
+        session_id=session_id,
+        title="Pool Test",
+        started_at=now,
+        ended_at=now,
+        total_duration_sec=0.0,
+        user_speech_duration_sec=0.0,
+        messages=[{"role": "user", "content": "Hi", "timestamp": now, "duration_sec": 0.0}],
+        scenario_place="cafe",
+    )
+    async with AsyncSessionLocal() as db:
+        await ChatRepository(db).create_session_log(session_data, user_id=None)
+    return session_id
+
+
+@pytest.mark.asyncio
+async def test_realtime_bootstrap_returns_connection_to_pool() -> None:
+    session_id = await _create_session()
+    service = ChatService(session_factory=AsyncSessionLocal)
+    checked_out_before = pool_metrics.checked_out
+    checkouts_before = pool_metrics.total_checkouts
+
+    payload = await service._load_realtime_session(None, session_id, "shimmer", False)
+
+    assert payload["voice"] == "shimmer"
+    assert payload["show_text"] is False
+    assert payload["history"] == [{"role": "user", "content": "Hi"}]
+    # 조회에는 커넥션을 사용했지만, 대화가 이어지는 동안에는 점유하지 않음
+    assert pool_metrics.total_checkouts > checkouts_before
+    assert pool_metrics.checked_out == checked_out_before
+
+
+@pytest.mark.asyncio
+async def test_missing_session_is_rejected_without_holding_connection() -> None:
+    service = ChatService(session_factory=AsyncSessionLocal)
+    checked_out_before = pool_metrics.checked_out
+
+    payload = await service._load_realtime_session(None, str(uuid.uuid4()), None, None)
+
+    assert payload == RealtimeSessionRejected(4004, "Session not found")
+    assert pool_metrics.checked_out == checked_out_before
+
+
+def test_health_reports_pool_metrics() -> None:
+    from app.main import health
+
+    body = health()
+    assert body["status"] == "ok"
+    assert set(body["db_pool"]) >= {"checked_out", "peak_checked_out", "total_checkouts", "max_hold_ms"}
+
+
+@pytest.mark.asyncio
+async def test_guest_socket_is_not_prewarmed_before_session_check(monkeypatch) -> None:
+    prewarmed = []
+
+    async def fake_prewarm(handler) -> None:
+        prewarmed.append(handler)
+
+    monkeypatch.setattr(ConnectionHandler, "prewarm_openai", fake_prewarm)
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    websocket = _FakeWebSocket()
+
+    await ChatService(session_factory=AsyncSessionLocal).start_ai_session(
+        websocket, user_id=None, session_id=str(uuid.uuid4())
+    )
+
+    # 임의 session_id로 접속한 비회원은 OpenAI 핸드셰이크 없이 종료
+    assert prewarmed == []
+    assert websocket.closed_with == 4004
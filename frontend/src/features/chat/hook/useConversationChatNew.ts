@@ -89,6 +89,11 @@ export function useConversationChatNew(sessionId: string, voice: string = "alloy
           debugLog("[WebSocket] Sent session.update with voice:", voice);
           break;
 
+        case "ping":
+          // 서버 링크 품질 측정 (RTT)
+          base.wsRef.current?.send(JSON.stringify({ type: "pong", id: data.id }));
+          break;
+
         case "session.created":
         case "ready":
         case "connected":
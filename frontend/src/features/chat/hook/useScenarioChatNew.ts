@@ -71,6 +71,11 @@ export function useScenarioChatNew() {
           }
           break;
 
+        case "ping":
+          // 서버 링크 품질 측정 (RTT)
+          base.wsRef.current?.send(JSON.stringify({ type: "pong", id: data.id }));
+          break;
+
         case "response.audio.delta":
           base.playAudioChunk(data.delta, data.sample_rate || 24000);
           break;